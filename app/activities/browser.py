@@ -34,10 +34,15 @@ rather than duplicating the values.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
 import time
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 from playwright.async_api import (
@@ -135,7 +140,10 @@ class BrowserActivities:
 
         This is the explicit first activity in the scrape workflow. It creates
         an isolated browser context for this workflow, ensuring concurrent
-        workflows never interfere with each other. Subsequent activities call
+        workflows never interfere with each other. When a previous workflow on
+        this worker saved HN's storage state (see
+        ``constants.BROWSER_STORAGE_STATE_PATH``), the context is created warm
+        with those cookies and localStorage. Subsequent activities call
         `_ensure_browser()` internally, but calling this first makes the
         browser initialisation step visible in the workflow history and
         Temporal UI.
@@ -193,6 +201,9 @@ class BrowserActivities:
           1. The page title contains "Hacker News".
           2. At least one story row (CSS selector `.athing`) is present.
 
+        On success the context's storage state is saved so that contexts
+        created by later workflows start warm.
+
         `_ensure_browser()` is called at entry so the activity is resilient to
         worker restart between `start_playwright_activity` and this step — the
         browser context is transparently recreated if state was lost.
@@ -350,6 +361,8 @@ class BrowserActivities:
                 f"within timeout: {exc}"
             ) from exc
 
+        await self._save_storage_state(context, log=log)
+
         duration_ms = int((time.monotonic() - started_at) * 1000)
         log.info(
             "navigation.completed",
@@ -1277,14 +1290,34 @@ class BrowserActivities:
             )
             return self._contexts[workflow_id], self._pages[workflow_id]
 
-        # Create new context for this workflow
+        # Create new context for this workflow. When a storage-state file was
+        # saved by an earlier workflow, the context starts with HN's cookies
+        # and localStorage already populated instead of cold.
+        storage_state = self._storage_state_path()
+        warm = storage_state is not None and await asyncio.to_thread(
+            storage_state.is_file
+        )
         try:
-            context = await self._browser.new_context(
-                viewport={
-                    "width": constants.BROWSER_VIEWPORT_WIDTH,
-                    "height": constants.BROWSER_VIEWPORT_HEIGHT,
-                },
-            )
+            context: Optional[BrowserContext] = None
+            if warm and storage_state is not None:
+                try:
+                    context = await self._new_context(
+                        self._browser, storage_state=str(storage_state)
+                    )
+                except PlaywrightError as exc:
+                    # An unreadable state file must not block the workflow:
+                    # drop it so the next navigation saves a fresh one, and
+                    # fall back to a cold context.
+                    log.warning(
+                        "browser.storage_state_load_error",
+                        path=str(storage_state),
+                        error=str(exc),
+                    )
+                    warm = False
+                    with contextlib.suppress(OSError):
+                        await asyncio.to_thread(storage_state.unlink, missing_ok=True)
+            if context is None:
+                context = await self._new_context(self._browser, storage_state=None)
             context.set_default_timeout(constants.BROWSER_TIMEOUT_MS)
 
             page = await context.new_page()
@@ -1305,6 +1338,7 @@ class BrowserActivities:
             "browser.context_created",
             workflow_id=workflow_id,
             total_contexts=len(self._contexts),
+            warm_storage_state=warm,
             viewport_width=constants.BROWSER_VIEWPORT_WIDTH,
             viewport_height=constants.BROWSER_VIEWPORT_HEIGHT,
         )
@@ -1432,6 +1466,93 @@ class BrowserActivities:
         self._browser = None
         self._playwright = None
 
+    @staticmethod
+    async def _new_context(
+        browser: Browser, storage_state: Optional[str]
+    ) -> BrowserContext:
+        """Create a browser context with the configured viewport."""
+        return await browser.new_context(
+            viewport={
+                "width": constants.BROWSER_VIEWPORT_WIDTH,
+                "height": constants.BROWSER_VIEWPORT_HEIGHT,
+            },
+            storage_state=storage_state,
+        )
+
+    @staticmethod
+    def _storage_state_path() -> Optional[Path]:
+        """Return the configured storage-state file path, or None if disabled."""
+        if not constants.BROWSER_STORAGE_STATE_PATH:
+            return None
+        return Path(constants.BROWSER_STORAGE_STATE_PATH)
+
+    @staticmethod
+    def _storage_state_is_fresh(path: Path) -> bool:
+        """Return True if ``path`` exists and is younger than the max age."""
+        try:
+            modified_at = path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - modified_at < constants.BROWSER_STORAGE_STATE_MAX_AGE_S
+
+    @staticmethod
+    def _write_storage_state(path: Path, state: dict[str, Any]) -> None:
+        """Atomically replace ``path`` with ``state`` serialised as JSON.
+
+        The state is written to a temporary file in the same directory and
+        renamed into place, so concurrent readers see either the old file or
+        the new one, never a partial write.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(state, tmp_file)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    async def _save_storage_state(
+        self,
+        context: BrowserContext,
+        log: Optional[structlog.types.FilteringBoundLogger] = None,
+    ) -> None:
+        """Persist the context's cookies and localStorage for later workflows.
+
+        Only writes when the state file is missing or older than
+        ``constants.BROWSER_STORAGE_STATE_MAX_AGE_S``, so concurrent workflows
+        do not rewrite it on every navigation. File I/O runs in a worker
+        thread to keep the event loop free.
+
+        Best-effort: a failure to write the state file only means the next
+        context starts cold, so errors are logged and swallowed.
+
+        Args:
+            context: BrowserContext that has just loaded the HN front page.
+            log: Bound structlog logger. If None, a fresh unbound logger is used.
+        """
+        if log is None:
+            log = structlog.get_logger()
+
+        path = self._storage_state_path()
+        if path is None:
+            return
+
+        try:
+            if await asyncio.to_thread(self._storage_state_is_fresh, path):
+                return
+            state = await context.storage_state()
+            await asyncio.to_thread(self._write_storage_state, path, dict(state))
+        except Exception as exc:  # noqa: BLE001
+            log.warning(
+                "browser.storage_state_save_error",
+                path=str(path),
+                error=str(exc),
+            )
+
     async def _capture_screenshot(
         self,
         page: Page,
@@ -3,6 +3,7 @@
 These activities handle all database writes for the scraping workflow:
     - Creating scrape run records (create_scrape_run_activity)
     - Upserting scraped stories (upsert_stories_activity)
+    - Patching top comments onto stored stories (update_story_comments_activity)
     - Updating scrape run final status (update_scrape_run_activity)
 
 Each activity:
@@ -214,6 +215,91 @@ class PersistenceActivities:
 
         return upserted_count
 
+    @activity.defn(name="update_story_comments_activity")
+    async def update_story_comments_activity(
+        self, comment_map: dict[str, Optional[str]]
+    ) -> int:
+        """Set the top comment on stories that were already upserted.
+
+        The workflow persists stories page-by-page before their comments are
+        scraped, then sends only an ``hn_id`` → ``top_comment`` map here. The
+        repository applies it in a single ``UPDATE ... FROM (VALUES ...)``.
+
+        Idempotent: re-running with the same map produces the same DB state.
+
+        Args:
+            comment_map: ``hn_id`` → ``top_comment``. None comments leave the
+                stored value unchanged.
+
+        Returns:
+            Number of story rows updated.
+
+        Raises:
+            ApplicationError(non_retryable=False): PersistenceTransientError.
+            ApplicationError(non_retryable=True): PersistenceValidationError.
+        """
+        info = activity.info()
+        log = structlog.get_logger().bind(
+            service=constants.SERVICE_NAME,
+            activity_name=info.activity_type,
+            workflow_id=info.workflow_id,
+            run_id=info.workflow_run_id,
+            activity_id=info.activity_id,
+        )
+
+        log.info(
+            "persistence.update_comments.starting",
+            status="starting",
+            comments_count=len(comment_map),
+        )
+        started_at = time.monotonic()
+
+        try:
+            updated_count = await self._story_repo.update_top_comments(
+                comment_map=comment_map
+            )
+        except PersistenceValidationError as exc:
+            log.error(
+                "persistence.update_comments.validation_error",
+                status="failed",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            raise ApplicationError(str(exc), non_retryable=True) from exc
+        except PersistenceTransientError as exc:
+            log.warning(
+                "persistence.update_comments.transient_error",
+                status="retrying",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            raise
+        except sqlalchemy.exc.SQLAlchemyError as exc:
+            domain_exc = _classify_sqlalchemy_error(exc)
+            log.warning(
+                "persistence.update_comments.db_error",
+                status=(
+                    "retrying"
+                    if isinstance(domain_exc, PersistenceTransientError)
+                    else "failed"
+                ),
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            if isinstance(domain_exc, PersistenceValidationError):
+                raise ApplicationError(str(domain_exc), non_retryable=True) from exc
+            raise domain_exc from exc
+
+        duration_ms = int((time.monotonic() - started_at) * 1000)
+        log.info(
+            "persistence.update_comments.completed",
+            status="completed",
+            updated_count=updated_count,
+            duration_ms=duration_ms,
+        )
+
+        return updated_count
+
     @activity.defn(name="update_scrape_run_activity")
     async def update_scrape_run_activity(
         self,
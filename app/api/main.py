@@ -17,6 +17,7 @@ from typing import AsyncGenerator
 import structlog
 from fastapi import FastAPI
 from temporalio.client import Client
+from temporalio.contrib.pydantic import pydantic_data_converter
 
 from app.api.routers import runs_router, scrape_router, stories_router
 from app.config import constants
@@ -86,6 +87,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         client = await Client.connect(
             constants.TEMPORAL_ADDRESS,
             namespace=constants.TEMPORAL_NAMESPACE,
+            # Must match the worker's converter so ScrapeRun results decode
+            # back into models rather than plain dicts.
+            data_converter=pydantic_data_converter,
         )
         app.state.temporal_client = client
 
@@ -95,3 +95,17 @@ BROWSER_VIEWPORT_HEIGHT: int = int(os.environ.get("BROWSER_VIEWPORT_HEIGHT", "80
 
 # Directory for failure screenshots. Must be writable by the worker process.
 BROWSER_SCREENSHOT_DIR: str = os.environ.get("BROWSER_SCREENSHOT_DIR", "/tmp")
+
+# Path of the Playwright storage-state file (cookies + localStorage) shared by
+# every browser context on this worker. The state is saved after a successful
+# HN front-page navigation and loaded into each new context so subsequent
+# workflows start warm. Set to an empty string to disable.
+BROWSER_STORAGE_STATE_PATH: str = os.environ.get(
+    "BROWSER_STORAGE_STATE_PATH", "/var/cache/hn-scraper/state.json"
+)
+
+# Seconds before a saved storage-state file is considered stale and rewritten.
+# Until then, navigations reuse the file as-is instead of saving it again.
+BROWSER_STORAGE_STATE_MAX_AGE_S: int = int(
+    os.environ.get("BROWSER_STORAGE_STATE_MAX_AGE_S", "3600")
+)
@@ -11,6 +11,11 @@ Pydantic v2 is used for:
 All models are frozen (immutable). Temporal workflows must never mutate
 objects from workflow history; frozen models enforce this at the type level.
 
+All models also forbid extra fields (``extra="forbid"``). Unknown keys in a
+payload — a typo, or a field from a newer schema — raise a ValidationError
+instead of being silently dropped, so a mismatch between producer and
+consumer surfaces at the boundary.
+
 Temporal serialisation notes:
   - UUID fields serialise to/from strings automatically (Pydantic v2 default)
   - datetime fields serialise to ISO-8601 strings automatically
@@ -75,7 +80,7 @@ class Story(BaseModel):
     URL; the HN item URL can be used as a fallback by the scraping activity.
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     hn_id: str = Field(
@@ -130,7 +135,7 @@ class ScrapeRun(BaseModel):
     enabling correlation between Temporal UI/logs and the database record.
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     workflow_id: str = Field(
@@ -17,7 +17,7 @@ What repositories do NOT do:
     get_connection(), which uses engine.begin()).
 
 Classes:
-    StoryRepository      — upsert_many(), list()
+    StoryRepository      — upsert_many(), update_top_comments(), list()
     ScrapeRunRepository  — create(), update(), list(), get_by_workflow_id()
 """
 
@@ -121,7 +121,12 @@ class StoryRepository:
                 "points": stmt.excluded.points,
                 "author": stmt.excluded.author,
                 "comments_count": stmt.excluded.comments_count,
-                "top_comment": stmt.excluded.top_comment,
+                # Stories are persisted before their comment is scraped; a NULL
+                # here must not wipe a comment stored by an earlier run. The
+                # comment is patched separately by update_top_comments().
+                "top_comment": sa.func.coalesce(
+                    stmt.excluded.top_comment, stories_table.c.top_comment
+                ),
                 "scraped_at": stmt.excluded.scraped_at,
                 # created_at is intentionally excluded: preserves first-seen time.
                 # id is intentionally excluded: preserves original UUID.
@@ -133,6 +138,56 @@ class StoryRepository:
 
         return result.rowcount
 
+    async def update_top_comments(
+        self, comment_map: dict[str, Optional[str]]
+    ) -> int:
+        """Set ``top_comment`` for many stories in a single statement.
+
+        Issues one ``UPDATE stories SET top_comment = v.top_comment FROM
+        (VALUES ...) AS v(hn_id, top_comment) WHERE stories.hn_id = v.hn_id``
+        so the whole batch is one round-trip and one transaction.
+
+        Idempotent: applying the same batch twice yields the same DB state.
+
+        Entries whose comment is None (no comment found, or the scrape
+        failed) are skipped, so they never wipe a comment stored by an
+        earlier run — the same rule ``upsert_many`` applies.
+
+        Args:
+            comment_map: ``hn_id`` → ``top_comment``. ``top_comment`` may be
+                None for stories without comments.
+
+        Returns:
+            Number of story rows updated.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: Propagated to caller.
+        """
+        rows = [
+            (hn_id, top_comment)
+            for hn_id, top_comment in comment_map.items()
+            if top_comment is not None
+        ]
+        if not rows:
+            return 0
+
+        values = sa.values(
+            sa.column("hn_id", sa.VARCHAR(64)),
+            sa.column("top_comment", sa.TEXT),
+            name="v",
+        ).data(rows)
+
+        stmt = (
+            sa.update(stories_table)
+            .where(stories_table.c.hn_id == values.c.hn_id)
+            .values(top_comment=values.c.top_comment)
+        )
+
+        async with get_connection() as conn:
+            result = await conn.execute(stmt)
+
+        return result.rowcount
+
     async def list(
         self,
         limit: Optional[int] = None,
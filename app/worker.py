@@ -26,13 +26,28 @@ def _configure_logging() -> None:
     Sets up stdlib logging at the configured level so that third-party
     libraries (Temporal SDK, uvicorn, asyncpg) emit through the same pipeline
     as application code. All output is serialised as JSON to stdout.
+
+    Stdlib records are rendered by structlog's ProcessorFormatter so that
+    fields passed via ``extra=`` (as the workflow logger does) appear as
+    top-level JSON keys instead of being dropped.
     """
     log_level = getattr(logging, constants.LOG_LEVEL.upper(), logging.INFO)
 
-    logging.basicConfig(
-        format="%(message)s",
-        level=log_level,
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=[
+                structlog.stdlib.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.stdlib.ExtraAdder(),
+            ],
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(),
+            ],
+        )
     )
+    logging.basicConfig(handlers=[handler], level=log_level)
 
     structlog.configure(
         processors=[
@@ -42,7 +57,7 @@ def _configure_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
@@ -92,6 +107,7 @@ async def main() -> None:
             # Database persistence activities
             persistence_activities.create_scrape_run_activity,
             persistence_activities.upsert_stories_activity,
+            persistence_activities.update_story_comments_activity,
             persistence_activities.update_scrape_run_activity,
         ],
     )
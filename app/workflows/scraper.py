@@ -6,9 +6,9 @@ orchestrates the end-to-end scraping process:
     1. Create scrape run record (database)
     2. Launch browser
     3. Navigate to Hacker News
-    4. Scrape top N stories
+    4. Scrape top N stories, persisting each page as it is scraped
     5. Scrape top comment for each story
-    6. Persist stories (with comments) to database
+    6. Patch top comments onto the persisted stories
     7. Update scrape run status
 
 The workflow is deterministic — all side effects (browser, database, logging)
@@ -17,6 +17,7 @@ are implemented as activities. The workflow only orchestrates.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import Optional
 from uuid import UUID
@@ -44,15 +45,47 @@ with workflow.unsafe.imports_passed_through():
 # Activity execution options for database activities
 # ---------------------------------------------------------------------------
 
+# Short, gentle backoff: DB blips (failover, pool exhaustion) clear in well
+# under a second, and a long tail of waits only delays the run. Bad input
+# will fail the same way on every attempt, so it is not retried at all.
 DB_RETRY_POLICY = RetryPolicy(
     maximum_attempts=3,
-    initial_interval=timedelta(seconds=1),
-    backoff_coefficient=2.0,
-    maximum_interval=timedelta(seconds=10),
+    initial_interval=timedelta(milliseconds=500),
+    backoff_coefficient=1.5,
+    maximum_interval=timedelta(seconds=5),
+    non_retryable_error_types=["ValueError", "ValidationError"],
 )
 
 DB_ACTIVITY_TIMEOUT = timedelta(seconds=30)
 
+# Upper bound on one DB activity including all retries, so a string of slow
+# attempts cannot eat the workflow's execution_timeout before the run can
+# be marked FAILED.
+DB_ACTIVITY_DEADLINE = timedelta(seconds=60)
+
+# Later pages are asked for this many rows beyond the stories still missing.
+# HN's ranking can shift between page loads, so a page may repeat stories
+# already kept from an earlier one; the margin lets dedup refill from the
+# same page instead of paying for another navigation.
+PAGE_DEDUP_MARGIN = 5
+
+# Pages the workflow may visit beyond ceil(top_n / HN_STORIES_PER_PAGE) to
+# make up for repeated stories. Bounds the loop if every page is a repeat.
+MAX_EXTRA_PAGES = 2
+
+# Comments are written to the DB in batches of this size while the comment
+# loop keeps scraping, so DB writes overlap with browser work.
+COMMENT_FLUSH_BATCH_SIZE = 10
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+# Computed once at import rather than on every loop iteration (and every
+# replay). COMMENT_SCRAPE_DELAY_MS is fixed for the life of the worker.
+COMMENT_SCRAPE_DELAY = timedelta(milliseconds=constants.COMMENT_SCRAPE_DELAY_MS)
+
 
 # ---------------------------------------------------------------------------
 # Workflow
@@ -70,10 +103,13 @@ class ScrapeHackerNewsWorkflow:
         1. Create ScrapeRun record (status=PENDING)
         2. Start Playwright browser
         3. Navigate to Hacker News homepage (page 1)
-        4. Scrape stories from current page; if top_n > HN_STORIES_PER_PAGE,
-           navigate to page 2, 3, … and scrape each until top_n is reached
-        5. Upsert stories into Postgres
-        6. Update ScrapeRun (status=COMPLETED, stories_scraped=N)
+        4. Scrape stories from current page and upsert them into Postgres;
+           if top_n > HN_STORIES_PER_PAGE, navigate to page 2, 3, … and
+           repeat until top_n is reached
+        5. Scrape the top comment for each story, writing hn_id → top_comment
+           to the DB in background batches as the loop progresses
+        6. Wait for the last comment batch to be written
+        7. Update ScrapeRun (status=COMPLETED, stories_scraped=N)
 
     On failure:
         - Update ScrapeRun (status=FAILED, error_message=...)
@@ -102,14 +138,17 @@ class ScrapeHackerNewsWorkflow:
         wf_id = workflow.info().workflow_id
         logger = workflow.logger
 
-        logger.info(f"Workflow starting: workflow_id={wf_id}, top_n={top_n}")
+        logger.info(
+            "workflow.starting", extra={"workflow_id": wf_id, "top_n": top_n}
+        )
 
         # Track the scrape run ID so we can update it on success or failure.
         run_id: Optional[UUID] = None
         scrape_run: Optional[ScrapeRun] = None
         # Initialised here so the except handler can always reference it,
         # even when the exception fires before the scraping loop is reached.
-        all_stories: list[Story] = []
+        # Keyed by hn_id so a story HN repeats across pages is kept once.
+        all_stories: dict[str, Story] = {}
 
         try:
             # Wrap entire workflow in try/finally to ensure browser cleanup
@@ -119,20 +158,22 @@ class ScrapeHackerNewsWorkflow:
         finally:
             # Always clean up browser context, even if workflow fails.
             # This prevents memory leaks from accumulating browser contexts.
-            logger.info(f"Cleaning up browser context: workflow_id={wf_id}")
+            logger.info("workflow.cleanup.starting", extra={"workflow_id": wf_id})
             try:
                 await workflow.execute_activity_method(
                     "cleanup_browser_context_activity",
                     start_to_close_timeout=CLEANUP_TIMEOUT,
                     retry_policy=BROWSER_RETRY_POLICY,
                 )
-                logger.info(f"Browser context cleaned up: workflow_id={wf_id}")
+                logger.info(
+                    "workflow.cleanup.completed", extra={"workflow_id": wf_id}
+                )
             except Exception as cleanup_exc:  # noqa: BLE001
                 # Best effort — log cleanup failure but don't mask the
                 # original workflow error (if any).
                 logger.error(
-                    f"Failed to clean up browser context: workflow_id={wf_id}, "
-                    f"error={str(cleanup_exc)}"
+                    "workflow.cleanup.error",
+                    extra={"workflow_id": wf_id, "error": cleanup_exc},
                 )
 
     async def _execute_scrape(
@@ -142,44 +183,59 @@ class ScrapeHackerNewsWorkflow:
         top_n: int,
         run_id: Optional[UUID],
         scrape_run: Optional[ScrapeRun],
-        all_stories: list[Story],
+        all_stories: dict[str, Story],
     ) -> ScrapeRun:
         """Internal method containing the main scrape workflow logic.
 
         Extracted to allow try/finally cleanup in the main run method.
         """
-        # Initialize here so it's available in the except block for salvaging
-        stories_with_comments: list[Story] = []
+        # Initialised here so the except block can report partial progress.
+        # Stories are upserted page-by-page as they are scraped, so
+        # persisted_count always reflects rows already committed.
+        persisted_count = 0
+        comment_map: dict[str, Optional[str]] = {}
 
         try:
             # ---------------------------------------------------------------
             # Step 1: Create scrape run record
             # ---------------------------------------------------------------
-            logger.info(f"Creating scrape run record: workflow_id={wf_id}")
-
-            scrape_run_data = await workflow.execute_activity_method(
-                # Activity method name (stub for now)
+            logger.info("scrape_run.creating", extra={"workflow_id": wf_id})
+
+            # Activities are referenced by name, so result_type tells the
+            # pydantic data converter which model to decode into.
+            #
+            # The scrape-run record activities (create / update) are
+            # single-row writes whose results the workflow needs straight
+            # away, so they run as local activities: the worker executes them
+            # in-process and records only the result, skipping the task-queue
+            # round trip through the server. The same worker registers every
+            # activity, so they are always available locally. Story upserts
+            # and comment patches stay regular activities because they carry
+            # page-sized payloads and comment writes run concurrently in the
+            # background.
+            scrape_run = await workflow.execute_local_activity(
                 "create_scrape_run_activity",
                 args=[wf_id],
+                result_type=ScrapeRun,
                 start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
+                schedule_to_close_timeout=DB_ACTIVITY_DEADLINE,
                 retry_policy=DB_RETRY_POLICY,
             )
-            # Temporal serializes Pydantic models as dicts - reconstruct the object
-            if isinstance(scrape_run_data, dict):
-                scrape_run = ScrapeRun(**scrape_run_data)
-            else:
-                scrape_run = scrape_run_data
             run_id = scrape_run.id
 
             logger.info(
-                f"Scrape run created: workflow_id={wf_id}, run_id={run_id}, "
-                f"status={scrape_run.status.value}"
+                "scrape_run.created",
+                extra={
+                    "workflow_id": wf_id,
+                    "run_id": run_id,
+                    "status": scrape_run.status,
+                },
             )
 
             # ---------------------------------------------------------------
             # Step 2: Start Playwright browser
             # ---------------------------------------------------------------
-            logger.info(f"Starting browser: workflow_id={wf_id}")
+            logger.info("browser.starting", extra={"workflow_id": wf_id})
 
             await workflow.execute_activity_method(
                 "start_playwright_activity",
@@ -187,12 +243,12 @@ class ScrapeHackerNewsWorkflow:
                 retry_policy=BROWSER_RETRY_POLICY,
             )
 
-            logger.info(f"Browser started: workflow_id={wf_id}")
+            logger.info("browser.started", extra={"workflow_id": wf_id})
 
             # ---------------------------------------------------------------
             # Step 3: Navigate to Hacker News
             # ---------------------------------------------------------------
-            logger.info(f"Navigating to Hacker News: workflow_id={wf_id}")
+            logger.info("navigation.starting", extra={"workflow_id": wf_id})
 
             await workflow.execute_activity_method(
                 "navigate_to_hacker_news_activity",
@@ -200,42 +256,55 @@ class ScrapeHackerNewsWorkflow:
                 retry_policy=BROWSER_RETRY_POLICY,
             )
 
-            logger.info(f"Navigation completed: workflow_id={wf_id}")
+            logger.info("navigation.completed", extra={"workflow_id": wf_id})
 
             # ---------------------------------------------------------------
-            # Step 4: Scrape stories (with pagination when top_n > 30)
+            # Step 4: Scrape and persist stories page-by-page
+            # (with pagination when top_n > 30)
             # ---------------------------------------------------------------
-            pages_needed = (top_n + HN_STORIES_PER_PAGE -
-                            1) // HN_STORIES_PER_PAGE
+            pages_needed = -(-top_n // HN_STORIES_PER_PAGE)  # ceil division
             logger.info(
-                f"Scraping stories: workflow_id={wf_id}, top_n={top_n}, "
-                f"pages_needed={pages_needed}"
+                "stories.scraping",
+                extra={
+                    "workflow_id": wf_id,
+                    "top_n": top_n,
+                    "pages_needed": pages_needed,
+                },
             )
 
             # Page 1 is already loaded by navigate_to_hacker_news_activity.
-            raw_page_1_stories = await workflow.execute_activity_method(
-                "scrape_urls_activity",
-                args=[top_n],
-                start_to_close_timeout=SCRAPE_TIMEOUT,
-                retry_policy=BROWSER_RETRY_POLICY,
+            raw_page_1_stories = await self._scrape_current_page(top_n)
+            page_1_stories = self._add_new_stories(
+                all_stories,
+                raw_page_1_stories,
+                top_n,
+            )
+            persisted_count += await self._persist_stories(
+                wf_id, logger, page_1_stories, page_number=1
             )
-            page_1_stories: list[Story] = [
-                Story(**s) if isinstance(s, dict) else s for s in raw_page_1_stories
-            ]
-            all_stories.extend(page_1_stories)
             logger.info(
-                f"Page 1 scraped: workflow_id={wf_id}, "
-                f"stories_on_page={len(page_1_stories)}, "
-                f"total_so_far={len(all_stories)}"
+                "stories.page_scraped",
+                extra={
+                    "workflow_id": wf_id,
+                    "page_number": 1,
+                    "stories_on_page": len(page_1_stories),
+                    "total_so_far": len(all_stories),
+                },
             )
 
-            # Pages 2..N — only executed when top_n > HN_STORIES_PER_PAGE.
-            for page_number in range(2, pages_needed + 1):
-                if len(all_stories) >= top_n:
-                    break
+            # Later pages — only visited while stories are still missing:
+            # when top_n > HN_STORIES_PER_PAGE, or when earlier pages repeated
+            # stories. Stops once top_n is reached, HN runs out of pages, or
+            # the extra-page budget is spent.
+            max_pages = pages_needed + MAX_EXTRA_PAGES
+            page_number = 1
+            while len(all_stories) < top_n and page_number < max_pages:
+                page_number += 1
+                remaining = top_n - len(all_stories)
 
                 logger.info(
-                    f"Navigating to page {page_number}: workflow_id={wf_id}"
+                    "navigation.next_page",
+                    extra={"workflow_id": wf_id, "page_number": page_number},
                 )
                 has_more: bool = await workflow.execute_activity_method(
                     "navigate_to_next_page_activity",
@@ -245,56 +314,91 @@ class ScrapeHackerNewsWorkflow:
                 )
                 if not has_more:
                     logger.info(
-                        f"HN has no more pages, stopping pagination: "
-                        f"workflow_id={wf_id}, last_page={page_number - 1}"
+                        "stories.pagination_exhausted",
+                        extra={"workflow_id": wf_id, "last_page": page_number - 1},
                     )
                     break
 
-                raw_page_stories = await workflow.execute_activity_method(
-                    "scrape_urls_activity",
-                    args=[top_n],
-                    start_to_close_timeout=SCRAPE_TIMEOUT,
-                    retry_policy=BROWSER_RETRY_POLICY,
-                )
-                page_stories: list[Story] = [
-                    Story(**s) if isinstance(s, dict) else s for s in raw_page_stories
-                ]
-
-                if not page_stories:
+                # Ask only for the stories still missing (plus a margin for
+                # repeats) so the activity stops parsing rows once it has
+                # enough.
+                rows = min(remaining + PAGE_DEDUP_MARGIN, HN_STORIES_PER_PAGE)
+                raw_page_stories = await self._scrape_current_page(rows)
+                if not raw_page_stories:
                     logger.info(
-                        f"No stories on page {page_number}, stopping pagination: "
-                        f"workflow_id={wf_id}"
+                        "stories.page_empty",
+                        extra={"workflow_id": wf_id, "page_number": page_number},
                     )
                     break
 
-                all_stories.extend(page_stories)
+                # Only stories not seen on an earlier page are kept and
+                # persisted; surplus beyond top_n is dropped.
+                page_stories = self._add_new_stories(
+                    all_stories,
+                    raw_page_stories,
+                    top_n,
+                )
+                # More repeats than the margin: the page still has unread
+                # rows, so read all of it before moving on to the next page.
+                if (
+                    len(all_stories) < top_n
+                    and len(raw_page_stories) == rows < HN_STORIES_PER_PAGE
+                ):
+                    page_stories += self._add_new_stories(
+                        all_stories,
+                        await self._scrape_current_page(HN_STORIES_PER_PAGE),
+                        top_n,
+                    )
+                persisted_count += await self._persist_stories(
+                    wf_id, logger, page_stories, page_number=page_number
+                )
                 logger.info(
-                    f"Page {page_number} scraped: workflow_id={wf_id}, "
-                    f"stories_on_page={len(page_stories)}, "
-                    f"total_so_far={len(all_stories)}"
+                    "stories.page_scraped",
+                    extra={
+                        "workflow_id": wf_id,
+                        "page_number": page_number,
+                        "stories_on_page": len(page_stories),
+                        "total_so_far": len(all_stories),
+                    },
                 )
 
-            # Truncate to the requested top_n — last page may return surplus.
-            stories: list[Story] = all_stories[:top_n]
+            stories: list[Story] = list(all_stories.values())[:top_n]
             stories_count = len(stories)
             logger.info(
-                f"Stories scraped: workflow_id={wf_id}, stories_count={stories_count}"
+                "stories.scraped",
+                extra={
+                    "workflow_id": wf_id,
+                    "stories_count": stories_count,
+                    "persisted_count": persisted_count,
+                },
             )
 
             # ---------------------------------------------------------------
             # Step 5: Scrape top comment for each story
             # ---------------------------------------------------------------
             logger.info(
-                f"Scraping comments: workflow_id={wf_id}, stories_count={stories_count}"
+                "comments.scraping",
+                extra={"workflow_id": wf_id, "stories_count": stories_count},
             )
 
             comments_scraped = 0
             comments_failed = 0
+            comment_delay = COMMENT_SCRAPE_DELAY
+            # Comments not yet handed to a DB write, and the in-flight writes.
+            # Browser scrapes stay sequential (one page per workflow, plus
+            # rate limiting); only the DB writes run in the background.
+            unflushed: dict[str, Optional[str]] = {}
+            pending_writes: list[workflow.ActivityHandle[int]] = []
 
             for idx, story in enumerate(stories, start=1):
                 logger.info(
-                    f"Scraping comment for story {idx}/{stories_count}: "
-                    f"workflow_id={wf_id}, hn_id={story.hn_id}"
+                    "comment.scraping",
+                    extra={
+                        "workflow_id": wf_id,
+                        "hn_id": story.hn_id,
+                        "index": idx,
+                        "stories_count": stories_count,
+                    },
                 )
 
                 try:
@@ -305,89 +409,112 @@ class ScrapeHackerNewsWorkflow:
                         retry_policy=BROWSER_RETRY_POLICY,
                     )
 
-                    # Enrich story with top comment
-                    enriched_story = story.model_copy(
-                        update={"top_comment": top_comment}
-                    )
-                    stories_with_comments.append(enriched_story)
+                    # Only hn_id → comment crosses the wire to the DB
+                    # activity — the story row itself is already persisted.
+                    comment_map[story.hn_id] = top_comment
 
                     if top_comment:
                         comments_scraped += 1
                         logger.info(
-                            f"Comment scraped: workflow_id={wf_id}, hn_id={story.hn_id}, "
-                            f"comment_length={len(top_comment)}"
+                            "comment.scraped",
+                            extra={
+                                "workflow_id": wf_id,
+                                "hn_id": story.hn_id,
+                                "comment_length": len(top_comment),
+                            },
                         )
                     else:
                         logger.info(
-                            f"No comment found: workflow_id={wf_id}, hn_id={story.hn_id}"
+                            "comment.not_found",
+                            extra={"workflow_id": wf_id, "hn_id": story.hn_id},
                         )
 
                 except Exception as exc:  # noqa: BLE001
                     # Continue on error: log failure, store story with NULL comment
                     comments_failed += 1
                     logger.error(
-                        f"Comment scraping failed: workflow_id={wf_id}, "
-                        f"hn_id={story.hn_id}, error_type={type(exc).__name__}, "
-                        f"error={str(exc)}"
+                        "comment.error",
+                        extra={
+                            "workflow_id": wf_id,
+                            "hn_id": story.hn_id,
+                            "error_type": type(exc).__name__,
+                            "error": exc,
+                        },
                     )
-                    # Store story with NULL comment
-                    enriched_story = story.model_copy(update={"top_comment": None})
-                    stories_with_comments.append(enriched_story)
+                    comment_map[story.hn_id] = None
+
+                unflushed[story.hn_id] = comment_map[story.hn_id]
+                if len(unflushed) >= COMMENT_FLUSH_BATCH_SIZE:
+                    pending_writes.append(self._start_comment_write(unflushed))
+                    unflushed = {}
 
                 # Rate limiting: add delay between comment scrapes
                 # (except after the last story—no need to wait)
                 if idx < stories_count:
-                    delay_seconds = constants.COMMENT_SCRAPE_DELAY_MS / 1000.0
-                    await workflow.sleep(delay_seconds)
+                    await workflow.sleep(comment_delay)
 
             logger.info(
-                f"Comments scraping completed: workflow_id={wf_id}, "
-                f"total={stories_count}, scraped={comments_scraped}, "
-                f"no_comments={stories_count - comments_scraped - comments_failed}, "
-                f"failed={comments_failed}"
+                "comments.scraped",
+                extra={
+                    "workflow_id": wf_id,
+                    "total": stories_count,
+                    "scraped": comments_scraped,
+                    "no_comments": stories_count - comments_scraped - comments_failed,
+                    "failed": comments_failed,
+                },
             )
 
             # ---------------------------------------------------------------
-            # Step 6: Persist stories to database
+            # Step 6: Flush the last comment batch and wait for all writes
             # ---------------------------------------------------------------
+            if unflushed:
+                pending_writes.append(self._start_comment_write(unflushed))
             logger.info(
-                f"Persisting stories: workflow_id={wf_id}, stories_count={stories_count}")
-
-            upserted_count: int = await workflow.execute_activity_method(
-                "upsert_stories_activity",
-                args=[stories_with_comments],  # Now includes top_comment
-                start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
-                retry_policy=DB_RETRY_POLICY,
+                "comments.persisting",
+                extra={
+                    "workflow_id": wf_id,
+                    "comments_count": len(comment_map),
+                    "batches": len(pending_writes),
+                },
             )
 
+            updated_count = sum(await asyncio.gather(*pending_writes))
+
             logger.info(
-                f"Stories persisted: workflow_id={wf_id}, upserted_count={upserted_count}")
+                "comments.persisted",
+                extra={"workflow_id": wf_id, "updated_count": updated_count},
+            )
 
             # ---------------------------------------------------------------
             # Step 7: Update scrape run status to COMPLETED
             # ---------------------------------------------------------------
             logger.info(
-                f"Updating scrape run to COMPLETED: workflow_id={wf_id}")
+                "scrape_run.completing",
+                extra={"workflow_id": wf_id, "run_id": run_id},
+            )
 
-            scrape_run_data = await workflow.execute_activity_method(
+            # Local activity, like create_scrape_run_activity (see Step 1).
+            scrape_run = await workflow.execute_local_activity(
                 "update_scrape_run_activity",
                 args=[
                     run_id,
                     ScrapeRunStatus.COMPLETED.value,
-                    upserted_count,
+                    persisted_count,
                     None,  # error_message
                 ],
+                result_type=ScrapeRun,
                 start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
+                schedule_to_close_timeout=DB_ACTIVITY_DEADLINE,
                 retry_policy=DB_RETRY_POLICY,
             )
-            if isinstance(scrape_run_data, dict):
-                scrape_run = ScrapeRun(**scrape_run_data)
-            else:
-                scrape_run = scrape_run_data
 
             logger.info(
-                f"Workflow completed successfully: workflow_id={wf_id}, run_id={run_id}, "
-                f"stories_scraped={upserted_count}"
+                "workflow.completed",
+                extra={
+                    "workflow_id": wf_id,
+                    "run_id": run_id,
+                    "stories_scraped": persisted_count,
+                },
             )
 
             return scrape_run
@@ -396,75 +523,152 @@ class ScrapeHackerNewsWorkflow:
             # Workflow failed — update scrape run status to FAILED if we
             # have a run_id (i.e., if the run record was created before failure).
             logger.error(
-                f"Workflow failed: workflow_id={wf_id}, run_id={run_id if run_id else None}, "
-                f"error_type={type(exc).__name__}, error={str(exc)}"
+                "workflow.failed",
+                extra={
+                    "workflow_id": wf_id,
+                    "run_id": run_id,
+                    "error_type": type(exc).__name__,
+                    "error": exc,
+                },
             )
 
             if run_id is not None:
-                # Best-effort: persist any stories scraped before the failure
-                # so partial results are not lost.
-                salvaged_count: Optional[int] = None
-
-                # Prefer stories_with_comments if populated (failure during/after
-                # comment scraping), otherwise fall back to all_stories (failure
-                # during story scraping, before comment scraping began).
-                if stories_with_comments:
-                    stories_to_salvage = stories_with_comments
+                # Stories scraped so far are already committed page-by-page.
+                # Best-effort: patch any comments gathered before the failure
+                # so partial results are not lost. This re-sends batches that
+                # were already flushed too, in case one of those writes is what
+                # failed; the update is idempotent.
+                if comment_map:
                     logger.info(
-                        f"Salvaging {len(stories_to_salvage)} stories with comments "
-                        f"before marking run as FAILED: workflow_id={wf_id}"
+                        "comments.salvaging",
+                        extra={
+                            "workflow_id": wf_id,
+                            "comments_count": len(comment_map),
+                        },
                     )
-                elif all_stories:
-                    stories_to_salvage = all_stories[:top_n]
-                    logger.info(
-                        f"Salvaging {len(stories_to_salvage)} stories (no comments) "
-                        f"before marking run as FAILED: workflow_id={wf_id}"
-                    )
-                else:
-                    stories_to_salvage = []
-
-                if stories_to_salvage:
                     try:
-                        salvaged_count = await workflow.execute_activity_method(
-                            "upsert_stories_activity",
-                            args=[stories_to_salvage],
+                        await workflow.execute_activity_method(
+                            "update_story_comments_activity",
+                            args=[comment_map],
                             start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
+                            schedule_to_close_timeout=DB_ACTIVITY_DEADLINE,
                             retry_policy=DB_RETRY_POLICY,
                         )
-                        logger.info(
-                            f"Salvaged {salvaged_count} stories: workflow_id={wf_id}"
-                        )
                     except Exception as salvage_exc:  # noqa: BLE001
                         # Best effort — don't mask the original error.
                         logger.error(
-                            f"Failed to salvage stories on workflow failure: "
-                            f"workflow_id={wf_id}, error={str(salvage_exc)}"
+                            "comments.salvage_error",
+                            extra={"workflow_id": wf_id, "error": salvage_exc},
                         )
 
                 try:
-                    scrape_run_data = await workflow.execute_activity_method(
+                    # Local activity, like create_scrape_run_activity (Step 1).
+                    scrape_run = await workflow.execute_local_activity(
                         "update_scrape_run_activity",
                         args=[
                             run_id,
                             ScrapeRunStatus.FAILED.value,
-                            # stories_scraped (None if nothing salvaged)
-                            salvaged_count,
+                            # stories_scraped (None if nothing was persisted)
+                            persisted_count or None,
                             str(exc),  # error_message
                         ],
+                        result_type=ScrapeRun,
                         start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
+                        schedule_to_close_timeout=DB_ACTIVITY_DEADLINE,
                         retry_policy=DB_RETRY_POLICY,
                     )
-                    if isinstance(scrape_run_data, dict):
-                        scrape_run = ScrapeRun(**scrape_run_data)
-                    else:
-                        scrape_run = scrape_run_data
                 except Exception as update_exc:  # noqa: BLE001
                     # Best effort — if updating run status fails, log but
                     # don't mask the original error.
                     logger.error(
-                        f"Failed to update scrape run status: workflow_id={wf_id}, "
-                        f"run_id={run_id}, error={str(update_exc)}"
+                        "scrape_run.update_error",
+                        extra={
+                            "workflow_id": wf_id,
+                            "run_id": run_id,
+                            "error": update_exc,
+                        },
                     )
 
             # Re-raise the original exception so Temporal marks workflow as failed.
             raise
+
+    @staticmethod
+    def _add_new_stories(
+        all_stories: dict[str, Story],
+        page_stories: list[Story],
+        top_n: int,
+    ) -> list[Story]:
+        """Merge one page into ``all_stories``, skipping repeated hn_ids.
+
+        HN occasionally shows the same story on two pages when rankings
+        shift between requests. Deduplicating here keeps the comment loop
+        from scraping the same thread twice.
+
+        Returns:
+            The stories from this page that were newly added, in page order.
+        """
+        added: list[Story] = []
+        for story in page_stories:
+            if len(all_stories) >= top_n:
+                break
+            if story.hn_id not in all_stories:
+                all_stories[story.hn_id] = story
+                added.append(story)
+        return added
+
+    @staticmethod
+    async def _scrape_current_page(rows: int) -> list[Story]:
+        """Scrape up to ``rows`` stories from the page the browser is on."""
+        return await workflow.execute_activity(
+            "scrape_urls_activity",
+            args=[rows],
+            result_type=list[Story],
+            start_to_close_timeout=SCRAPE_TIMEOUT,
+            retry_policy=BROWSER_RETRY_POLICY,
+        )
+
+    @staticmethod
+    def _start_comment_write(
+        comment_map: dict[str, Optional[str]],
+    ) -> workflow.ActivityHandle[int]:
+        """Start a background update_story_comments_activity for one batch."""
+        return workflow.start_activity(
+            "update_story_comments_activity",
+            args=[comment_map],
+            result_type=int,
+            start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
+            schedule_to_close_timeout=DB_ACTIVITY_DEADLINE,
+            retry_policy=DB_RETRY_POLICY,
+        )
+
+    async def _persist_stories(
+        self,
+        wf_id: str,
+        logger: workflow.LoggerAdapter,
+        stories: list[Story],
+        page_number: int,
+    ) -> int:
+        """Upsert one page of freshly scraped stories (without comments).
+
+        Returns:
+            Number of rows upserted for this page.
+        """
+        if not stories:
+            return 0
+
+        upserted_count: int = await workflow.execute_activity_method(
+            "upsert_stories_activity",
+            args=[stories],
+            start_to_close_timeout=DB_ACTIVITY_TIMEOUT,
+            schedule_to_close_timeout=DB_ACTIVITY_DEADLINE,
+            retry_policy=DB_RETRY_POLICY,
+        )
+        logger.info(
+            "stories.page_persisted",
+            extra={
+                "workflow_id": wf_id,
+                "page_number": page_number,
+                "upserted_count": upserted_count,
+            },
+        )
+        return upserted_count
@@ -0,0 +1,44 @@
+"""Shared fixtures for the activity tests.
+
+Activities call ``temporalio.activity.info()`` to bind their structured
+logger. Outside a running Temporal activity that call raises, so an autouse
+fixture here installs a stand-in for every test rather than each test
+opening its own ``patch(...)`` block.
+"""
+
+from __future__ import annotations
+
+import functools
+from types import SimpleNamespace
+
+import pytest
+
+from app.activities import persistence
+
+
+@functools.cache
+def _activity_info(activity_type: str = "test_activity") -> SimpleNamespace:
+    """Return the stand-in ``temporalio.activity.Info`` for ``activity_type``.
+
+    Activities only read four attributes from it, so a plain namespace is
+    enough. One instance per activity type is built and then reused.
+    """
+    return SimpleNamespace(
+        activity_type=activity_type,
+        workflow_id="wf-test-001",
+        workflow_run_id="run-test-001",
+        activity_id="act-test-001",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _patch_activity_info(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace ``activity.info`` with ``_activity_info`` for each test.
+
+    ``persistence.activity`` is the ``temporalio.activity`` module itself, so
+    the stub is visible to every activity module. ``monkeypatch`` undoes it
+    when the test ends, so no patched state outlives a test and the suite
+    can be split across pytest-xdist workers freely. Tests that need
+    different info call ``monkeypatch.setattr`` again.
+    """
+    monkeypatch.setattr(persistence.activity, "info", _activity_info)
@@ -20,49 +20,127 @@ Design decisions
   (the name as it exists *inside* the module under test).
 - ``activity.info`` is patched at ``app.activities.browser.activity.info``
   so ``start_playwright_activity`` does not require a live Temporal runtime.
-- ``structlog`` is patched per test-class so log assertions are possible and
-  test output stays clean.
+- ``structlog.get_logger`` is patched to return a mock logger so log
+  assertions are possible and test output stays clean.
 - ``_ensure_browser`` is patched with ``AsyncMock`` when testing
   ``start_playwright_activity`` in isolation (separating activity contract
   from browser lifecycle).
 - All helpers accept an explicit ``log`` parameter, so tests inject a
   ``MagicMock`` logger directly instead of patching structlog globally.
+- ``TestStartPlaywrightActivity``, ``TestEnsureBrowser``,
+  ``TestTeardownSilently`` and ``TestCaptureScreenshot`` share one
+  ``BrowserActivities`` per module; an autouse fixture clears its browser
+  state (``_clear_browser_state``) around every test.
+- The four classes above also share one event loop per class
+  (``loop_scope="class"``); their tests only await directly and leave no
+  background tasks behind.
+- Nothing is shared across modules or processes, so the file runs under
+  pytest-xdist. Fake Playwright stacks (``playwright_stack``) are built per
+  test, never shared. The module is one ``xdist_group`` so that
+  ``--dist loadgroup`` keeps it on a single worker and the module-scoped
+  ``BrowserActivities`` instances are built once.
 """
 
 from __future__ import annotations
 
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, Optional
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from playwright.async_api import Error as PlaywrightError
 from temporalio.exceptions import ApplicationError
 
+import app.activities.browser as browser_module
 from app.activities.browser import BrowserActivities
+from app.config import constants
+from app.config.constants import BROWSER_SCREENSHOT_DIR
 from app.domain.exceptions import BrowserNavigationError, BrowserStartError, ParseError
 from app.domain.models import Story
 
+pytestmark = pytest.mark.xdist_group("browser_activities")
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers / factories
 # ---------------------------------------------------------------------------
 
 
+#: Workflow ID used by ``_make_activity_info`` and the ``_ensure_browser`` tests.
+_WORKFLOW_ID = "wf-test-001"
+
+
+@dataclass(frozen=True, slots=True)
+class FakeActivityInfo:
+    """The subset of ``temporalio.activity.Info`` the browser activities read."""
+
+    activity_type: str
+    workflow_id: str
+    workflow_run_id: str
+    activity_id: str
+
+
+@dataclass(slots=True)
+class FakeAsync:
+    """A bare awaitable stand-in for an ``AsyncMock`` method.
+
+    Counts awaits in ``calls``. ``side_effect`` is raised if it is an
+    exception and called (with no arguments) if it is any other callable.
+    """
+
+    side_effect: BaseException | Callable[[], object] | None = None
+    calls: int = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        self.calls += 1
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if self.side_effect is not None:
+            self.side_effect()
+
+
+@dataclass(slots=True)
+class FakeResource:
+    """A page / context / browser / Playwright runtime as seen by teardown."""
+
+    close: FakeAsync = field(default_factory=FakeAsync)
+    stop: FakeAsync = field(default_factory=FakeAsync)
+
+
+class NoopLog:
+    """A structlog stand-in that discards every event.
+
+    For tests that pass an explicit ``log`` but never inspect it, where a
+    ``MagicMock`` would only record calls nobody reads.
+    """
+
+    @staticmethod
+    def _discard(*args: Any, **kwargs: Any) -> None:
+        return None
+
+    debug = info = warning = error = _discard
+
+
 def _make_activity_info(
     *,
     activity_type: str = "start_playwright_activity",
-    workflow_id: str = "wf-test-001",
+    workflow_id: str = _WORKFLOW_ID,
     workflow_run_id: str = "run-test-001",
     activity_id: str = "act-test-001",
-) -> MagicMock:
-    """Return a mock that looks like a ``temporalio.activity.Info`` object."""
-    info = MagicMock()
-    info.activity_type = activity_type
-    info.workflow_id = workflow_id
-    info.workflow_run_id = workflow_run_id
-    info.activity_id = activity_id
-    return info
+) -> FakeActivityInfo:
+    """Return a stand-in for the ``temporalio.activity.Info`` object."""
+    return FakeActivityInfo(
+        activity_type=activity_type,
+        workflow_id=workflow_id,
+        workflow_run_id=workflow_run_id,
+        activity_id=activity_id,
+    )
 
 
 def _make_mock_logger() -> MagicMock:
@@ -72,7 +150,48 @@ def _make_mock_logger() -> MagicMock:
     return logger
 
 
-def _make_playwright_stack() -> tuple[MagicMock, AsyncMock, AsyncMock, AsyncMock]:
+@pytest.fixture(scope="class")
+def shared_ensure_browser() -> AsyncMock:
+    """One ``_ensure_browser`` stand-in per test class.
+
+    Tests that take it must reset it after use (see ``ensure_browser_mock``).
+    """
+    return AsyncMock()
+
+
+@pytest.fixture(scope="class")
+def shared_log() -> MagicMock:
+    """One mock logger per test class; reset by the class after each test."""
+    return _make_mock_logger()
+
+
+@pytest.fixture(scope="session")
+def noop_log() -> NoopLog:
+    """A logger stub for tests that never inspect log output; it holds no state."""
+    return NoopLog()
+
+
+def _clear_browser_state(activities: BrowserActivities) -> None:
+    """Reset a shared ``BrowserActivities`` to its freshly constructed state.
+
+    Used by the autouse fixtures of classes that share one instance per
+    module, so state set by one test never leaks into the next.
+    """
+    activities._playwright = None
+    activities._browser = None
+    activities._contexts.clear()
+    activities._pages.clear()
+
+
+#: A start-up failure that is *not* a missing binary (→ retryable BrowserStartError).
+#: Shared by the generic-failure tests instead of building one per test.
+_GENERIC_START_EXC = Exception("unexpected runtime failure")
+
+#: (async_playwright() return value, Playwright, Browser, BrowserContext, Page)
+_PlaywrightStack = tuple[MagicMock, AsyncMock, AsyncMock, AsyncMock, AsyncMock]
+
+
+def _make_playwright_stack() -> _PlaywrightStack:
     """Build a fully wired fake Playwright stack for _ensure_browser tests.
 
     Returns
@@ -80,19 +199,22 @@ def _make_playwright_stack() -> tuple[MagicMock, AsyncMock, AsyncMock, AsyncMock
     (mock_ap_cm, mock_pw, mock_browser, mock_context, mock_page)
     where ``mock_ap_cm`` is the object returned by ``async_playwright()``.
     """
-    mock_page: AsyncMock = AsyncMock()
+    mock_page = AsyncMock()
     mock_page.set_default_timeout = MagicMock()  # synchronous call
 
-    mock_context: AsyncMock = AsyncMock()
+    mock_context = AsyncMock()
     mock_context.set_default_timeout = MagicMock()  # synchronous call
     mock_context.new_page = AsyncMock(return_value=mock_page)
 
-    mock_browser: AsyncMock = AsyncMock()
+    mock_browser = AsyncMock()
     mock_browser.is_connected = MagicMock(return_value=True)
     mock_browser.new_context = AsyncMock(return_value=mock_context)
 
-    mock_pw: AsyncMock = AsyncMock()
-    mock_pw.chromium.launch = AsyncMock(return_value=mock_browser)
+    # chromium is a plain namespace: only .launch is ever used.
+    mock_pw = AsyncMock()
+    mock_pw.chromium = SimpleNamespace(
+        launch=AsyncMock(return_value=mock_browser)
+    )
 
     # async_playwright() returns a context-manager-like object whose .start()
     # is the async entry point used in the production code.
@@ -102,215 +224,205 @@ def _make_playwright_stack() -> tuple[MagicMock, AsyncMock, AsyncMock, AsyncMock
     return mock_ap_cm, mock_pw, mock_browser, mock_context, mock_page
 
 
+@pytest.fixture()
+def playwright_stack() -> _PlaywrightStack:
+    """A freshly built fake Playwright stack.
+
+    Built per test: every mock in the stack records calls and may carry a
+    side effect, so sharing any part of it would couple tests to run order.
+    """
+    return _make_playwright_stack()
+
+
 # ===========================================================================
 # TestStartPlaywrightActivity
 # ===========================================================================
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestStartPlaywrightActivity:
     """Tests for ``BrowserActivities.start_playwright_activity``.
 
-    ``_ensure_browser`` is patched with an ``AsyncMock`` in every test so
-    that the activity's contract (error handling, return value, logging) is
-    verified in isolation from the browser lifecycle.
+    ``_ensure_browser`` is replaced by ``ensure_browser_mock`` in every test
+    so that the activity's contract (error handling, return value, logging)
+    is verified in isolation from the browser lifecycle. One ``AsyncMock`` is
+    shared across the class and reset after each test; tests configure its
+    ``side_effect`` as needed.
+
+    ``activity.info`` and ``structlog.get_logger`` are replaced by the autouse
+    ``_patch_browser_module`` fixture; tests that assert on log output
+    request the ``mock_logger`` it installs.
     """
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def activities(self) -> BrowserActivities:
         return BrowserActivities()
 
-    @pytest.fixture()
-    def mock_info(self) -> MagicMock:
+    @pytest.fixture(scope="module")
+    def mock_info(self) -> FakeActivityInfo:
         return _make_activity_info()
 
+    @pytest.fixture(autouse=True)
+    def _reset_browser_state(self, activities: BrowserActivities) -> None:
+        _clear_browser_state(activities)
+
+    @pytest.fixture()
+    def mock_logger(self) -> MagicMock:
+        return _make_mock_logger()
+
+    @pytest.fixture(autouse=True)
+    def _patch_browser_module(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_info: FakeActivityInfo,
+        mock_logger: MagicMock,
+    ) -> None:
+        monkeypatch.setattr(browser_module.activity, "info", lambda: mock_info)
+        monkeypatch.setattr(
+            browser_module.structlog, "get_logger", lambda *_, **__: mock_logger
+        )
+
+    @pytest.fixture()
+    def ensure_browser_mock(
+        self,
+        activities: BrowserActivities,
+        monkeypatch: pytest.MonkeyPatch,
+        shared_ensure_browser: AsyncMock,
+    ) -> Iterator[AsyncMock]:
+        monkeypatch.setattr(activities, "_ensure_browser", shared_ensure_browser)
+        yield shared_ensure_browser
+        shared_ensure_browser.reset_mock(side_effect=True)
+
     # ------------------------------------------------------------------
     # Success path
     # ------------------------------------------------------------------
 
     async def test_returns_true_on_success(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, ensure_browser_mock: AsyncMock
     ) -> None:
         """Activity returns ``True`` when _ensure_browser succeeds."""
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
-        ):
-            result = await activities.start_playwright_activity()
+        result = await activities.start_playwright_activity()
 
         assert result is True
 
     async def test_calls_ensure_browser_exactly_once(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, ensure_browser_mock: AsyncMock
     ) -> None:
         """Activity delegates browser initialisation to _ensure_browser once."""
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch.object(
-                activities, "_ensure_browser", new_callable=AsyncMock
-            ) as mock_ensure,
-        ):
-            await activities.start_playwright_activity()
+        await activities.start_playwright_activity()
 
-        mock_ensure.assert_awaited_once()
+        ensure_browser_mock.assert_awaited_once()
 
     async def test_logs_starting_and_completed_on_success(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self,
+        activities: BrowserActivities,
+        ensure_browser_mock: AsyncMock,
+        mock_logger: MagicMock,
     ) -> None:
         """Activity emits 'starting' then 'completed' log events on success."""
-        mock_logger = _make_mock_logger()
+        await activities.start_playwright_activity()
 
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
-            patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
-        ):
-            mock_structlog.get_logger.return_value = mock_logger
-            await activities.start_playwright_activity()
-
-        log_calls = [c.args[0] for c in mock_logger.info.call_args_list]
-        assert "browser_activity.starting" in log_calls
-        assert "browser_activity.completed" in log_calls
+        mock_logger.info.assert_any_call("browser_activity.starting", status=ANY)
+        mock_logger.info.assert_any_call(
+            "browser_activity.completed", status=ANY, duration_ms=ANY
+        )
 
     # ------------------------------------------------------------------
     # ApplicationError (non-retryable) path
     # ------------------------------------------------------------------
 
     async def test_reraises_application_error_without_wrapping(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, ensure_browser_mock: AsyncMock
     ) -> None:
         """Non-retryable ApplicationError from _ensure_browser propagates as-is."""
         original_exc = ApplicationError(
             "Playwright binary not found", non_retryable=True
         )
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch.object(
-                activities,
-                "_ensure_browser",
-                new_callable=AsyncMock,
-                side_effect=original_exc,
-            ),
-        ):
-            with pytest.raises(ApplicationError) as exc_info:
-                await activities.start_playwright_activity()
+        ensure_browser_mock.side_effect = original_exc
+
+        with pytest.raises(ApplicationError) as exc_info:
+            await activities.start_playwright_activity()
 
         # Must be the exact same instance — no rewrapping.
         assert exc_info.value is original_exc
         assert exc_info.value.non_retryable is True
 
     async def test_application_error_does_not_log_failed(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self,
+        activities: BrowserActivities,
+        ensure_browser_mock: AsyncMock,
+        mock_logger: MagicMock,
     ) -> None:
         """ApplicationError is not logged as a failure (it propagates immediately)."""
-        mock_logger = _make_mock_logger()
         original_exc = ApplicationError("binary missing", non_retryable=True)
+        ensure_browser_mock.side_effect = original_exc
 
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
-            patch.object(
-                activities,
-                "_ensure_browser",
-                new_callable=AsyncMock,
-                side_effect=original_exc,
-            ),
-        ):
-            mock_structlog.get_logger.return_value = mock_logger
-            with pytest.raises(ApplicationError):
-                await activities.start_playwright_activity()
+        with pytest.raises(ApplicationError):
+            await activities.start_playwright_activity()
 
-        logged_events = [c.args[0] for c in mock_logger.error.call_args_list]
-        assert "browser_activity.failed" not in logged_events
+        assert not any(
+            c.args[0] == "browser_activity.failed"
+            for c in mock_logger.error.mock_calls
+        )
 
     # ------------------------------------------------------------------
     # BrowserStartError (retryable) path
     # ------------------------------------------------------------------
 
     async def test_reraises_browser_start_error(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, ensure_browser_mock: AsyncMock
     ) -> None:
         """BrowserStartError propagates as a retryable domain exception."""
         original_exc = BrowserStartError("Chromium failed to start")
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch.object(
-                activities,
-                "_ensure_browser",
-                new_callable=AsyncMock,
-                side_effect=original_exc,
-            ),
-        ):
-            with pytest.raises(BrowserStartError) as exc_info:
-                await activities.start_playwright_activity()
+        ensure_browser_mock.side_effect = original_exc
+
+        with pytest.raises(BrowserStartError) as exc_info:
+            await activities.start_playwright_activity()
 
         assert exc_info.value is original_exc
 
     async def test_browser_start_error_logs_failed_event(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self,
+        activities: BrowserActivities,
+        ensure_browser_mock: AsyncMock,
+        mock_logger: MagicMock,
     ) -> None:
         """BrowserStartError causes a 'failed' log event with the error message."""
-        mock_logger = _make_mock_logger()
+        ensure_browser_mock.side_effect = BrowserStartError("launch error")
 
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
-            patch.object(
-                activities,
-                "_ensure_browser",
-                new_callable=AsyncMock,
-                side_effect=BrowserStartError("launch error"),
-            ),
-        ):
-            mock_structlog.get_logger.return_value = mock_logger
-            with pytest.raises(BrowserStartError):
-                await activities.start_playwright_activity()
+        with pytest.raises(BrowserStartError):
+            await activities.start_playwright_activity()
 
         logged_events = [c.args[0] for c in mock_logger.error.call_args_list]
         assert "browser_activity.failed" in logged_events
 
     async def test_browser_start_error_log_includes_error_string(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self,
+        activities: BrowserActivities,
+        ensure_browser_mock: AsyncMock,
+        mock_logger: MagicMock,
     ) -> None:
         """The failed log includes the exception message as the 'error' kwarg."""
-        mock_logger = _make_mock_logger()
         error_message = "unique-chromium-error-xyz"
+        ensure_browser_mock.side_effect = BrowserStartError(error_message)
 
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
-            patch.object(
-                activities,
-                "_ensure_browser",
-                new_callable=AsyncMock,
-                side_effect=BrowserStartError(error_message),
-            ),
-        ):
-            mock_structlog.get_logger.return_value = mock_logger
-            with pytest.raises(BrowserStartError):
-                await activities.start_playwright_activity()
+        with pytest.raises(BrowserStartError):
+            await activities.start_playwright_activity()
 
         error_call = mock_logger.error.call_args
         assert error_call.kwargs.get("error") == error_message
 
     async def test_browser_start_error_log_includes_duration_ms(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self,
+        activities: BrowserActivities,
+        ensure_browser_mock: AsyncMock,
+        mock_logger: MagicMock,
     ) -> None:
         """The failed log includes a non-negative 'duration_ms' kwarg."""
-        mock_logger = _make_mock_logger()
+        ensure_browser_mock.side_effect = BrowserStartError("err")
 
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
-            patch.object(
-                activities,
-                "_ensure_browser",
-                new_callable=AsyncMock,
-                side_effect=BrowserStartError("err"),
-            ),
-        ):
-            mock_structlog.get_logger.return_value = mock_logger
-            with pytest.raises(BrowserStartError):
-                await activities.start_playwright_activity()
+        with pytest.raises(BrowserStartError):
+            await activities.start_playwright_activity()
 
         error_call = mock_logger.error.call_args
         duration_ms = error_call.kwargs.get("duration_ms")
@@ -322,18 +434,14 @@ class TestStartPlaywrightActivity:
     # ------------------------------------------------------------------
 
     async def test_logger_bound_with_activity_context_fields(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self,
+        activities: BrowserActivities,
+        ensure_browser_mock: AsyncMock,
+        mock_info: FakeActivityInfo,
+        mock_logger: MagicMock,
     ) -> None:
         """Logger is bound with service, activity_name, workflow_id, run_id, activity_id."""
-        mock_logger = _make_mock_logger()
-
-        with (
-            patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
-            patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
-        ):
-            mock_structlog.get_logger.return_value = mock_logger
-            await activities.start_playwright_activity()
+        await activities.start_playwright_activity()
 
         bind_kwargs: dict[str, Any] = mock_logger.bind.call_args.kwargs
         assert bind_kwargs["workflow_id"] == mock_info.workflow_id
@@ -364,7 +472,7 @@ class TestNavigateToHackerNewsActivity:
         return BrowserActivities()
 
     @pytest.fixture()
-    def mock_info(self) -> MagicMock:
+    def mock_info(self) -> FakeActivityInfo:
         return _make_activity_info(
             activity_type="navigate_to_hacker_news_activity"
         )
@@ -388,7 +496,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_returns_true_on_success(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity returns ``True`` when all navigation steps succeed."""
@@ -405,7 +513,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_calls_ensure_browser_exactly_once(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity delegates browser initialisation to _ensure_browser exactly once."""
@@ -424,7 +532,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_logs_starting_event(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity emits a 'navigation.starting' log event before navigating."""
@@ -433,10 +541,11 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.navigate_to_hacker_news_activity()
 
         log_calls = [c.args[0] for c in mock_logger.info.call_args_list]
@@ -445,7 +554,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_logs_completed_event_on_success(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity emits a 'navigation.completed' log event on success."""
@@ -454,10 +563,11 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.navigate_to_hacker_news_activity()
 
         log_calls = [c.args[0] for c in mock_logger.info.call_args_list]
@@ -466,12 +576,10 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_called_with_hn_base_url(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """page.goto() is called with the configured HN_BASE_URL."""
-        from app.config import constants
-
         activities._page = mock_page
 
         with (
@@ -485,7 +593,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_called_with_domcontentloaded(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """page.goto() uses wait_until='domcontentloaded'."""
@@ -502,12 +610,10 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_called_with_configured_timeout(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """page.goto() uses the BROWSER_TIMEOUT_MS constant for its timeout."""
-        from app.config import constants
-
         activities._page = mock_page
 
         with (
@@ -521,7 +627,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_none_response_from_goto_is_accepted(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """A None response from page.goto() (e.g. same-document nav) does not raise."""
         page = AsyncMock()
@@ -541,7 +647,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_wait_for_selector_uses_athing_selector(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """wait_for_selector is called with '.athing' to verify story rows exist."""
@@ -558,7 +664,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_wait_for_selector_uses_attached_state(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """wait_for_selector uses state='attached' (DOM presence, not visibility)."""
@@ -575,7 +681,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_title_containing_hacker_news_substring_passes(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """Any title containing the substring 'Hacker News' passes the title check."""
         response = MagicMock()
@@ -601,7 +707,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_logger_bound_with_activity_context_fields(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Logger is bound with workflow_id, run_id, activity_id, activity_name."""
@@ -610,10 +716,11 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.navigate_to_hacker_news_activity()
 
         bind_kwargs: dict[str, Any] = mock_logger.bind.call_args.kwargs
@@ -629,7 +736,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_reraises_application_error_from_ensure_browser(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """Non-retryable ApplicationError from _ensure_browser propagates as-is."""
         original_exc = ApplicationError(
@@ -654,7 +761,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_application_error_does_not_log_navigation_failed(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """ApplicationError is not logged as navigation.failed (propagates immediately)."""
         mock_logger = _make_mock_logger()
@@ -662,7 +769,9 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(
                 activities,
                 "_ensure_browser",
@@ -670,7 +779,6 @@ class TestNavigateToHackerNewsActivity:
                 side_effect=original_exc,
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(ApplicationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -684,7 +792,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_reraises_browser_start_error_from_ensure_browser(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """BrowserStartError from _ensure_browser propagates as a retryable domain exception."""
         original_exc = BrowserStartError("Chromium failed to start")
@@ -706,14 +814,16 @@ class TestNavigateToHackerNewsActivity:
     async def test_browser_start_error_logs_failed_with_browser_unavailable_reason(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """BrowserStartError causes navigation.failed log with reason='browser_unavailable'."""
         mock_logger = _make_mock_logger()
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(
                 activities,
                 "_ensure_browser",
@@ -721,7 +831,6 @@ class TestNavigateToHackerNewsActivity:
                 side_effect=BrowserStartError("browser down"),
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserStartError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -732,7 +841,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_browser_start_error_log_includes_error_string(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """The navigation.failed log includes the BrowserStartError message as 'error'."""
         mock_logger = _make_mock_logger()
@@ -740,7 +849,9 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(
                 activities,
                 "_ensure_browser",
@@ -748,7 +859,6 @@ class TestNavigateToHackerNewsActivity:
                 side_effect=BrowserStartError(error_message),
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserStartError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -761,7 +871,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_playwright_error_raises_browser_navigation_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """PlaywrightError from page.goto() is mapped to BrowserNavigationError."""
         page = AsyncMock()
@@ -781,7 +891,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_playwright_error_wraps_original_cause(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """BrowserNavigationError raised from goto failure has PlaywrightError as __cause__."""
         original = PlaywrightError("net::ERR_NAME_NOT_RESOLVED")
@@ -804,7 +914,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_playwright_error_logs_failed_with_goto_error_reason(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """PlaywrightError from goto() is logged as navigation.failed with reason='goto_error'."""
         mock_logger = _make_mock_logger()
@@ -814,13 +924,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -831,7 +942,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_goto_playwright_error_captures_screenshot(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """_capture_screenshot is called when page.goto() raises PlaywrightError."""
         page = AsyncMock()
@@ -857,7 +968,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_http_error_response_raises_browser_navigation_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """An HTTP error response (4xx/5xx) raises BrowserNavigationError."""
         response = MagicMock()
@@ -880,7 +991,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_http_error_response_logs_failed_with_http_error_reason(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """An HTTP error response is logged as navigation.failed with reason='http_error'."""
         mock_logger = _make_mock_logger()
@@ -893,13 +1004,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -910,7 +1022,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_http_error_response_log_includes_status_code(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """The navigation.failed log for HTTP errors includes the http_status."""
         mock_logger = _make_mock_logger()
@@ -923,13 +1035,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -938,7 +1051,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_http_error_response_captures_screenshot(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """_capture_screenshot is called on HTTP error response."""
         response = MagicMock()
@@ -963,7 +1076,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_http_ok_response_does_not_raise(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """An HTTP 200 (ok) response passes the status check without raising."""
         response = MagicMock()
@@ -989,7 +1102,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_title_playwright_error_raises_browser_navigation_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """PlaywrightError from page.title() is mapped to BrowserNavigationError."""
         response = MagicMock()
@@ -1016,7 +1129,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_title_playwright_error_logs_failed_with_title_read_error_reason(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """PlaywrightError from title() logged as navigation.failed with reason='title_read_error'."""
         mock_logger = _make_mock_logger()
@@ -1029,13 +1142,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -1044,7 +1158,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_title_playwright_error_captures_screenshot(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """_capture_screenshot is called when page.title() raises PlaywrightError."""
         response = MagicMock()
@@ -1069,7 +1183,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_title_playwright_error_wraps_original_cause(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """BrowserNavigationError from title failure chains the original PlaywrightError."""
         original = PlaywrightError("context destroyed")
@@ -1099,7 +1213,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_unexpected_title_raises_browser_navigation_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """A title not containing 'Hacker News' raises BrowserNavigationError."""
         response = MagicMock()
@@ -1122,7 +1236,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_unexpected_title_logs_failed_with_unexpected_page_reason(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """Unexpected title logged as navigation.failed with reason='unexpected_page'."""
         mock_logger = _make_mock_logger()
@@ -1135,13 +1249,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -1150,7 +1265,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_unexpected_title_log_includes_page_title(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """The navigation.failed log for unexpected title includes the actual page_title."""
         mock_logger = _make_mock_logger()
@@ -1164,13 +1279,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -1179,7 +1295,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_unexpected_title_captures_screenshot(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """_capture_screenshot is called when the page title is unexpected."""
         response = MagicMock()
@@ -1208,7 +1324,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_wait_for_selector_playwright_error_raises_browser_navigation_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """PlaywrightError from wait_for_selector() is mapped to BrowserNavigationError."""
         response = MagicMock()
@@ -1236,7 +1352,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_wait_for_selector_logs_failed_with_no_stories_found_reason(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """wait_for_selector failure logged as navigation.failed with reason='no_stories_found'."""
         mock_logger = _make_mock_logger()
@@ -1250,13 +1366,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -1265,7 +1382,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_wait_for_selector_captures_screenshot(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """_capture_screenshot is called when wait_for_selector() raises PlaywrightError."""
         response = MagicMock()
@@ -1293,7 +1410,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_wait_for_selector_wraps_original_cause(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """BrowserNavigationError from wait_for_selector chains the original PlaywrightError."""
         original = PlaywrightError("selector timeout")
@@ -1324,11 +1441,9 @@ class TestNavigateToHackerNewsActivity:
     async def test_failure_log_includes_screenshot_path_when_captured(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """When _capture_screenshot returns a path, it appears as screenshot_path in the log."""
-        from pathlib import Path
-
         mock_logger = _make_mock_logger()
         fake_path = Path(
             "/tmp/hn_scraper_navigate_to_hacker_news_activity_wf-001_123.png"
@@ -1343,13 +1458,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=fake_path
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -1358,7 +1474,7 @@ class TestNavigateToHackerNewsActivity:
     async def test_failure_log_screenshot_path_is_none_when_capture_fails(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """When _capture_screenshot returns None, screenshot_path in the log is None."""
         mock_logger = _make_mock_logger()
@@ -1372,13 +1488,14 @@ class TestNavigateToHackerNewsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError):
                 await activities.navigate_to_hacker_news_activity()
 
@@ -1390,17 +1507,28 @@ class TestNavigateToHackerNewsActivity:
 # ===========================================================================
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestEnsureBrowser:
     """Tests for ``BrowserActivities._ensure_browser``.
 
-    ``async_playwright`` is patched at the module level. Each test builds its
-    own fake Playwright stack via ``_make_playwright_stack``.
+    ``async_playwright`` is replaced on the module via ``monkeypatch``. Tests
+    that need a fake Playwright stack take the ``playwright_stack`` fixture.
     """
 
-    @pytest.fixture()
+    #: async_playwright().start() errors that mean the browser binary is missing.
+    BINARY_MISSING_MESSAGES = [
+        "executable not found on PATH",
+        "Playwright binary NOT FOUND",
+    ]
+
+    @pytest.fixture(scope="module")
     def activities(self) -> BrowserActivities:
         return BrowserActivities()
 
+    @pytest.fixture(autouse=True)
+    def _reset_browser_state(self, activities: BrowserActivities) -> None:
+        _clear_browser_state(activities)
+
     @pytest.fixture()
     def log(self) -> MagicMock:
         return _make_mock_logger()
@@ -1410,20 +1538,30 @@ class TestEnsureBrowser:
     # ------------------------------------------------------------------
 
     async def test_fast_path_returns_immediately_when_connected(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """No re-launch when _browser is set and is_connected() is True."""
+        """No re-launch when the browser is connected and the context exists."""
         connected_browser = MagicMock()
         connected_browser.is_connected.return_value = True
         activities._browser = connected_browser
+        activities._contexts[_WORKFLOW_ID] = MagicMock()
+        activities._pages[_WORKFLOW_ID] = MagicMock()
+
+        mock_ap = MagicMock()
+        monkeypatch.setattr(browser_module, "async_playwright", mock_ap)
 
-        with patch("app.activities.browser.async_playwright") as mock_ap:
-            await activities._ensure_browser(log=log)
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         mock_ap.assert_not_called()
 
     async def test_fast_path_does_not_alter_existing_state(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Existing browser/context/page references are preserved on fast path."""
         mock_browser = MagicMock()
@@ -1432,89 +1570,55 @@ class TestEnsureBrowser:
         mock_page = MagicMock()
 
         activities._browser = mock_browser
-        activities._context = mock_context
-        activities._page = mock_page
+        activities._contexts[_WORKFLOW_ID] = mock_context
+        activities._pages[_WORKFLOW_ID] = mock_page
+
+        monkeypatch.setattr(browser_module, "async_playwright", MagicMock())
 
-        with patch("app.activities.browser.async_playwright"):
-            await activities._ensure_browser(log=log)
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert activities._browser is mock_browser
-        assert activities._context is mock_context
-        assert activities._page is mock_page
+        assert activities._contexts[_WORKFLOW_ID] is mock_context
+        assert activities._pages[_WORKFLOW_ID] is mock_page
 
     # ------------------------------------------------------------------
     # Slow path — browser is None
     # ------------------------------------------------------------------
 
-    async def test_slow_path_launches_browser_when_none(
-        self, activities: BrowserActivities, log: MagicMock
+    async def test_slow_path_launch_sequence(
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
-        """Full launch sequence runs when _browser is None."""
-        mock_ap_cm, mock_pw, mock_browser, mock_context, mock_page = (
-            _make_playwright_stack()
+        """Full launch sequence runs when _browser is None.
+
+        Playwright is started, Chromium launched, and a context and page are
+        created with the configured viewport and default timeouts, then
+        stored under the workflow ID.
+        """
+        mock_ap_cm, mock_pw, mock_browser, mock_context, mock_page = playwright_stack
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert activities._playwright is mock_pw
         assert activities._browser is mock_browser
-        assert activities._context is mock_context
-        assert activities._page is mock_page
-
-    async def test_slow_path_calls_chromium_launch(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """chromium.launch() is called with the configured headless flag."""
-        mock_ap_cm, mock_pw, _, _, _ = _make_playwright_stack()
-
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
+        assert activities._contexts[_WORKFLOW_ID] is mock_context
+        assert activities._pages[_WORKFLOW_ID] is mock_page
 
         mock_pw.chromium.launch.assert_awaited_once()
 
-    async def test_slow_path_creates_context_with_viewport(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """new_context() is called with the viewport dimensions from constants."""
-        from app.config import constants
-
-        mock_ap_cm, _, mock_browser, _, _ = _make_playwright_stack()
-
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
-
-        call_kwargs = mock_browser.new_context.call_args.kwargs
-        viewport = call_kwargs.get("viewport", {})
+        viewport = mock_browser.new_context.call_args.kwargs.get("viewport", {})
         assert viewport.get("width") == constants.BROWSER_VIEWPORT_WIDTH
         assert viewport.get("height") == constants.BROWSER_VIEWPORT_HEIGHT
 
-    async def test_slow_path_sets_default_timeout_on_context(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """set_default_timeout is called on the context."""
-        from app.config import constants
-
-        mock_ap_cm, _, _, mock_context, _ = _make_playwright_stack()
-
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
-
         mock_context.set_default_timeout.assert_called_once_with(
             constants.BROWSER_TIMEOUT_MS
         )
-
-    async def test_slow_path_sets_default_timeout_on_page(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """set_default_timeout is called on the page."""
-        from app.config import constants
-
-        mock_ap_cm, _, _, _, mock_page = _make_playwright_stack()
-
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
-
         mock_page.set_default_timeout.assert_called_once_with(
             constants.BROWSER_TIMEOUT_MS
         )
@@ -1524,7 +1628,11 @@ class TestEnsureBrowser:
     # ------------------------------------------------------------------
 
     async def test_slow_path_relaunches_when_browser_disconnected(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """Re-launch occurs when _browser is set but is_connected() is False."""
         stale_browser = MagicMock()
@@ -1532,10 +1640,13 @@ class TestEnsureBrowser:
         stale_browser.close = AsyncMock()
         activities._browser = stale_browser
 
-        mock_ap_cm, mock_pw, mock_fresh_browser, _, _ = _make_playwright_stack()
+        mock_ap_cm, mock_pw, mock_fresh_browser, _, _ = playwright_stack
+
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert activities._browser is mock_fresh_browser
 
@@ -1543,71 +1654,79 @@ class TestEnsureBrowser:
     # Playwright start failures
     # ------------------------------------------------------------------
 
-    async def test_playwright_start_binary_not_found_executable_in_message(
-        self, activities: BrowserActivities, log: MagicMock
+    @pytest.mark.parametrize("msg", BINARY_MISSING_MESSAGES)
+    async def test_playwright_start_binary_not_found(
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        msg: str,
     ) -> None:
-        """'executable' in error message → non-retryable ApplicationError."""
+        """'executable' / 'not found' (any case) → non-retryable ApplicationError."""
         mock_ap_cm = MagicMock()
-        mock_ap_cm.start = AsyncMock(
-            side_effect=Exception("executable not found on PATH")
-        )
-
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(ApplicationError) as exc_info:
-                await activities._ensure_browser(log=log)
-
-        assert exc_info.value.non_retryable is True
+        mock_ap_cm.start = AsyncMock(side_effect=Exception(msg))
 
-    async def test_playwright_start_binary_not_found_not_found_in_message(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """'not found' in error message (case-insensitive) → non-retryable ApplicationError."""
-        mock_ap_cm = MagicMock()
-        mock_ap_cm.start = AsyncMock(
-            side_effect=Exception("Playwright binary NOT FOUND")
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(ApplicationError) as exc_info:
-                await activities._ensure_browser(log=log)
+        with pytest.raises(ApplicationError) as exc_info:
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert exc_info.value.non_retryable is True
 
     async def test_playwright_start_generic_exception_raises_browser_start_error(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """A generic Exception from async_playwright().start() → retryable BrowserStartError."""
         mock_ap_cm = MagicMock()
-        mock_ap_cm.start = AsyncMock(side_effect=Exception("unexpected runtime failure"))
+        mock_ap_cm.start = AsyncMock(side_effect=_GENERIC_START_EXC)
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError):
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError):
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
     async def test_playwright_start_generic_exception_preserves_cause(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """BrowserStartError wraps the original generic exception as __cause__."""
-        original = Exception("underlying cause")
         mock_ap_cm = MagicMock()
-        mock_ap_cm.start = AsyncMock(side_effect=original)
+        mock_ap_cm.start = AsyncMock(side_effect=_GENERIC_START_EXC)
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError) as exc_info:
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
 
-        assert exc_info.value.__cause__ is original
+        with pytest.raises(BrowserStartError) as exc_info:
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
+
+        assert exc_info.value.__cause__ is _GENERIC_START_EXC
 
     async def test_playwright_start_failure_does_not_set_playwright_state(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """If async_playwright().start() fails, self._playwright remains None."""
         mock_ap_cm = MagicMock()
-        mock_ap_cm.start = AsyncMock(side_effect=Exception("fail"))
+        mock_ap_cm.start = AsyncMock(side_effect=_GENERIC_START_EXC)
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises((ApplicationError, BrowserStartError)):
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError):
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert activities._playwright is None
 
@@ -1616,31 +1735,45 @@ class TestEnsureBrowser:
     # ------------------------------------------------------------------
 
     async def test_chromium_launch_failure_raises_browser_start_error(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """PlaywrightError from chromium.launch() → BrowserStartError."""
-        mock_ap_cm, mock_pw, _, _, _ = _make_playwright_stack()
+        mock_ap_cm, mock_pw, _, _, _ = playwright_stack
         mock_pw.chromium.launch = AsyncMock(
             side_effect=PlaywrightError("Chromium crashed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError) as exc_info:
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError) as exc_info:
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert "Failed to launch Chromium" in str(exc_info.value)
 
     async def test_chromium_launch_failure_preserves_cause(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """BrowserStartError wraps the original PlaywrightError as __cause__."""
         original = PlaywrightError("Chromium crashed")
-        mock_ap_cm, mock_pw, _, _, _ = _make_playwright_stack()
+        mock_ap_cm, mock_pw, _, _, _ = playwright_stack
         mock_pw.chromium.launch = AsyncMock(side_effect=original)
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError) as exc_info:
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError) as exc_info:
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert exc_info.value.__cause__ is original
 
@@ -1649,154 +1782,277 @@ class TestEnsureBrowser:
     # ------------------------------------------------------------------
 
     async def test_context_creation_failure_raises_browser_start_error(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """PlaywrightError from new_context() → BrowserStartError."""
-        mock_ap_cm, _, mock_browser, _, _ = _make_playwright_stack()
+        mock_ap_cm, _, mock_browser, _, _ = playwright_stack
         mock_browser.new_context = AsyncMock(
             side_effect=PlaywrightError("context creation failed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError) as exc_info:
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError) as exc_info:
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert "Failed to create browser context or page" in str(exc_info.value)
 
     async def test_context_creation_failure_calls_teardown(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """Teardown is called after new_context() raises so no orphaned browser.
 
         ``_ensure_browser`` always calls ``_teardown_silently`` once at slow-path
         start (to clean half-open state from a previous attempt), and a second
-        time inside the exception handler for context/page creation failure.
-        Total expected await count: 2.
+        time inside the exception handler when no other workflow holds a
+        context on the freshly launched browser. Total expected await count: 2.
         """
-        mock_ap_cm, _, mock_browser, _, _ = _make_playwright_stack()
+        mock_ap_cm, _, mock_browser, _, _ = playwright_stack
         mock_browser.new_context = AsyncMock(
             side_effect=PlaywrightError("context creation failed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with patch.object(
-                activities, "_teardown_silently", new_callable=AsyncMock
-            ) as mock_teardown:
-                with pytest.raises(BrowserStartError):
-                    await activities._ensure_browser(log=log)
+        mock_teardown = AsyncMock()
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+        monkeypatch.setattr(activities, "_teardown_silently", mock_teardown)
+
+        with pytest.raises(BrowserStartError):
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         # Once for initial cleanup of half-open state, once for failure cleanup.
         assert mock_teardown.await_count == 2
 
     async def test_context_creation_failure_clears_state(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """After new_context() failure and teardown, all state refs are None."""
-        mock_ap_cm, _, mock_browser, _, _ = _make_playwright_stack()
+        mock_ap_cm, _, mock_browser, _, _ = playwright_stack
         mock_browser.new_context = AsyncMock(
             side_effect=PlaywrightError("context creation failed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError):
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError):
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert activities._playwright is None
         assert activities._browser is None
-        assert activities._context is None
-        assert activities._page is None
+        assert activities._contexts == {}
+        assert activities._pages == {}
 
     # ------------------------------------------------------------------
     # Page creation failures
     # ------------------------------------------------------------------
 
     async def test_page_creation_failure_raises_browser_start_error(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """PlaywrightError from new_page() → BrowserStartError."""
-        mock_ap_cm, _, _, mock_context, _ = _make_playwright_stack()
+        mock_ap_cm, _, _, mock_context, _ = playwright_stack
         mock_context.new_page = AsyncMock(
             side_effect=PlaywrightError("page creation failed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError) as exc_info:
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError) as exc_info:
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert "Failed to create browser context or page" in str(exc_info.value)
 
     async def test_page_creation_failure_calls_teardown(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """Teardown is called after new_page() raises so no orphaned browser.
 
         Same dual-call logic as the context failure case: initial cleanup at
         slow-path start, plus failure-path cleanup. Total expected count: 2.
         """
-        mock_ap_cm, _, _, mock_context, _ = _make_playwright_stack()
+        mock_ap_cm, _, _, mock_context, _ = playwright_stack
         mock_context.new_page = AsyncMock(
             side_effect=PlaywrightError("page creation failed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with patch.object(
-                activities, "_teardown_silently", new_callable=AsyncMock
-            ) as mock_teardown:
-                with pytest.raises(BrowserStartError):
-                    await activities._ensure_browser(log=log)
+        mock_teardown = AsyncMock()
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+        monkeypatch.setattr(activities, "_teardown_silently", mock_teardown)
+
+        with pytest.raises(BrowserStartError):
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         # Once for initial cleanup of half-open state, once for failure cleanup.
         assert mock_teardown.await_count == 2
 
     async def test_page_creation_failure_clears_state(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """After new_page() failure and teardown, all state refs are None."""
-        mock_ap_cm, _, _, mock_context, _ = _make_playwright_stack()
+        mock_ap_cm, _, _, mock_context, _ = playwright_stack
         mock_context.new_page = AsyncMock(
             side_effect=PlaywrightError("page creation failed")
         )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            with pytest.raises(BrowserStartError):
-                await activities._ensure_browser(log=log)
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        with pytest.raises(BrowserStartError):
+            await activities._ensure_browser(_WORKFLOW_ID, log=log)
 
         assert activities._playwright is None
         assert activities._browser is None
-        assert activities._context is None
-        assert activities._page is None
+        assert activities._contexts == {}
+        assert activities._pages == {}
+
+    # ------------------------------------------------------------------
+    # Saved storage state
+    # ------------------------------------------------------------------
+
+    async def test_warm_context_created_from_saved_state(
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
+        tmp_path: Path,
+    ) -> None:
+        """An existing state file is passed to new_context() as storage_state."""
+        state_path = tmp_path / "state.json"
+        state_path.write_text('{"cookies": [], "origins": []}')
+        monkeypatch.setattr(constants, "BROWSER_STORAGE_STATE_PATH", str(state_path))
+        mock_ap_cm, _, mock_browser, mock_context, _ = playwright_stack
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
+
+        mock_browser.new_context.assert_awaited_once()
+        assert mock_browser.new_context.call_args.kwargs["storage_state"] == str(
+            state_path
+        )
+        assert activities._contexts[_WORKFLOW_ID] is mock_context
+        log.info.assert_any_call(
+            "browser.context_created",
+            workflow_id=_WORKFLOW_ID,
+            total_contexts=1,
+            warm_storage_state=True,
+            viewport_width=constants.BROWSER_VIEWPORT_WIDTH,
+            viewport_height=constants.BROWSER_VIEWPORT_HEIGHT,
+        )
+
+    async def test_unreadable_state_falls_back_to_cold_context(
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
+        tmp_path: Path,
+    ) -> None:
+        """A state file new_context() rejects is dropped and a cold context is used."""
+        state_path = tmp_path / "state.json"
+        state_path.write_text('{"cookies": [')  # truncated write
+        monkeypatch.setattr(constants, "BROWSER_STORAGE_STATE_PATH", str(state_path))
+        mock_ap_cm, _, mock_browser, mock_context, _ = playwright_stack
+        mock_browser.new_context = AsyncMock(
+            side_effect=[PlaywrightError("invalid storage state"), mock_context]
+        )
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
+
+        assert [
+            c.kwargs["storage_state"] for c in mock_browser.new_context.call_args_list
+        ] == [str(state_path), None]
+        assert activities._contexts[_WORKFLOW_ID] is mock_context
+        assert not state_path.exists()
+        log.warning.assert_called_once_with(
+            "browser.storage_state_load_error",
+            path=str(state_path),
+            error="invalid storage state",
+        )
 
     # ------------------------------------------------------------------
     # Default logger (log=None)
     # ------------------------------------------------------------------
 
     async def test_uses_default_structlog_logger_when_log_is_none(
-        self, activities: BrowserActivities
+        self,
+        activities: BrowserActivities,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """Passing log=None does not raise; structlog.get_logger() is used instead."""
-        mock_ap_cm, _, _, _, _ = _make_playwright_stack()
+        mock_ap_cm, _, _, _, _ = playwright_stack
+
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            # Should not raise even though no log param was provided.
-            await activities._ensure_browser(log=None)
+        # Should not raise even though no log param was provided.
+        await activities._ensure_browser(_WORKFLOW_ID, log=None)
 
     # ------------------------------------------------------------------
     # Idempotency — calling _ensure_browser twice
     # ------------------------------------------------------------------
 
     async def test_second_call_is_no_op_when_browser_still_connected(
-        self, activities: BrowserActivities, log: MagicMock
+        self,
+        activities: BrowserActivities,
+        log: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        playwright_stack: _PlaywrightStack,
     ) -> None:
         """Calling _ensure_browser a second time while the browser is connected
         is a no-op (fast path)."""
-        mock_ap_cm, _, mock_browser, _, _ = _make_playwright_stack()
+        mock_ap_cm, _, mock_browser, _, _ = playwright_stack
 
-        with patch("app.activities.browser.async_playwright", return_value=mock_ap_cm):
-            await activities._ensure_browser(log=log)
-            launch_call_count_after_first = mock_browser.new_context.await_count
+        monkeypatch.setattr(
+            browser_module, "async_playwright", MagicMock(return_value=mock_ap_cm)
+        )
+
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
+        launch_call_count_after_first = mock_browser.new_context.await_count
 
-            await activities._ensure_browser(log=log)
-            launch_call_count_after_second = mock_browser.new_context.await_count
+        await activities._ensure_browser(_WORKFLOW_ID, log=log)
+        launch_call_count_after_second = mock_browser.new_context.await_count
 
         # No additional context was created on the second call.
         assert launch_call_count_after_second == launch_call_count_after_first
@@ -1807,71 +2063,125 @@ class TestEnsureBrowser:
 # ===========================================================================
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestTeardownSilently:
     """Tests for ``BrowserActivities._teardown_silently``.
 
     Resources are injected directly onto the ``BrowserActivities`` instance
-    before calling the method.
+    before calling the method: per-workflow pages and contexts are keyed by
+    ``_WORKFLOW_ID`` and the shared browser / Playwright runtime are set on
+    their attributes. They are ``FakeResource`` stubs rather than
+    ``AsyncMock``s since teardown only ever awaits ``close()`` / ``stop()``.
+
+    Only the close-error test inspects log output and takes the ``MagicMock``
+    ``shared_log`` fixture; every other test passes the ``noop_log`` stub.
     """
 
-    @pytest.fixture()
+    # Resource name → the coroutine method ``_teardown_silently`` awaits on it.
+    _CLOSE_METHODS: dict[str, str] = {
+        "page": "close",
+        "context": "close",
+        "browser": "close",
+        "playwright": "stop",
+    }
+
+    @pytest.fixture(scope="module")
     def activities(self) -> BrowserActivities:
         return BrowserActivities()
 
-    @pytest.fixture()
-    def log(self) -> MagicMock:
-        return _make_mock_logger()
+    @pytest.fixture(autouse=True)
+    def _reset_shared_state(
+        self, activities: BrowserActivities, shared_log: MagicMock
+    ) -> Iterator[None]:
+        yield
+        _clear_browser_state(activities)
+        shared_log.reset_mock()
 
     def _inject_full_stack(
         self, activities: BrowserActivities
-    ) -> tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock]:
-        """Set all four resources on ``activities`` and return the mocks."""
-        mock_page: AsyncMock = AsyncMock()
-        mock_context: AsyncMock = AsyncMock()
-        mock_browser: AsyncMock = AsyncMock()
-        mock_playwright: AsyncMock = AsyncMock()
-
-        activities._page = mock_page
-        activities._context = mock_context
-        activities._browser = mock_browser
-        activities._playwright = mock_playwright
+    ) -> tuple[FakeResource, FakeResource, FakeResource, FakeResource]:
+        """Set all four resources on ``activities`` and return the fakes."""
+        fakes = self._inject_partial_stack(
+            activities, page=True, context=True, browser=True, playwright=True
+        )
+        return fakes["page"], fakes["context"], fakes["browser"], fakes["playwright"]
 
-        return mock_page, mock_context, mock_browser, mock_playwright
+    def _inject_partial_stack(
+        self,
+        activities: BrowserActivities,
+        *,
+        page: bool = False,
+        context: bool = False,
+        browser: bool = False,
+        playwright: bool = False,
+    ) -> dict[str, FakeResource]:
+        """Set only the requested resources on ``activities``; return them by name."""
+        wanted = {
+            "page": page,
+            "context": context,
+            "browser": browser,
+            "playwright": playwright,
+        }
+        fakes = {name: FakeResource() for name, flag in wanted.items() if flag}
+        self._install_stack(activities, fakes)
+        return fakes
+
+    @staticmethod
+    def _install_stack(
+        activities: BrowserActivities, fakes: dict[str, FakeResource]
+    ) -> None:
+        """Put the named fakes where ``_teardown_silently`` looks for them."""
+        if "page" in fakes:
+            activities._pages[_WORKFLOW_ID] = fakes["page"]
+        if "context" in fakes:
+            activities._contexts[_WORKFLOW_ID] = fakes["context"]
+        activities._browser = fakes.get("browser")
+        activities._playwright = fakes.get("playwright")
+
+    @staticmethod
+    def _exploding_stack() -> dict[str, FakeResource]:
+        """A full stack whose every close()/stop() raises, keyed by resource name."""
+        return {
+            "page": FakeResource(close=FakeAsync(Exception("page error"))),
+            "context": FakeResource(close=FakeAsync(Exception("context error"))),
+            "browser": FakeResource(close=FakeAsync(Exception("browser error"))),
+            "playwright": FakeResource(stop=FakeAsync(Exception("playwright error"))),
+        }
 
     # ------------------------------------------------------------------
     # Happy path — all resources present
     # ------------------------------------------------------------------
 
     async def test_closes_all_resources_when_fully_initialised(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
         """All four .close()/.stop() coroutines are awaited."""
         mock_page, mock_context, mock_browser, mock_playwright = (
             self._inject_full_stack(activities)
         )
 
-        await activities._teardown_silently(log=log)
+        await activities._teardown_silently(log=noop_log)
 
-        mock_page.close.assert_awaited_once()
-        mock_context.close.assert_awaited_once()
-        mock_browser.close.assert_awaited_once()
-        mock_playwright.stop.assert_awaited_once()
+        assert mock_page.close.calls == 1
+        assert mock_context.close.calls == 1
+        assert mock_browser.close.calls == 1
+        assert mock_playwright.stop.calls == 1
 
     async def test_clears_all_references_after_full_teardown(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
-        """All instance references are set to None after successful teardown."""
+        """All instance references are cleared after successful teardown."""
         self._inject_full_stack(activities)
 
-        await activities._teardown_silently(log=log)
+        await activities._teardown_silently(log=noop_log)
 
-        assert activities._page is None
-        assert activities._context is None
+        assert activities._pages == {}
+        assert activities._contexts == {}
         assert activities._browser is None
         assert activities._playwright is None
 
     async def test_teardown_order_page_context_browser_playwright(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
         """Resources are closed in correct order: page → context → browser → playwright.
 
@@ -1879,22 +2189,17 @@ class TestTeardownSilently:
         before outer ones.
         """
         closed_order: list[str] = []
-        mock_page = AsyncMock()
-        mock_context = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_playwright = AsyncMock()
-
-        mock_page.close.side_effect = lambda: closed_order.append("page")
-        mock_context.close.side_effect = lambda: closed_order.append("context")
-        mock_browser.close.side_effect = lambda: closed_order.append("browser")
-        mock_playwright.stop.side_effect = lambda: closed_order.append("playwright")
-
-        activities._page = mock_page
-        activities._context = mock_context
-        activities._browser = mock_browser
-        activities._playwright = mock_playwright
+        stack = zip(
+            self._CLOSE_METHODS.items(),
+            self._inject_full_stack(activities),
+            strict=True,
+        )
+        for (resource, close_method), fake in stack:
+            getattr(fake, close_method).side_effect = partial(
+                closed_order.append, resource
+            )
 
-        await activities._teardown_silently(log=log)
+        await activities._teardown_silently(log=noop_log)
 
         assert closed_order == ["page", "context", "browser", "playwright"]
 
@@ -1903,21 +2208,14 @@ class TestTeardownSilently:
     # ------------------------------------------------------------------
 
     async def test_no_op_when_all_resources_are_none(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
-        """No errors raised and nothing called when all resources are None."""
+        """Teardown of an uninitialised instance does not raise and leaves it empty."""
         # Default state of BrowserActivities has all resources as None.
-        await activities._teardown_silently(log=log)
-        # No assertion needed beyond "it doesn't raise".
-
-    async def test_state_still_none_after_no_op_teardown(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """References remain None after teardown of an uninitialised instance."""
-        await activities._teardown_silently(log=log)
+        await activities._teardown_silently(log=noop_log)
 
-        assert activities._page is None
-        assert activities._context is None
+        assert activities._pages == {}
+        assert activities._contexts == {}
         assert activities._browser is None
         assert activities._playwright is None
 
@@ -1926,140 +2224,62 @@ class TestTeardownSilently:
     # ------------------------------------------------------------------
 
     async def test_only_closes_resources_that_are_set(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
         """Only existing (non-None) resources are closed."""
-        mock_page = AsyncMock()
-        mock_playwright = AsyncMock()
-
-        activities._page = mock_page
-        activities._playwright = mock_playwright
-        # _context and _browser remain None
+        # No context and no browser
+        fakes = self._inject_partial_stack(activities, page=True, playwright=True)
 
-        await activities._teardown_silently(log=log)
+        await activities._teardown_silently(log=noop_log)
 
-        mock_page.close.assert_awaited_once()
-        mock_playwright.stop.assert_awaited_once()
+        assert fakes["page"].close.calls == 1
+        assert fakes["playwright"].stop.calls == 1
 
     async def test_partial_teardown_clears_all_references(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
-        """All references set to None even when only some resources existed."""
-        activities._page = AsyncMock()
-        activities._playwright = AsyncMock()
+        """All references cleared even when only some resources existed."""
+        self._inject_partial_stack(activities, page=True, playwright=True)
 
-        await activities._teardown_silently(log=log)
+        await activities._teardown_silently(log=noop_log)
 
-        assert activities._page is None
+        assert activities._pages == {}
         assert activities._playwright is None
 
     # ------------------------------------------------------------------
-    # Error swallowing — each resource
+    # Error swallowing and logging — each resource
     # ------------------------------------------------------------------
 
-    async def test_page_close_error_is_swallowed(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """An error in page.close() does not propagate; remaining resources are closed."""
-        mock_page, mock_context, mock_browser, mock_playwright = (
-            self._inject_full_stack(activities)
-        )
-        mock_page.close.side_effect = Exception("page close blew up")
-
-        await activities._teardown_silently(log=log)  # must not raise
-
-        mock_context.close.assert_awaited_once()
-        mock_browser.close.assert_awaited_once()
-        mock_playwright.stop.assert_awaited_once()
-
-    async def test_context_close_error_is_swallowed(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """An error in context.close() does not propagate; remaining resources are closed."""
-        mock_page, mock_context, mock_browser, mock_playwright = (
-            self._inject_full_stack(activities)
-        )
-        mock_context.close.side_effect = Exception("context close blew up")
-
-        await activities._teardown_silently(log=log)  # must not raise
-
-        mock_page.close.assert_awaited_once()
-        mock_browser.close.assert_awaited_once()
-        mock_playwright.stop.assert_awaited_once()
-
-    async def test_browser_close_error_is_swallowed(
-        self, activities: BrowserActivities, log: MagicMock
+    @pytest.mark.parametrize("resource", list(_CLOSE_METHODS))
+    async def test_close_error_is_swallowed_and_logged(
+        self, activities: BrowserActivities, shared_log: MagicMock, resource: str
     ) -> None:
-        """An error in browser.close() does not propagate; playwright is still stopped."""
-        mock_page, mock_context, mock_browser, mock_playwright = (
-            self._inject_full_stack(activities)
+        """A close error is swallowed and logged; the other resources still close."""
+        stack = dict(
+            zip(self._CLOSE_METHODS, self._inject_full_stack(activities), strict=True)
         )
-        mock_browser.close.side_effect = Exception("browser close blew up")
+        close_method = getattr(stack[resource], self._CLOSE_METHODS[resource])
+        close_method.side_effect = Exception(f"{resource} close blew up")
 
-        await activities._teardown_silently(log=log)  # must not raise
-
-        mock_playwright.stop.assert_awaited_once()
-
-    async def test_playwright_stop_error_is_swallowed(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """An error in playwright.stop() does not propagate."""
-        mock_page, mock_context, mock_browser, mock_playwright = (
-            self._inject_full_stack(activities)
-        )
-        mock_playwright.stop.side_effect = Exception("playwright stop blew up")
+        await activities._teardown_silently(log=shared_log)  # must not raise
 
-        await activities._teardown_silently(log=log)  # must not raise
+        for name, mock in stack.items():
+            assert getattr(mock, self._CLOSE_METHODS[name]).calls == 1
+        assert shared_log.warning.call_args.kwargs["resource"] == resource
 
     async def test_all_errors_swallowed_and_state_cleared(
-        self, activities: BrowserActivities, log: MagicMock
+        self, activities: BrowserActivities, noop_log: NoopLog
     ) -> None:
-        """Even when every resource raises on close, all refs are set to None."""
-        mock_page, mock_context, mock_browser, mock_playwright = (
-            self._inject_full_stack(activities)
-        )
-        mock_page.close.side_effect = Exception("page error")
-        mock_context.close.side_effect = Exception("context error")
-        mock_browser.close.side_effect = Exception("browser error")
-        mock_playwright.stop.side_effect = Exception("playwright error")
+        """Even when every resource raises on close, all refs are cleared."""
+        self._install_stack(activities, self._exploding_stack())
 
-        await activities._teardown_silently(log=log)  # must not raise
+        await activities._teardown_silently(log=noop_log)  # must not raise
 
-        assert activities._page is None
-        assert activities._context is None
+        assert activities._pages == {}
+        assert activities._contexts == {}
         assert activities._browser is None
         assert activities._playwright is None
 
-    # ------------------------------------------------------------------
-    # Error logging
-    # ------------------------------------------------------------------
-
-    async def test_swallowed_page_error_is_logged_as_warning(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """A close error on 'page' is logged as a warning with the resource name."""
-        self._inject_full_stack(activities)
-        activities._page.close.side_effect = Exception("page close error")
-
-        await activities._teardown_silently(log=log)
-
-        log.warning.assert_called()
-        warning_kwargs = log.warning.call_args.kwargs
-        assert warning_kwargs.get("resource") == "page"
-
-    async def test_swallowed_playwright_error_is_logged_as_warning(
-        self, activities: BrowserActivities, log: MagicMock
-    ) -> None:
-        """A stop error on 'playwright' is logged as a warning with the resource name."""
-        self._inject_full_stack(activities)
-        activities._playwright.stop.side_effect = Exception("playwright stop error")
-
-        await activities._teardown_silently(log=log)
-
-        log.warning.assert_called()
-        warning_kwargs = log.warning.call_args.kwargs
-        assert warning_kwargs.get("resource") == "playwright"
-
     # ------------------------------------------------------------------
     # Default logger (log=None)
     # ------------------------------------------------------------------
@@ -2068,7 +2288,7 @@ class TestTeardownSilently:
         self, activities: BrowserActivities
     ) -> None:
         """Passing log=None does not raise; structlog.get_logger() is used instead."""
-        self._inject_full_stack(activities)
+        self._inject_partial_stack(activities, page=True, playwright=True)
         # Should not raise even though no log param was provided.
         await activities._teardown_silently(log=None)
 
@@ -2078,102 +2298,46 @@ class TestTeardownSilently:
 # ===========================================================================
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestCaptureScreenshot:
     """Tests for ``BrowserActivities._capture_screenshot``.
 
-    This is a best-effort helper; it must never raise.
+    This is a best-effort helper; it must never raise. It holds no state of
+    its own, so one ``BrowserActivities`` is shared across the class.
     """
 
-    @pytest.fixture()
+    @pytest.fixture(scope="module")
     def activities(self) -> BrowserActivities:
         return BrowserActivities()
 
-    # ------------------------------------------------------------------
-    # page is None
-    # ------------------------------------------------------------------
-
-    async def test_returns_none_when_page_is_none(
-        self, activities: BrowserActivities
-    ) -> None:
-        """Returns None immediately when there is no live page."""
-        result = await activities._capture_screenshot("my_activity", "wf-000")
-        assert result is None
-
     # ------------------------------------------------------------------
     # Screenshot succeeds
     # ------------------------------------------------------------------
 
-    async def test_returns_path_on_success(
-        self, activities: BrowserActivities
-    ) -> None:
-        """Returns a Path object when screenshot() succeeds."""
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock()
-
-        result = await activities._capture_screenshot("my_activity", "wf-001")
-
-        assert result is not None
-        assert isinstance(result, Path)
+    async def test_path_properties(self, activities: BrowserActivities) -> None:
+        """Success returns a .png Path in the configured screenshot directory.
 
-    async def test_path_contains_activity_name(
-        self, activities: BrowserActivities
-    ) -> None:
-        """Returned path embeds the activity_name for identification."""
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock()
+        The file name embeds the activity name and workflow ID for traceability.
+        """
+        mock_page = AsyncMock()
 
-        result = await activities._capture_screenshot("scrape_urls_activity", "wf-002")
+        result = await activities._capture_screenshot(
+            mock_page, "scrape_urls_activity", "unique-wf-xyz"
+        )
 
-        assert result is not None
+        assert isinstance(result, Path)
         assert "scrape_urls_activity" in result.name
-
-    async def test_path_contains_workflow_id(
-        self, activities: BrowserActivities
-    ) -> None:
-        """Returned path embeds the workflow_id for traceability."""
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock()
-
-        result = await activities._capture_screenshot("my_activity", "unique-wf-xyz")
-
-        assert result is not None
         assert "unique-wf-xyz" in result.name
-
-    async def test_path_has_png_extension(
-        self, activities: BrowserActivities
-    ) -> None:
-        """Screenshot file is always a .png."""
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock()
-
-        result = await activities._capture_screenshot("my_activity", "wf-003")
-
-        assert result is not None
         assert result.suffix == ".png"
-
-    async def test_screenshot_written_to_configured_directory(
-        self, activities: BrowserActivities
-    ) -> None:
-        """Screenshot path parent equals BROWSER_SCREENSHOT_DIR constant."""
-        from app.config import constants
-
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock()
-
-        result = await activities._capture_screenshot("my_activity", "wf-004")
-
-        assert result is not None
-        assert str(result.parent) == constants.BROWSER_SCREENSHOT_DIR
+        assert str(result.parent) == BROWSER_SCREENSHOT_DIR
 
     async def test_screenshot_called_with_string_path(
         self, activities: BrowserActivities
     ) -> None:
         """page.screenshot() receives the path as a string (Playwright requirement)."""
         mock_page = AsyncMock()
-        mock_page.screenshot = AsyncMock()
-        activities._page = mock_page
 
-        await activities._capture_screenshot("my_activity", "wf-005")
+        await activities._capture_screenshot(mock_page, "my_activity", "wf-005")
 
         call_kwargs = mock_page.screenshot.call_args.kwargs
         assert isinstance(call_kwargs.get("path"), str)
@@ -2186,12 +2350,14 @@ class TestCaptureScreenshot:
         self, activities: BrowserActivities
     ) -> None:
         """page.screenshot() raising must not propagate; returns None instead."""
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock(
+        mock_page = AsyncMock()
+        mock_page.screenshot = AsyncMock(
             side_effect=Exception("screenshot disk full")
         )
 
-        result = await activities._capture_screenshot("my_activity", "wf-006")
+        result = await activities._capture_screenshot(
+            mock_page, "my_activity", "wf-006"
+        )
 
         assert result is None
 
@@ -2199,16 +2365,136 @@ class TestCaptureScreenshot:
         self, activities: BrowserActivities
     ) -> None:
         """PlaywrightError from screenshot() is also swallowed, returning None."""
-        activities._page = AsyncMock()
-        activities._page.screenshot = AsyncMock(
+        mock_page = AsyncMock()
+        mock_page.screenshot = AsyncMock(
             side_effect=PlaywrightError("target closed")
         )
 
-        result = await activities._capture_screenshot("my_activity", "wf-007")
+        result = await activities._capture_screenshot(
+            mock_page, "my_activity", "wf-007"
+        )
 
         assert result is None
 
 
+# ===========================================================================
+# TestSaveStorageState
+# ===========================================================================
+
+
+#: What ``BrowserContext.storage_state()`` returns for a page with one cookie.
+_STORAGE_STATE = {
+    "cookies": [{"name": "user", "value": "abc", "domain": "news.ycombinator.com"}],
+    "origins": [],
+}
+
+
+class TestSaveStorageState:
+    """Tests for ``BrowserActivities._save_storage_state``.
+
+    Best-effort helper: persists cookies/localStorage so later contexts start
+    warm, and must never raise.
+    """
+
+    @pytest.fixture()
+    def activities(self) -> BrowserActivities:
+        return BrowserActivities()
+
+    @pytest.fixture()
+    def log(self) -> MagicMock:
+        return _make_mock_logger()
+
+    async def test_no_op_when_storage_state_disabled(
+        self, activities: BrowserActivities, log: MagicMock
+    ) -> None:
+        """An empty BROWSER_STORAGE_STATE_PATH skips the write entirely."""
+        mock_context = AsyncMock()
+
+        with patch("app.config.constants.BROWSER_STORAGE_STATE_PATH", ""):
+            await activities._save_storage_state(mock_context, log=log)
+
+        mock_context.storage_state.assert_not_awaited()
+
+    async def test_writes_state_to_configured_path(
+        self, activities: BrowserActivities, log: MagicMock, tmp_path: Path
+    ) -> None:
+        """A missing state file is written, with its directory created."""
+        state_path = tmp_path / "cache" / "state.json"
+        mock_context = AsyncMock()
+        mock_context.storage_state.return_value = _STORAGE_STATE
+
+        with patch("app.config.constants.BROWSER_STORAGE_STATE_PATH", str(state_path)):
+            await activities._save_storage_state(mock_context, log=log)
+
+        mock_context.storage_state.assert_awaited_once_with()
+        assert json.loads(state_path.read_text()) == _STORAGE_STATE
+
+    async def test_write_replaces_file_atomically(
+        self, activities: BrowserActivities, log: MagicMock, tmp_path: Path
+    ) -> None:
+        """The state goes through a temp file that is renamed onto the target."""
+        state_path = tmp_path / "state.json"
+        mock_context = AsyncMock()
+        mock_context.storage_state.return_value = _STORAGE_STATE
+
+        with (
+            patch("app.config.constants.BROWSER_STORAGE_STATE_PATH", str(state_path)),
+            patch.object(
+                browser_module.os, "replace", wraps=browser_module.os.replace
+            ) as mock_replace,
+        ):
+            await activities._save_storage_state(mock_context, log=log)
+
+        mock_replace.assert_called_once_with(ANY, state_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    async def test_fresh_state_is_not_rewritten(
+        self, activities: BrowserActivities, log: MagicMock, tmp_path: Path
+    ) -> None:
+        """A state file younger than the max age is left alone."""
+        state_path = tmp_path / "state.json"
+        state_path.write_text("{}")
+        mock_context = AsyncMock()
+
+        with patch("app.config.constants.BROWSER_STORAGE_STATE_PATH", str(state_path)):
+            await activities._save_storage_state(mock_context, log=log)
+
+        mock_context.storage_state.assert_not_awaited()
+        assert state_path.read_text() == "{}"
+
+    async def test_stale_state_is_rewritten(
+        self, activities: BrowserActivities, log: MagicMock, tmp_path: Path
+    ) -> None:
+        """A state file older than the max age is replaced."""
+        state_path = tmp_path / "state.json"
+        state_path.write_text("{}")
+        stale = time.time() - constants.BROWSER_STORAGE_STATE_MAX_AGE_S - 1
+        os.utime(state_path, (stale, stale))
+        mock_context = AsyncMock()
+        mock_context.storage_state.return_value = _STORAGE_STATE
+
+        with patch("app.config.constants.BROWSER_STORAGE_STATE_PATH", str(state_path)):
+            await activities._save_storage_state(mock_context, log=log)
+
+        assert json.loads(state_path.read_text()) == _STORAGE_STATE
+
+    async def test_write_error_is_swallowed_and_logged(
+        self, activities: BrowserActivities, log: MagicMock, tmp_path: Path
+    ) -> None:
+        """A failing storage_state() call is logged as a warning, not raised."""
+        mock_context = AsyncMock()
+        mock_context.storage_state.side_effect = PlaywrightError("context closed")
+
+        with patch(
+            "app.config.constants.BROWSER_STORAGE_STATE_PATH",
+            str(tmp_path / "state.json"),
+        ):
+            await activities._save_storage_state(mock_context, log=log)
+
+        log.warning.assert_called_once()
+        assert log.warning.call_args.args[0] == "browser.storage_state_save_error"
+
+
 # ===========================================================================
 # Shared helpers for scraping tests
 # ===========================================================================
@@ -2299,7 +2585,7 @@ class TestScrapeUrlsActivity:
         return instance
 
     @pytest.fixture()
-    def mock_info(self) -> MagicMock:
+    def mock_info(self) -> FakeActivityInfo:
         return _make_activity_info(activity_type="scrape_urls_activity")
 
     @pytest.fixture()
@@ -2313,7 +2599,7 @@ class TestScrapeUrlsActivity:
     async def test_returns_stories_on_success(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_stories: list,
     ) -> None:
         """Activity returns the list produced by _extract_stories."""
@@ -2334,7 +2620,7 @@ class TestScrapeUrlsActivity:
     async def test_logs_starting_and_completed_on_success(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_stories: list,
     ) -> None:
         """Activity emits 'scrape.starting' and 'scrape.completed' on success."""
@@ -2342,7 +2628,9 @@ class TestScrapeUrlsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities,
@@ -2351,7 +2639,6 @@ class TestScrapeUrlsActivity:
                 return_value=mock_stories,
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.scrape_urls_activity(30)
 
         info_events = [c.args[0] for c in mock_logger.info.call_args_list]
@@ -2361,7 +2648,7 @@ class TestScrapeUrlsActivity:
     async def test_completed_log_includes_stories_count(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_stories: list,
     ) -> None:
         """The 'scrape.completed' log event includes the correct stories_count."""
@@ -2369,7 +2656,9 @@ class TestScrapeUrlsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities,
@@ -2378,7 +2667,6 @@ class TestScrapeUrlsActivity:
                 return_value=mock_stories,
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.scrape_urls_activity(30)
 
         completed_call = next(
@@ -2393,7 +2681,7 @@ class TestScrapeUrlsActivity:
     # ------------------------------------------------------------------
 
     async def test_reraises_application_error_from_ensure_browser(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, mock_info: FakeActivityInfo
     ) -> None:
         """Non-retryable ApplicationError from _ensure_browser propagates as-is."""
         original_exc = ApplicationError("binary missing", non_retryable=True)
@@ -2416,7 +2704,7 @@ class TestScrapeUrlsActivity:
     # ------------------------------------------------------------------
 
     async def test_reraises_browser_start_error_and_logs_failed(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, mock_info: FakeActivityInfo
     ) -> None:
         """BrowserStartError from _ensure_browser is logged then re-raised."""
         mock_logger = _make_mock_logger()
@@ -2424,7 +2712,9 @@ class TestScrapeUrlsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(
                 activities,
                 "_ensure_browser",
@@ -2432,7 +2722,6 @@ class TestScrapeUrlsActivity:
                 side_effect=original_exc,
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserStartError) as exc_info:
                 await activities.scrape_urls_activity(30)
 
@@ -2445,7 +2734,7 @@ class TestScrapeUrlsActivity:
     # ------------------------------------------------------------------
 
     async def test_reraises_browser_navigation_error_and_logs_failed(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, mock_info: FakeActivityInfo
     ) -> None:
         """BrowserNavigationError from _extract_stories is logged then re-raised."""
         mock_logger = _make_mock_logger()
@@ -2453,7 +2742,9 @@ class TestScrapeUrlsActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities,
@@ -2465,7 +2756,6 @@ class TestScrapeUrlsActivity:
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(BrowserNavigationError) as exc_info:
                 await activities.scrape_urls_activity(30)
 
@@ -2478,7 +2768,7 @@ class TestScrapeUrlsActivity:
     # ------------------------------------------------------------------
 
     async def test_parse_error_wrapped_as_non_retryable_application_error(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, mock_info: FakeActivityInfo
     ) -> None:
         """ParseError from _extract_stories is wrapped as non_retryable ApplicationError."""
         original_exc = ParseError("DOM changed")
@@ -2503,14 +2793,16 @@ class TestScrapeUrlsActivity:
         assert exc_info.value.__cause__ is original_exc
 
     async def test_parse_error_logs_scrape_failed(
-        self, activities: BrowserActivities, mock_info: MagicMock
+        self, activities: BrowserActivities, mock_info: FakeActivityInfo
     ) -> None:
         """ParseError causes a 'scrape.failed' error log event."""
         mock_logger = _make_mock_logger()
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
             patch.object(
                 activities,
@@ -2522,7 +2814,6 @@ class TestScrapeUrlsActivity:
                 activities, "_capture_screenshot", new_callable=AsyncMock, return_value=None
             ),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             with pytest.raises(ApplicationError):
                 await activities.scrape_urls_activity(30)
 
@@ -2581,8 +2872,6 @@ class TestExtractStories:
         self, activities: BrowserActivities, log: MagicMock
     ) -> None:
         """Only the first SCRAPE_TOP_N rows are passed to _parse_story_row."""
-        from app.config import constants
-
         self._inject_rows(activities, count=constants.SCRAPE_TOP_N + 5)
         mock_story = MagicMock(spec=Story)
 
@@ -3048,7 +3337,7 @@ class TestNavigateToNextPageActivity:
         return BrowserActivities()
 
     @pytest.fixture()
-    def mock_info(self) -> MagicMock:
+    def mock_info(self) -> FakeActivityInfo:
         return _make_activity_info(
             activity_type="navigate_to_next_page_activity"
         )
@@ -3072,7 +3361,7 @@ class TestNavigateToNextPageActivity:
     async def test_returns_true_on_success(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity returns ``True`` when all navigation steps succeed."""
@@ -3089,7 +3378,7 @@ class TestNavigateToNextPageActivity:
     async def test_calls_ensure_browser_exactly_once(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity delegates browser initialisation to _ensure_browser exactly once."""
@@ -3108,12 +3397,10 @@ class TestNavigateToNextPageActivity:
     async def test_goto_called_with_correct_page_url(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """page.goto() is called with ``{HN_BASE_URL}?p={page_number}``."""
-        from app.config import constants
-
         activities._page = mock_page
 
         with (
@@ -3128,7 +3415,7 @@ class TestNavigateToNextPageActivity:
     async def test_goto_called_with_domcontentloaded(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """page.goto() uses ``wait_until='domcontentloaded'``."""
@@ -3145,12 +3432,10 @@ class TestNavigateToNextPageActivity:
     async def test_goto_called_with_configured_timeout(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """page.goto() uses ``BROWSER_TIMEOUT_MS`` for its timeout."""
-        from app.config import constants
-
         activities._page = mock_page
 
         with (
@@ -3164,7 +3449,7 @@ class TestNavigateToNextPageActivity:
     async def test_wait_for_selector_uses_athing_selector(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """wait_for_selector is called with '.athing' to confirm story rows exist."""
@@ -3181,7 +3466,7 @@ class TestNavigateToNextPageActivity:
     async def test_wait_for_selector_uses_attached_state(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """wait_for_selector uses ``state='attached'``."""
@@ -3198,7 +3483,7 @@ class TestNavigateToNextPageActivity:
     async def test_none_response_from_goto_is_accepted(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """A None response from page.goto() does not raise."""
         page = AsyncMock()
@@ -3222,7 +3507,7 @@ class TestNavigateToNextPageActivity:
     async def test_logs_starting_event(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity emits a 'pagination.starting' log event before navigating."""
@@ -3231,10 +3516,11 @@ class TestNavigateToNextPageActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.navigate_to_next_page_activity(2)
 
         log_calls = [c.args[0] for c in mock_logger.info.call_args_list]
@@ -3243,7 +3529,7 @@ class TestNavigateToNextPageActivity:
     async def test_logs_completed_event_on_success(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Activity emits a 'pagination.completed' log event on success."""
@@ -3252,10 +3538,11 @@ class TestNavigateToNextPageActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.navigate_to_next_page_activity(2)
 
         log_calls = [c.args[0] for c in mock_logger.info.call_args_list]
@@ -3264,7 +3551,7 @@ class TestNavigateToNextPageActivity:
     async def test_logger_bound_with_activity_context_fields(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
         mock_page: AsyncMock,
     ) -> None:
         """Logger is bound with workflow_id, run_id, activity_id, activity_name."""
@@ -3273,10 +3560,11 @@ class TestNavigateToNextPageActivity:
 
         with (
             patch("app.activities.browser.activity.info", return_value=mock_info),
-            patch("app.activities.browser.structlog") as mock_structlog,
+            patch(
+                "app.activities.browser.structlog.get_logger", return_value=mock_logger
+            ),
             patch.object(activities, "_ensure_browser", new_callable=AsyncMock),
         ):
-            mock_structlog.get_logger.return_value = mock_logger
             await activities.navigate_to_next_page_activity(2)
 
         bind_kwargs: dict[str, Any] = mock_logger.bind.call_args.kwargs
@@ -3292,7 +3580,7 @@ class TestNavigateToNextPageActivity:
     async def test_page_number_of_one_raises_non_retryable_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """page_number=1 raises ApplicationError(non_retryable=True)."""
         with (
@@ -3307,7 +3595,7 @@ class TestNavigateToNextPageActivity:
     async def test_page_number_of_zero_raises_non_retryable_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """page_number=0 raises ApplicationError(non_retryable=True)."""
         with (
@@ -3326,7 +3614,7 @@ class TestNavigateToNextPageActivity:
     async def test_reraises_application_error_from_ensure_browser(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """Non-retryable ApplicationError from _ensure_browser propagates as-is."""
         original_exc = ApplicationError(
@@ -3350,7 +3638,7 @@ class TestNavigateToNextPageActivity:
     async def test_reraises_browser_start_error_when_browser_unavailable(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """BrowserStartError from _ensure_browser propagates (retryable)."""
         with (
@@ -3372,7 +3660,7 @@ class TestNavigateToNextPageActivity:
     async def test_raises_navigation_error_on_goto_playwright_error(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """PlaywrightError from page.goto() is wrapped in BrowserNavigationError."""
         page = AsyncMock()
@@ -3392,7 +3680,7 @@ class TestNavigateToNextPageActivity:
     async def test_raises_navigation_error_on_http_error_response(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """An HTTP 4xx/5xx response from goto raises BrowserNavigationError."""
         response = MagicMock()
@@ -3415,7 +3703,7 @@ class TestNavigateToNextPageActivity:
     async def test_raises_navigation_error_on_unexpected_title(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """A page title not containing 'Hacker News' raises BrowserNavigationError."""
         response = MagicMock()
@@ -3438,7 +3726,7 @@ class TestNavigateToNextPageActivity:
     async def test_raises_navigation_error_when_no_story_rows_found(
         self,
         activities: BrowserActivities,
-        mock_info: MagicMock,
+        mock_info: FakeActivityInfo,
     ) -> None:
         """Timeout on wait_for_selector(.athing) raises BrowserNavigationError."""
         response = MagicMock()
@@ -0,0 +1,603 @@
+"""Unit tests for app.activities.persistence — PersistenceActivities.
+
+Coverage targets
+----------------
+- ``_classify_sqlalchemy_error``      — SQLAlchemy → domain exception mapping.
+- ``create_scrape_run_activity``      — scrape run creation entry-point.
+- ``upsert_stories_activity``         — story upsert entry-point.
+- ``update_story_comments_activity``  — top-comment patch entry-point.
+- ``update_scrape_run_activity``      — scrape run finalisation entry-point.
+
+Design decisions
+----------------
+- No database is touched. The module shares one ``PersistenceActivities``
+  whose repository methods are ``_AsyncStub``s; tests reach them through
+  ``create_mock``, ``upsert_mock``, ``update_comments_mock`` and
+  ``update_mock``, and an autouse fixture resets all four after each test.
+- ``activity.info`` is stubbed per test (via ``monkeypatch``) by the autouse
+  ``_patch_activity_info`` fixture in ``tests/activities/conftest.py``.
+- Log output is left to pytest's capture; no test asserts on it.
+- Every activity shares the same error contract, so each class checks it:
+  ``PersistenceValidationError`` → ``ApplicationError(non_retryable=True)``,
+  ``PersistenceTransientError`` → re-raised unchanged, and raw SQLAlchemy
+  errors → classified by ``_classify_sqlalchemy_error``.
+"""
+
+from __future__ import annotations
+
+import functools
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+import pytest
+import sqlalchemy.exc
+from temporalio.exceptions import ApplicationError
+
+from app.activities.persistence import PersistenceActivities, _classify_sqlalchemy_error
+from app.domain.exceptions import (
+    PersistenceError,
+    PersistenceTransientError,
+    PersistenceValidationError,
+)
+from app.domain.models import ScrapeRun, ScrapeRunStatus, Story
+
+# ---------------------------------------------------------------------------
+# Shared helpers / factories
+# ---------------------------------------------------------------------------
+
+
+_WORKFLOW_ID = "wf-test-001"
+
+# Fixed IDs: nothing here needs real randomness.
+_RUN_ID = uuid.UUID(int=0x1234)
+_ALT_RUN_ID = uuid.UUID(int=0x5678)
+
+# One instance of each SQLAlchemy error, shared by every test that needs it.
+# The code under test only inspects their type and message.
+_INTEGRITY = sqlalchemy.exc.IntegrityError("stmt", {}, Exception("violation"))
+_OPERATIONAL = sqlalchemy.exc.OperationalError("stmt", {}, Exception("conn refused"))
+_GENERIC = sqlalchemy.exc.SQLAlchemyError("unknown")
+_DATABASE = sqlalchemy.exc.DatabaseError("stmt", {}, Exception("db error"))
+_PROGRAMMING = sqlalchemy.exc.ProgrammingError("stmt", {}, Exception("syntax"))
+
+# What _classify_sqlalchemy_error must turn each error into.
+_CLASSIFICATION_CASES: tuple[
+    tuple[sqlalchemy.exc.SQLAlchemyError, type[PersistenceError]], ...
+] = (
+    # Constraint bug → non-retryable.
+    (_INTEGRITY, PersistenceValidationError),
+    # Connection / deadlock → retryable.
+    (_OPERATIONAL, PersistenceTransientError),
+    # Anything else falls through to the conservative retryable default.
+    (_GENERIC, PersistenceTransientError),
+    (_DATABASE, PersistenceTransientError),
+    (_PROGRAMMING, PersistenceTransientError),
+)
+
+# How each activity must surface a raw SQLAlchemy error leaking from its
+# repository: integrity violations are non-retryable, everything else retries.
+_sqlalchemy_wrapping = pytest.mark.parametrize(
+    ("exc", "outer"),
+    [
+        (_INTEGRITY, ApplicationError),
+        (_OPERATIONAL, PersistenceTransientError),
+        (_GENERIC, PersistenceTransientError),
+    ],
+    ids=["integrity", "operational", "generic"],
+)
+
+
+@functools.cache
+def _make_scrape_run(
+    *,
+    run_id: uuid.UUID = _RUN_ID,
+    status: ScrapeRunStatus = ScrapeRunStatus.PENDING,
+    workflow_id: str = _WORKFLOW_ID,
+    stories_scraped: Optional[int] = None,
+    error_message: Optional[str] = None,
+) -> ScrapeRun:
+    """Return a ScrapeRun as the repository would hand it back.
+
+    ScrapeRun is frozen, so one instance per distinct set of arguments is
+    built and then shared by every test that asks for it.
+    """
+    return ScrapeRun(
+        id=run_id,
+        workflow_id=workflow_id,
+        started_at=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
+        status=status,
+        stories_scraped=stories_scraped,
+        error_message=error_message,
+    )
+
+
+def _make_story(rank: int, *, hn_id: Optional[str] = None) -> Story:
+    """Return a minimal valid Story at the given front-page rank."""
+    return Story(
+        hn_id=hn_id or f"4000{rank}",
+        title=f"Test Story {rank}",
+        url=f"https://example.com/{rank}",
+        rank=rank,
+        points=100,
+        author="tester",
+        comments_count=10,
+    )
+
+
+# A full front page of distinct stories. Story is frozen, so one pool built at
+# import time can be shared by every test that needs a realistic batch.
+_STORIES_30: tuple[Story, ...] = tuple(
+    _make_story(rank, hn_id=str(rank)) for rank in range(1, 31)
+)
+
+
+_E = TypeVar("_E", bound=BaseException)
+
+
+async def _assert_raises(
+    coro_factory: Callable[[], Awaitable[object]], exc_cls: type[_E]
+) -> _E:
+    """Await ``coro_factory()``, assert it raises ``exc_cls`` and return the error."""
+    with pytest.raises(exc_cls) as exc_info:
+        await coro_factory()
+    return exc_info.value
+
+
+class _AsyncStub:
+    """Minimal async stand-in for a repository method.
+
+    The activities only ever await their repository with keyword arguments
+    and use the result or the raised error, so this records each call's
+    kwargs in ``calls`` and then raises ``side_effect`` or returns
+    ``return_value``. It skips the bookkeeping ``AsyncMock`` does per call.
+    """
+
+    __slots__ = ("return_value", "side_effect", "calls")
+
+    def __init__(self) -> None:
+        self.return_value: Any = None
+        self.side_effect: Optional[BaseException] = None
+        self.calls: list[dict[str, Any]] = []
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def reset(self) -> None:
+        self.return_value = None
+        self.side_effect = None
+        self.calls.clear()
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def activities() -> PersistenceActivities:
+    """One ``PersistenceActivities`` for the module, every repository call stubbed."""
+    activities = PersistenceActivities()
+    activities._scrape_run_repo.create = _AsyncStub()
+    activities._scrape_run_repo.update = _AsyncStub()
+    activities._story_repo.upsert_many = _AsyncStub()
+    activities._story_repo.update_top_comments = _AsyncStub()
+    return activities
+
+
+@pytest.fixture(autouse=True)
+def _reset_repo_mocks(activities: PersistenceActivities) -> Iterator[None]:
+    """Clear calls, return values and side effects left behind by a test."""
+    yield
+    for stub in (
+        activities._scrape_run_repo.create,
+        activities._scrape_run_repo.update,
+        activities._story_repo.upsert_many,
+        activities._story_repo.update_top_comments,
+    ):
+        stub.reset()
+
+
+@pytest.fixture()
+def create_mock(activities: PersistenceActivities) -> _AsyncStub:
+    return activities._scrape_run_repo.create
+
+
+@pytest.fixture()
+def update_mock(activities: PersistenceActivities) -> _AsyncStub:
+    return activities._scrape_run_repo.update
+
+
+@pytest.fixture()
+def upsert_mock(activities: PersistenceActivities) -> _AsyncStub:
+    return activities._story_repo.upsert_many
+
+
+@pytest.fixture()
+def update_comments_mock(activities: PersistenceActivities) -> _AsyncStub:
+    return activities._story_repo.update_top_comments
+
+
+# ===========================================================================
+# TestClassifySQLAlchemyError
+# ===========================================================================
+
+
+class TestClassifySQLAlchemyError:
+    """Tests for ``_classify_sqlalchemy_error``."""
+
+    def test_classification(self, subtests: pytest.Subtests) -> None:
+        """Each SQLAlchemy error type maps to the expected domain exception.
+
+        One test item walks every case; each case is its own subtest so a
+        failure still names the offending error type.
+        """
+        for exc, expected in _CLASSIFICATION_CASES:
+            with subtests.test(msg=type(exc).__name__):
+                result = _classify_sqlalchemy_error(exc)
+                assert isinstance(result, expected)
+                assert isinstance(result, PersistenceError)
+
+    def test_message_is_preserved(self) -> None:
+        """The domain exception carries the original error text."""
+        assert "conn refused" in str(_classify_sqlalchemy_error(_OPERATIONAL))
+
+
+# ===========================================================================
+# TestCreateScrapeRunActivity
+# ===========================================================================
+
+
+class TestCreateScrapeRunActivity:
+    """Tests for ``PersistenceActivities.create_scrape_run_activity``."""
+
+    async def test_returns_created_scrape_run(
+        self, activities: PersistenceActivities, create_mock: _AsyncStub
+    ) -> None:
+        """The ScrapeRun returned by the repository is returned unchanged."""
+        expected_run = _make_scrape_run()
+        create_mock.return_value = expected_run
+
+        result = await activities.create_scrape_run_activity(_WORKFLOW_ID)
+
+        assert result is expected_run
+
+    async def test_repo_called_with_correct_workflow_id(
+        self, activities: PersistenceActivities, create_mock: _AsyncStub
+    ) -> None:
+        """The target workflow ID is forwarded to the repository by keyword."""
+        create_mock.return_value = _make_scrape_run(workflow_id="specific-wf-id")
+
+        await activities.create_scrape_run_activity("specific-wf-id")
+
+        assert create_mock.calls == [{"workflow_id": "specific-wf-id"}]
+
+    async def test_validation_error_raises_non_retryable_application_error(
+        self, activities: PersistenceActivities, create_mock: _AsyncStub
+    ) -> None:
+        """PersistenceValidationError is wrapped in a non-retryable ApplicationError."""
+        create_mock.side_effect = PersistenceValidationError("bad row")
+
+        err = await _assert_raises(
+            lambda: activities.create_scrape_run_activity(_WORKFLOW_ID),
+            ApplicationError,
+        )
+
+        assert err.non_retryable is True
+        assert isinstance(err.__cause__, PersistenceValidationError)
+
+    async def test_transient_error_propagates_unchanged(
+        self, activities: PersistenceActivities, create_mock: _AsyncStub
+    ) -> None:
+        """PersistenceTransientError is re-raised as-is so Temporal retries it."""
+        original_exc = PersistenceTransientError("pool exhausted")
+        create_mock.side_effect = original_exc
+
+        err = await _assert_raises(
+            lambda: activities.create_scrape_run_activity(_WORKFLOW_ID),
+            PersistenceTransientError,
+        )
+
+        assert err is original_exc
+
+    @_sqlalchemy_wrapping
+    async def test_wraps_sqlalchemy_error(
+        self,
+        activities: PersistenceActivities,
+        create_mock: _AsyncStub,
+        exc: sqlalchemy.exc.SQLAlchemyError,
+        outer: type[Exception],
+    ) -> None:
+        """A raw SQLAlchemy error surfaces as the matching domain/Temporal error."""
+        create_mock.side_effect = exc
+
+        err = await _assert_raises(
+            lambda: activities.create_scrape_run_activity(_WORKFLOW_ID),
+            outer,
+        )
+
+        if outer is ApplicationError:
+            assert err.non_retryable is True
+
+
+# ===========================================================================
+# TestUpsertStoriesActivity
+# ===========================================================================
+
+
+class TestUpsertStoriesActivity:
+    """Tests for ``PersistenceActivities.upsert_stories_activity``."""
+
+    async def test_returns_upserted_count(
+        self, activities: PersistenceActivities, upsert_mock: _AsyncStub
+    ) -> None:
+        """The repository's affected-row count is returned."""
+        stories = [_make_story(1), _make_story(2)]
+        upsert_mock.return_value = 2
+
+        result = await activities.upsert_stories_activity(stories)
+
+        assert result == 2
+
+    async def test_repo_called_with_stories(
+        self, activities: PersistenceActivities, upsert_mock: _AsyncStub
+    ) -> None:
+        """The story list is forwarded to the repository by keyword."""
+        stories = [_make_story(1), _make_story(2)]
+        upsert_mock.return_value = 2
+
+        await activities.upsert_stories_activity(stories)
+
+        assert upsert_mock.calls == [{"stories": stories}]
+
+    async def test_partial_upsert_when_duplicates_exist(
+        self, activities: PersistenceActivities, upsert_mock: _AsyncStub
+    ) -> None:
+        """A repository count lower than len(stories) is returned as-is."""
+        upsert_mock.return_value = 25
+
+        result = await activities.upsert_stories_activity(list(_STORIES_30))
+
+        assert result == 25
+
+    async def test_empty_story_list(
+        self, activities: PersistenceActivities, upsert_mock: _AsyncStub
+    ) -> None:
+        """An empty list is passed through; the repository decides it is a no-op."""
+        upsert_mock.return_value = 0
+
+        result = await activities.upsert_stories_activity([])
+
+        assert result == 0
+
+    async def test_validation_error_raises_non_retryable_application_error(
+        self, activities: PersistenceActivities, upsert_mock: _AsyncStub
+    ) -> None:
+        """PersistenceValidationError is wrapped in a non-retryable ApplicationError."""
+        upsert_mock.side_effect = PersistenceValidationError("not-null violation")
+
+        err = await _assert_raises(
+            lambda: activities.upsert_stories_activity([_make_story(1)]),
+            ApplicationError,
+        )
+
+        assert err.non_retryable is True
+
+    async def test_transient_error_propagates_unchanged(
+        self, activities: PersistenceActivities, upsert_mock: _AsyncStub
+    ) -> None:
+        """PersistenceTransientError is re-raised as-is so Temporal retries it."""
+        original_exc = PersistenceTransientError("connection lost")
+        upsert_mock.side_effect = original_exc
+
+        err = await _assert_raises(
+            lambda: activities.upsert_stories_activity([_make_story(1)]),
+            PersistenceTransientError,
+        )
+
+        assert err is original_exc
+
+    @_sqlalchemy_wrapping
+    async def test_wraps_sqlalchemy_error(
+        self,
+        activities: PersistenceActivities,
+        upsert_mock: _AsyncStub,
+        exc: sqlalchemy.exc.SQLAlchemyError,
+        outer: type[Exception],
+    ) -> None:
+        """A raw SQLAlchemy error surfaces as the matching domain/Temporal error."""
+        upsert_mock.side_effect = exc
+
+        err = await _assert_raises(
+            lambda: activities.upsert_stories_activity([_make_story(1)]),
+            outer,
+        )
+
+        if outer is ApplicationError:
+            assert err.non_retryable is True
+
+
+# ===========================================================================
+# TestUpdateStoryCommentsActivity
+# ===========================================================================
+
+
+class TestUpdateStoryCommentsActivity:
+    """Tests for ``PersistenceActivities.update_story_comments_activity``."""
+
+    async def test_returns_updated_count(
+        self, activities: PersistenceActivities, update_comments_mock: _AsyncStub
+    ) -> None:
+        """The repository's updated-row count is returned."""
+        update_comments_mock.return_value = 2
+
+        result = await activities.update_story_comments_activity(
+            {"40001": "first!", "40002": None}
+        )
+
+        assert result == 2
+
+    async def test_repo_called_with_comment_map(
+        self, activities: PersistenceActivities, update_comments_mock: _AsyncStub
+    ) -> None:
+        """The hn_id → comment map, None comments included, is forwarded as-is."""
+        comment_map: dict[str, Optional[str]] = {"40001": "first!", "40002": None}
+        update_comments_mock.return_value = 2
+
+        await activities.update_story_comments_activity(comment_map)
+
+        assert update_comments_mock.calls == [{"comment_map": comment_map}]
+
+    async def test_validation_error_raises_non_retryable_application_error(
+        self, activities: PersistenceActivities, update_comments_mock: _AsyncStub
+    ) -> None:
+        """PersistenceValidationError is wrapped in a non-retryable ApplicationError."""
+        update_comments_mock.side_effect = PersistenceValidationError("bad row")
+
+        err = await _assert_raises(
+            lambda: activities.update_story_comments_activity({"40001": "first!"}),
+            ApplicationError,
+        )
+
+        assert err.non_retryable is True
+
+    async def test_transient_error_propagates_unchanged(
+        self, activities: PersistenceActivities, update_comments_mock: _AsyncStub
+    ) -> None:
+        """PersistenceTransientError is re-raised as-is so Temporal retries it."""
+        original_exc = PersistenceTransientError("deadlock detected")
+        update_comments_mock.side_effect = original_exc
+
+        err = await _assert_raises(
+            lambda: activities.update_story_comments_activity({"40001": "first!"}),
+            PersistenceTransientError,
+        )
+
+        assert err is original_exc
+
+    @_sqlalchemy_wrapping
+    async def test_wraps_sqlalchemy_error(
+        self,
+        activities: PersistenceActivities,
+        update_comments_mock: _AsyncStub,
+        exc: sqlalchemy.exc.SQLAlchemyError,
+        outer: type[Exception],
+    ) -> None:
+        """A raw SQLAlchemy error surfaces as the matching domain/Temporal error."""
+        update_comments_mock.side_effect = exc
+
+        err = await _assert_raises(
+            lambda: activities.update_story_comments_activity({"40001": "first!"}),
+            outer,
+        )
+
+        if outer is ApplicationError:
+            assert err.non_retryable is True
+
+
+# ===========================================================================
+# TestUpdateScrapeRunActivity
+# ===========================================================================
+
+
+class TestUpdateScrapeRunActivity:
+    """Tests for ``PersistenceActivities.update_scrape_run_activity``."""
+
+    async def test_returns_updated_scrape_run(
+        self, activities: PersistenceActivities, update_mock: _AsyncStub
+    ) -> None:
+        """The ScrapeRun returned by the repository is returned unchanged."""
+        expected_run = _make_scrape_run(
+            status=ScrapeRunStatus.COMPLETED, stories_scraped=30
+        )
+        update_mock.return_value = expected_run
+
+        result = await activities.update_scrape_run_activity(
+            expected_run.id, "COMPLETED", 30, None
+        )
+
+        assert result is expected_run
+
+    async def test_repo_called_with_status_enum_and_finish_time(
+        self, activities: PersistenceActivities, update_mock: _AsyncStub
+    ) -> None:
+        """The status string becomes a ScrapeRunStatus; a UTC finish time is added."""
+        run_id = _ALT_RUN_ID
+        update_mock.return_value = _make_scrape_run(
+            status=ScrapeRunStatus.FAILED, error_message="boom"
+        )
+
+        await activities.update_scrape_run_activity(run_id, "FAILED", None, "boom")
+
+        (kwargs,) = update_mock.calls
+        assert kwargs["run_id"] == run_id
+        assert kwargs["status"] is ScrapeRunStatus.FAILED
+        assert kwargs["stories_scraped"] is None
+        assert kwargs["error_message"] == "boom"
+        assert kwargs["finished_at"].tzinfo is not None
+
+    async def test_unknown_status_raises_value_error(
+        self, activities: PersistenceActivities, update_mock: _AsyncStub
+    ) -> None:
+        """An unknown status string fails before the repository is called."""
+        await _assert_raises(
+            lambda: activities.update_scrape_run_activity(_RUN_ID, "BOGUS", None, None),
+            ValueError,
+        )
+
+        assert update_mock.calls == []
+
+    async def test_row_not_found_raises_non_retryable_application_error(
+        self, activities: PersistenceActivities, update_mock: _AsyncStub
+    ) -> None:
+        """PersistenceValidationError (no matching row) is non-retryable."""
+        update_mock.side_effect = PersistenceValidationError("scrape run not found")
+
+        err = await _assert_raises(
+            lambda: activities.update_scrape_run_activity(
+                _RUN_ID, "COMPLETED", 30, None
+            ),
+            ApplicationError,
+        )
+
+        assert err.non_retryable is True
+
+    async def test_transient_error_propagates_unchanged(
+        self, activities: PersistenceActivities, update_mock: _AsyncStub
+    ) -> None:
+        """PersistenceTransientError is re-raised as-is so Temporal retries it."""
+        original_exc = PersistenceTransientError("connection lost")
+        update_mock.side_effect = original_exc
+
+        err = await _assert_raises(
+            lambda: activities.update_scrape_run_activity(
+                _RUN_ID, "COMPLETED", 30, None
+            ),
+            PersistenceTransientError,
+        )
+
+        assert err is original_exc
+
+    @_sqlalchemy_wrapping
+    async def test_wraps_sqlalchemy_error(
+        self,
+        activities: PersistenceActivities,
+        update_mock: _AsyncStub,
+        exc: sqlalchemy.exc.SQLAlchemyError,
+        outer: type[Exception],
+    ) -> None:
+        """A raw SQLAlchemy error surfaces as the matching domain/Temporal error."""
+        update_mock.side_effect = exc
+
+        err = await _assert_raises(
+            lambda: activities.update_scrape_run_activity(
+                _RUN_ID, "COMPLETED", 30, None
+            ),
+            outer,
+        )
+
+        if outer is ApplicationError:
+            assert err.non_retryable is True
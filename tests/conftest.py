@@ -11,13 +11,24 @@ for mandatory env vars.
 Rules:
 - Do NOT import from ``app.*`` here — constants must not be imported until
   after the env vars below have been applied.
-- Use ``setdefault`` so that real env vars set by CI/CD or the developer's
-  shell are not clobbered.
+- Only fill in keys that are missing so that real env vars set by CI/CD or
+  the developer's shell are not clobbered.
+
+Async tests run on uvloop when it is installed (see
+``pytest_asyncio_loop_factories`` below), and structlog is configured to drop
+every event before any processor runs.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import sys
+from typing import Callable
+
+import pytest
+import structlog
 
 # ---------------------------------------------------------------------------
 # Mandatory environment variables consumed by app.config.constants
@@ -47,7 +58,49 @@ _TEST_ENV: dict[str, str] = {
     "BROWSER_VIEWPORT_WIDTH": "1280",
     "BROWSER_VIEWPORT_HEIGHT": "800",
     "BROWSER_SCREENSHOT_DIR": "/tmp",
+    # Empty disables storage-state persistence so tests never touch disk.
+    "BROWSER_STORAGE_STATE_PATH": "",
 }
 
-for _key, _value in _TEST_ENV.items():
-    os.environ.setdefault(_key, _value)
+os.environ.update({k: v for k, v in _TEST_ENV.items() if k not in os.environ})
+
+
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+# Activities log through ``structlog.get_logger()``. No test reads that output
+# (tests that assert on logs inject a mock logger), so every level below
+# CRITICAL is a no-op and the rest goes to a logger that discards it.
+structlog.configure(
+    processors=[],
+    wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+    logger_factory=structlog.ReturnLoggerFactory(),
+    cache_logger_on_first_use=True,
+)
+
+
+# ---------------------------------------------------------------------------
+# Event loop
+# ---------------------------------------------------------------------------
+
+try:
+    import uvloop
+except ImportError:  # optional dev dependency; not available on Windows
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """Run every async test on a uvloop event loop.
+
+        Only defined when uvloop is importable; otherwise pytest-asyncio
+        keeps its stock asyncio loop. The hook needs pytest-asyncio 1.4.0 or
+        later; ``optionalhook`` keeps pytest from rejecting it when the
+        plugin is not loaded (e.g. ``-p no:asyncio``).
+        """
+        return {"uvloop": uvloop.new_event_loop}
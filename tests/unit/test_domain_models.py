@@ -0,0 +1,477 @@
+"""Unit tests for app.domain — models and exceptions.
+
+Coverage targets
+----------------
+- ``ScrapeRunStatus``  — members, string values, construction from strings.
+- ``Story``            — defaults, field constraints, immutability.
+- ``ScrapeRun``        — defaults, field constraints, immutability.
+- Domain exceptions    — hierarchy, catchability, message preservation.
+
+Design decisions
+----------------
+- Pure unit tests: no I/O, no Temporal, no database.
+- Tests that only read a default-constructed model share one session-scoped
+  instance (``default_story`` / ``default_scrape_run``). Both models are
+  frozen, so no test can alter what another test sees.
+- All module-level constants are immutable (frozen models, tuples,
+  ``MappingProxyType``), so the module is safe to split across pytest-xdist
+  workers (``-n auto``); each worker builds the shared instances once.
+- ``_make_story`` / ``_make_scrape_run`` are kept for tests that need
+  specific field values.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Final, Mapping
+
+import pytest
+from pydantic import ValidationError
+
+from app.domain.exceptions import (
+    BrowserError,
+    BrowserNavigationError,
+    BrowserStartError,
+    HackerNewsScraperError,
+    ParseError,
+    PersistenceError,
+    PersistenceTransientError,
+    PersistenceValidationError,
+)
+from app.domain.models import ScrapeRun, ScrapeRunStatus, Story
+
+# ---------------------------------------------------------------------------
+# Shared helpers / factories
+# ---------------------------------------------------------------------------
+
+
+# Built once at import; read-only so no test can leak a change into another.
+_STORY_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "hn_id": "40001",
+        "title": "Test Story",
+        "url": "https://example.com/story",
+        "rank": 1,
+        "points": 100,
+        "author": "tester",
+        "comments_count": 10,
+    }
+)
+_SCRAPE_RUN_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {"workflow_id": "wf-test-001"}
+)
+
+# Any non-default id will do; a fixed one avoids drawing from the OS RNG.
+_CUSTOM_STORY_ID: Final[uuid.UUID] = uuid.UUID(int=0x40001)
+
+_EXPECTED_STATUS_MEMBERS = frozenset({"PENDING", "RUNNING", "COMPLETED", "FAILED"})
+
+# Every leaf of the domain exception tree.
+_CONCRETE_EXCEPTIONS: tuple[type[HackerNewsScraperError], ...] = (
+    BrowserStartError,
+    BrowserNavigationError,
+    ParseError,
+    PersistenceTransientError,
+    PersistenceValidationError,
+)
+
+# (exception class, message) pairs for the message round-trip test.
+_MESSAGES: tuple[tuple[type[HackerNewsScraperError], str], ...] = (
+    (BrowserStartError, "Cannot launch Chromium: executable not found"),
+    (BrowserNavigationError, "Timeout navigating to https://news.ycombinator.com"),
+    (ParseError, "Missing title for story row 12"),
+    (PersistenceTransientError, "Connection pool exhausted"),
+    (PersistenceValidationError, "scrape_run not found for update"),
+    (ParseError, ""),
+)
+
+# Fixed timestamps; datetime is immutable, so tests can share them.
+_TS_CUSTOM = datetime(2026, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+_TS_COMPLETED = datetime(2026, 2, 15, 10, 5, 0, tzinfo=timezone.utc)
+_TS_FAILED = datetime(2026, 2, 15, 10, 2, 0, tzinfo=timezone.utc)
+
+
+def _make_story(**overrides: Any) -> Story:
+    """Return a validated Story, with any field replaced by ``overrides``."""
+    return Story(**{**_STORY_DEFAULTS, **overrides})
+
+
+def _make_scrape_run(**overrides: Any) -> ScrapeRun:
+    """Return a validated ScrapeRun, with any field replaced by ``overrides``."""
+    return ScrapeRun(**{**_SCRAPE_RUN_DEFAULTS, **overrides})
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def default_story() -> Story:
+    """One default Story per session; frozen, so safe to share."""
+    return _make_story()
+
+
+@pytest.fixture(scope="session")
+def default_scrape_run() -> ScrapeRun:
+    """One default ScrapeRun per session; frozen, so safe to share."""
+    return _make_scrape_run()
+
+
+# ===========================================================================
+# TestScrapeRunStatus
+# ===========================================================================
+
+
+class TestScrapeRunStatus:
+    """Tests for the ``ScrapeRunStatus`` enum."""
+
+    def test_all_four_members_exist(self) -> None:
+        assert frozenset(ScrapeRunStatus.__members__) == _EXPECTED_STATUS_MEMBERS
+
+    def test_values_are_plain_strings(self) -> None:
+        """Inheriting from str keeps JSON serialisation free of a custom encoder."""
+        for member in ScrapeRunStatus:
+            assert isinstance(member, str)
+            assert member.value == member.name
+
+    @pytest.mark.parametrize("name", sorted(_EXPECTED_STATUS_MEMBERS))
+    def test_construction_from_string(self, name: str) -> None:
+        assert ScrapeRunStatus(name) is ScrapeRunStatus.__members__[name]
+
+    def test_unknown_value_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ScrapeRunStatus("BOGUS")
+
+
+# ===========================================================================
+# TestStoryCreation
+# ===========================================================================
+
+
+class TestStoryCreation:
+    """Tests for ``Story`` construction and defaults."""
+
+    def test_required_fields_are_stored(self, default_story: Story) -> None:
+        assert default_story.hn_id == "40001"
+        assert default_story.title == "Test Story"
+        assert default_story.rank == 1
+        assert default_story.points == 100
+        assert default_story.author == "tester"
+        assert default_story.comments_count == 10
+
+    def test_auto_generates_uuid_id(self, default_story: Story) -> None:
+        assert isinstance(default_story.id, uuid.UUID)
+
+    def test_each_story_gets_its_own_id(self, default_story: Story) -> None:
+        assert _make_story().id != default_story.id
+
+    def test_custom_id_is_preserved(self) -> None:
+        assert _make_story(id=_CUSTOM_STORY_ID).id == _CUSTOM_STORY_ID
+
+    def test_url_is_optional(self) -> None:
+        """Ask HN / Show HN posts have no external URL."""
+        assert _make_story(url=None).url is None
+
+    def test_top_comment_defaults_to_none(self, default_story: Story) -> None:
+        assert default_story.top_comment is None
+
+    def test_scraped_at_defaults_to_utc_aware(self, default_story: Story) -> None:
+        assert default_story.scraped_at.tzinfo is not None
+        assert default_story.scraped_at.utcoffset() == timezone.utc.utcoffset(None)
+
+    def test_created_at_defaults_to_utc_aware(self, default_story: Story) -> None:
+        assert default_story.created_at.tzinfo is not None
+        assert default_story.created_at.utcoffset() == timezone.utc.utcoffset(None)
+
+    def test_custom_timestamps_are_accepted(self) -> None:
+        story = _make_story(scraped_at=_TS_CUSTOM, created_at=_TS_CUSTOM)
+        assert story.scraped_at == _TS_CUSTOM
+        assert story.created_at == _TS_CUSTOM
+
+    def test_missing_required_field_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            Story(
+                hn_id="40001",
+                title="No rank",
+                points=1,
+                author="a",
+                comments_count=0,
+            )
+
+    def test_extra_field_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            _make_story(unexpected="value")
+
+
+# ===========================================================================
+# TestStoryFieldConstraints
+# ===========================================================================
+
+
+class TestStoryFieldConstraints:
+    """Tests for the ``ge=`` bounds on Story's numeric fields."""
+
+    @pytest.mark.parametrize(
+        ("field", "value", "raises"),
+        [
+            ("rank", 0, True),
+            ("rank", -1, True),
+            ("rank", 1, False),
+            ("rank", 9999, False),
+            ("points", -1, True),
+            ("points", 0, False),
+            ("comments_count", -1, True),
+            ("comments_count", 0, False),
+        ],
+    )
+    def test_field_constraint(self, field: str, value: int, raises: bool) -> None:
+        if raises:
+            with pytest.raises(ValidationError):
+                _make_story(**{field: value})
+        else:
+            assert getattr(_make_story(**{field: value}), field) == value
+
+
+# ===========================================================================
+# TestStoryImmutability
+# ===========================================================================
+
+
+class TestStoryImmutability:
+    """Story is frozen: Temporal workflows must never mutate history objects."""
+
+    def test_cannot_set_title(self, default_story: Story) -> None:
+        with pytest.raises(ValidationError):
+            default_story.title = "changed"  # type: ignore[misc]
+
+    def test_cannot_set_rank(self, default_story: Story) -> None:
+        with pytest.raises(ValidationError):
+            default_story.rank = 2  # type: ignore[misc]
+
+    def test_cannot_set_top_comment(self, default_story: Story) -> None:
+        with pytest.raises(ValidationError):
+            default_story.top_comment = "first!"  # type: ignore[misc]
+
+    def test_model_copy_returns_updated_instance(self, default_story: Story) -> None:
+        updated = default_story.model_copy(update={"top_comment": "first!"})
+        assert updated.top_comment == "first!"
+        assert default_story.top_comment is None
+
+
+# ===========================================================================
+# TestScrapeRunCreation
+# ===========================================================================
+
+
+class TestScrapeRunCreation:
+    """Tests for ``ScrapeRun`` construction and defaults."""
+
+    def test_status_defaults_to_pending(self, default_scrape_run: ScrapeRun) -> None:
+        assert default_scrape_run.status is ScrapeRunStatus.PENDING
+
+    def test_auto_generates_uuid_id(self, default_scrape_run: ScrapeRun) -> None:
+        assert isinstance(default_scrape_run.id, uuid.UUID)
+
+    def test_started_at_defaults_to_utc_aware(
+        self, default_scrape_run: ScrapeRun
+    ) -> None:
+        assert default_scrape_run.started_at.tzinfo is not None
+
+    def test_optional_fields_default_to_none(
+        self, default_scrape_run: ScrapeRun
+    ) -> None:
+        assert default_scrape_run.finished_at is None
+        assert default_scrape_run.stories_scraped is None
+        assert default_scrape_run.error_message is None
+
+    def test_status_accepts_plain_string(self) -> None:
+        assert _make_scrape_run(status="RUNNING").status is ScrapeRunStatus.RUNNING
+
+    def test_completed_run_with_all_fields(self) -> None:
+        run = _make_scrape_run(
+            status=ScrapeRunStatus.COMPLETED,
+            finished_at=_TS_COMPLETED,
+            stories_scraped=30,
+        )
+        assert run.status is ScrapeRunStatus.COMPLETED
+        assert run.finished_at == _TS_COMPLETED
+        assert run.stories_scraped == 30
+        assert run.error_message is None
+
+    def test_failed_run_with_error_message(self) -> None:
+        run = _make_scrape_run(
+            status=ScrapeRunStatus.FAILED,
+            finished_at=_TS_FAILED,
+            error_message="Browser failed to start",
+        )
+        assert run.status is ScrapeRunStatus.FAILED
+        assert run.finished_at == _TS_FAILED
+        assert run.error_message == "Browser failed to start"
+
+    def test_model_copy_preserves_id(self, default_scrape_run: ScrapeRun) -> None:
+        updated = default_scrape_run.model_copy(
+            update={"status": ScrapeRunStatus.RUNNING}
+        )
+        assert updated.id == default_scrape_run.id
+        assert updated.status is ScrapeRunStatus.RUNNING
+        assert default_scrape_run.status is ScrapeRunStatus.PENDING
+
+
+# ===========================================================================
+# TestScrapeRunFieldConstraints
+# ===========================================================================
+
+
+class TestScrapeRunFieldConstraints:
+    """Tests for the bounds and enum check on ScrapeRun's fields."""
+
+    def test_negative_stories_scraped_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            _make_scrape_run(stories_scraped=-1)
+
+    def test_zero_stories_scraped_is_valid(self) -> None:
+        assert _make_scrape_run(stories_scraped=0).stories_scraped == 0
+
+    def test_large_stories_scraped_is_valid(self) -> None:
+        assert _make_scrape_run(stories_scraped=10_000).stories_scraped == 10_000
+
+    def test_unknown_status_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            _make_scrape_run(status="BOGUS")
+
+    def test_extra_field_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            _make_scrape_run(unexpected="value")
+
+
+# ===========================================================================
+# TestScrapeRunImmutability
+# ===========================================================================
+
+
+class TestScrapeRunImmutability:
+    """ScrapeRun is frozen; updates go through ``model_copy``."""
+
+    def test_cannot_set_status(self, default_scrape_run: ScrapeRun) -> None:
+        with pytest.raises(ValidationError):
+            default_scrape_run.status = ScrapeRunStatus.FAILED  # type: ignore[misc]
+
+    def test_cannot_set_finished_at(self, default_scrape_run: ScrapeRun) -> None:
+        with pytest.raises(ValidationError):
+            default_scrape_run.finished_at = datetime.now(  # type: ignore[misc]
+                tz=timezone.utc
+            )
+
+    def test_cannot_set_stories_scraped(self, default_scrape_run: ScrapeRun) -> None:
+        with pytest.raises(ValidationError):
+            default_scrape_run.stories_scraped = 30  # type: ignore[misc]
+
+
+# ===========================================================================
+# TestExceptionHierarchy
+# ===========================================================================
+
+
+class TestExceptionHierarchy:
+    """The exception tree documented in ``app.domain.exceptions``."""
+
+    @pytest.mark.parametrize(
+        ("child", "parent"),
+        [
+            (HackerNewsScraperError, Exception),
+            (BrowserError, HackerNewsScraperError),
+            (BrowserStartError, BrowserError),
+            (BrowserStartError, HackerNewsScraperError),
+            (BrowserNavigationError, BrowserError),
+            (BrowserNavigationError, HackerNewsScraperError),
+            (ParseError, HackerNewsScraperError),
+            (PersistenceError, HackerNewsScraperError),
+            (PersistenceTransientError, PersistenceError),
+            (PersistenceTransientError, HackerNewsScraperError),
+            (PersistenceValidationError, PersistenceError),
+            (PersistenceValidationError, HackerNewsScraperError),
+        ],
+        ids=lambda cls: cls.__name__,
+    )
+    def test_inheritance(self, child: type[Exception], parent: type[Exception]) -> None:
+        assert issubclass(child, parent)
+
+    @pytest.mark.parametrize(
+        ("child", "other"),
+        [
+            (ParseError, BrowserError),
+            (BrowserStartError, PersistenceError),
+            (BrowserNavigationError, PersistenceError),
+            (PersistenceTransientError, BrowserError),
+            (PersistenceValidationError, BrowserError),
+            # Transient and validation errors are siblings.
+            (PersistenceTransientError, PersistenceValidationError),
+            (PersistenceValidationError, PersistenceTransientError),
+        ],
+        ids=lambda cls: cls.__name__,
+    )
+    def test_not_subclass(self, child: type[Exception], other: type[Exception]) -> None:
+        assert not issubclass(child, other)
+
+
+# ===========================================================================
+# TestExceptionCatchability
+# ===========================================================================
+
+
+class TestExceptionCatchability:
+    """Each error can be caught through the base classes callers rely on."""
+
+    @pytest.mark.parametrize(
+        ("exc_cls", "catch_as"),
+        [
+            (BrowserStartError, BrowserError),
+            (BrowserNavigationError, BrowserError),
+            (PersistenceTransientError, PersistenceError),
+            (PersistenceValidationError, PersistenceError),
+        ],
+        ids=lambda cls: cls.__name__,
+    )
+    def test_catchable(
+        self, exc_cls: type[Exception], catch_as: type[Exception]
+    ) -> None:
+        with pytest.raises(catch_as):
+            raise exc_cls("test")
+
+    @pytest.mark.parametrize(
+        "exc_cls", _CONCRETE_EXCEPTIONS, ids=lambda cls: cls.__name__
+    )
+    def test_concrete_caught_as_root(
+        self, exc_cls: type[HackerNewsScraperError]
+    ) -> None:
+        with pytest.raises(HackerNewsScraperError):
+            raise exc_cls("test")
+
+
+# ===========================================================================
+# TestExceptionMessages
+# ===========================================================================
+
+
+class TestExceptionMessages:
+    """Messages pass through unchanged; activities log them verbatim."""
+
+    @pytest.mark.parametrize(
+        ("exc_cls", "msg"),
+        _MESSAGES,
+        ids=[
+            "browser_start",
+            "browser_navigation",
+            "parse",
+            "persistence_transient",
+            "persistence_validation",
+            "empty",
+        ],
+    )
+    def test_message_preserved(
+        self, exc_cls: type[HackerNewsScraperError], msg: str
+    ) -> None:
+        assert str(exc_cls(msg)) == msg
@@ -0,0 +1,163 @@
+"""Unit tests for app.infra.repositories — StoryRepository SQL.
+
+Coverage targets
+----------------
+- ``StoryRepository.upsert_many``         — ON CONFLICT clause.
+- ``StoryRepository.update_top_comments`` — UPDATE ... FROM (VALUES ...).
+
+Design decisions
+----------------
+- No database: ``get_connection`` is replaced with a fake that records each
+  executed statement, which is then compiled with the PostgreSQL dialect.
+  Assertions are on the SQL text and bound parameters, so they pin down the
+  statement shape the repository relies on without a running Postgres.
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+import app.infra.repositories as repositories_module
+from app.domain.models import Story
+from app.infra.repositories import StoryRepository
+
+_ROWCOUNT = 2
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResult:
+    """The part of a SQLAlchemy ``CursorResult`` the repository reads."""
+
+    rowcount: int
+
+
+@dataclass(slots=True)
+class FakeConnection:
+    """Records executed statements instead of sending them to a database."""
+
+    statements: list[ClauseElement] = field(default_factory=list)
+
+    async def execute(self, stmt: ClauseElement) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult(rowcount=_ROWCOUNT)
+
+
+def _compile(stmt: ClauseElement) -> tuple[str, dict[str, Any]]:
+    """Return ``stmt`` as PostgreSQL SQL text and its bound parameters."""
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.fixture()
+def conn(monkeypatch: pytest.MonkeyPatch) -> FakeConnection:
+    fake = FakeConnection()
+
+    @asynccontextmanager
+    async def _get_connection() -> AsyncIterator[FakeConnection]:
+        yield fake
+
+    monkeypatch.setattr(repositories_module, "get_connection", _get_connection)
+    return fake
+
+
+@pytest.fixture()
+def repo() -> StoryRepository:
+    return StoryRepository()
+
+
+# ===========================================================================
+# TestUpsertMany
+# ===========================================================================
+
+
+class TestUpsertMany:
+    """Tests for ``StoryRepository.upsert_many``."""
+
+    async def test_empty_list_skips_the_database(
+        self, repo: StoryRepository, conn: FakeConnection
+    ) -> None:
+        assert await repo.upsert_many([]) == 0
+        assert conn.statements == []
+
+    async def test_conflict_keeps_stored_comment_when_new_one_is_null(
+        self, repo: StoryRepository, conn: FakeConnection
+    ) -> None:
+        story = Story(
+            hn_id="40001",
+            title="Test Story",
+            rank=1,
+            points=100,
+            author="tester",
+            comments_count=10,
+        )
+
+        assert await repo.upsert_many([story]) == _ROWCOUNT
+
+        (stmt,) = conn.statements
+        sql, _ = _compile(stmt)
+        assert "ON CONFLICT ON CONSTRAINT uq_stories_hn_id DO UPDATE" in sql
+        assert (
+            "top_comment = coalesce(excluded.top_comment, stories.top_comment)"
+            in sql
+        )
+        # id and created_at keep their first-insert values.
+        set_clause = sql.split("DO UPDATE SET", 1)[1]
+        assert re.findall(r"(\w+) = ", set_clause) == [
+            "title",
+            "url",
+            "rank",
+            "points",
+            "author",
+            "comments_count",
+            "top_comment",
+            "scraped_at",
+        ]
+
+
+# ===========================================================================
+# TestUpdateTopComments
+# ===========================================================================
+
+
+class TestUpdateTopComments:
+    """Tests for ``StoryRepository.update_top_comments``."""
+
+    async def test_batch_is_one_update_from_values(
+        self, repo: StoryRepository, conn: FakeConnection
+    ) -> None:
+        assert await repo.update_top_comments({"1": "first", "2": "second"}) == (
+            _ROWCOUNT
+        )
+
+        (stmt,) = conn.statements
+        sql, params = _compile(stmt)
+        assert sql.startswith("UPDATE stories SET top_comment=v.top_comment FROM (")
+        assert "AS v (hn_id, top_comment) WHERE stories.hn_id = v.hn_id" in sql
+        assert list(params.values()) == ["1", "first", "2", "second"]
+
+    async def test_none_comments_are_not_written(
+        self, repo: StoryRepository, conn: FakeConnection
+    ) -> None:
+        """A missing comment must not wipe one stored by an earlier run."""
+        await repo.update_top_comments({"1": "first", "2": None, "3": "third"})
+
+        (stmt,) = conn.statements
+        _, params = _compile(stmt)
+        assert list(params.values()) == ["1", "first", "3", "third"]
+
+    @pytest.mark.parametrize("comment_map", [{}, {"1": None, "2": None}])
+    async def test_nothing_to_write_skips_the_database(
+        self,
+        repo: StoryRepository,
+        conn: FakeConnection,
+        comment_map: dict[str, str | None],
+    ) -> None:
+        assert await repo.update_top_comments(comment_map) == 0
+        assert conn.statements == []
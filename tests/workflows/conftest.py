@@ -0,0 +1,36 @@
+"""Shared fixtures for the workflow tests.
+
+Starting Temporal's time-skipping test server is by far the most expensive
+step in these tests, so one environment is started per session and shared.
+Tests isolate themselves by running their Worker on a unique task queue.
+
+Set ``TEMPORAL_TEST_SERVER_PATH`` to an already-downloaded test server binary
+(e.g. a cached copy in CI) to skip the download on startup.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import AsyncIterator
+
+import pytest_asyncio
+from temporalio.contrib.pydantic import pydantic_data_converter
+from temporalio.testing import WorkflowEnvironment
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def workflow_env() -> AsyncIterator[WorkflowEnvironment]:
+    """One time-skipping ``WorkflowEnvironment`` for the whole session.
+
+    The client it exposes is bound to the session event loop, so tests using
+    it must be marked ``@pytest.mark.asyncio(loop_scope="session")``.
+
+    Under pytest-xdist every worker process has its own session, and so its
+    own test server on its own free port. Per-test ``tq-<uuid>`` task queues
+    keep Workers apart within a worker, so ``-n auto`` needs no extra setup.
+    """
+    async with await WorkflowEnvironment.start_time_skipping(
+        data_converter=pydantic_data_converter,
+        test_server_existing_path=os.environ.get("TEMPORAL_TEST_SERVER_PATH"),
+    ) as env:
+        yield env
@@ -2,15 +2,22 @@
 
 Coverage targets
 ----------------
-- Happy path: workflow completes successfully
+- Happy path: workflow completes successfully for top_n=1, 30 and 100
+- Per-page persistence: stories_scraped sums the per-page upsert counts
 - Failure before run creation: workflow fails, no status update
 - Failure after run creation: workflow updates run to FAILED
-- Edge cases: top_n=1, top_n=100, empty stories
+- Comment writes: background batches, and the salvage write on failure
+- Edge cases: empty stories, upsert count below scraped count, stories
+  repeated across pages
 - Activity retry scenarios
 
 Design decisions
 ----------------
 - Use Temporal's test environment for deterministic replay testing
+- One time-skipping ``WorkflowEnvironment`` is shared by the whole session
+  (``workflow_env`` in ``tests/workflows/conftest.py``); each test starts its
+  own Worker on a fresh ``tq-<uuid>`` task queue so activity registrations
+  never leak between tests. Tests that use it run on the session event loop.
 - Mock all activities to test workflow orchestration in isolation
 - Activities are mocked using the Temporal test framework's activity mocking
 - Tests verify correct activity call order and parameters
@@ -28,18 +35,19 @@ Each test class focuses on a specific aspect:
 from __future__ import annotations
 
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any, Awaitable, Callable, Sequence
 
 import pytest
 from temporalio import activity
 from temporalio.client import WorkflowFailureError
+from temporalio.exceptions import ApplicationError
 from temporalio.testing import WorkflowEnvironment
 from temporalio.worker import Worker
 
 from app.domain.models import ScrapeRun, ScrapeRunStatus, Story
-from app.workflows.scraper import ScrapeHackerNewsWorkflow
+from app.workflows.scraper import COMMENT_FLUSH_BATCH_SIZE, ScrapeHackerNewsWorkflow
 
 
 # ---------------------------------------------------------------------------
@@ -47,13 +55,46 @@ from app.workflows.scraper import ScrapeHackerNewsWorkflow
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+_FIXED_DT = datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _make_stories(n: int) -> list[Story]:
+    """Return ``n`` stories ranked 1..n.
+
+    The field values are known to be valid, so ``model_construct`` skips
+    validation; the workflow still validates them when it decodes the
+    activity result.
+    """
+    return [
+        Story.model_construct(
+            id=uuid.UUID(int=i),
+            hn_id=f"story-{i}",
+            title=f"Test Story {i}",
+            url=f"https://example.com/story-{i}",
+            rank=i,
+            points=100 + i,
+            author=f"author{i}",
+            comments_count=i,
+            top_comment=None,
+            scraped_at=_FIXED_DT,
+            created_at=_FIXED_DT,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+# Every fixture below is frozen and built from fixed values, so one instance per
+# module is shared by all tests that request it. The values are known-valid
+# literals, so they skip validation via ``model_construct``.
+
+
+@pytest.fixture(scope="module")
 def mock_scrape_run() -> ScrapeRun:
     """Return a sample ScrapeRun in PENDING status."""
-    return ScrapeRun(
-        id=uuid.uuid4(),
+    return ScrapeRun.model_construct(
+        id=uuid.UUID(int=0x5C4A9E),
         workflow_id="test-workflow-001",
-        started_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
+        started_at=_FIXED_DT,
         finished_at=None,
         status=ScrapeRunStatus.PENDING,
         stories_scraped=None,
@@ -61,10 +102,10 @@ def mock_scrape_run() -> ScrapeRun:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_completed_scrape_run(mock_scrape_run: ScrapeRun) -> ScrapeRun:
     """Return a sample ScrapeRun in COMPLETED status."""
-    return ScrapeRun(
+    return ScrapeRun.model_construct(
         id=mock_scrape_run.id,
         workflow_id=mock_scrape_run.workflow_id,
         started_at=mock_scrape_run.started_at,
@@ -75,10 +116,10 @@ def mock_completed_scrape_run(mock_scrape_run: ScrapeRun) -> ScrapeRun:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_failed_scrape_run(mock_scrape_run: ScrapeRun) -> ScrapeRun:
     """Return a sample ScrapeRun in FAILED status."""
-    return ScrapeRun(
+    return ScrapeRun.model_construct(
         id=mock_scrape_run.id,
         workflow_id=mock_scrape_run.workflow_id,
         started_at=mock_scrape_run.started_at,
@@ -89,67 +130,154 @@ def mock_failed_scrape_run(mock_scrape_run: ScrapeRun) -> ScrapeRun:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mock_failed_scrape_run_dump(mock_failed_scrape_run: ScrapeRun) -> dict[str, Any]:
+    """``mock_failed_scrape_run`` as a mock activity returns it, dumped once."""
+    return mock_failed_scrape_run.model_dump()
+
+
+@pytest.fixture(scope="module")
 def mock_stories() -> list[Story]:
     """Return a sample list of scraped stories."""
-    return [
-        Story(
-            id=uuid.uuid4(),
-            hn_id=f"story-{i}",
-            title=f"Test Story {i}",
-            url=f"https://example.com/story-{i}",
-            rank=i,
-            points=100 + i * 10,
-            author=f"author{i}",
-            comments_count=i * 5,
-            scraped_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-            created_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-        )
-        for i in range(1, 31)  # 30 stories
-    ]
+    return _make_stories(30)
+
+
+# Mock activities with no per-test state are decorated once at import and
+# shared by every Worker; _build_activity_mocks only defines the rest.
+
+
+@activity.defn(name="start_playwright_activity")
+async def _start_playwright_noop() -> None:
+    """Mock: start browser (no-op)."""
+
+
+@activity.defn(name="navigate_to_hacker_news_activity")
+async def _navigate_to_hacker_news_noop() -> None:
+    """Mock: navigate to HN (no-op)."""
+
+
+@activity.defn(name="navigate_to_next_page_activity")
+async def _navigate_to_next_page_noop(page_number: int) -> bool:
+    """Mock: navigate to next page (no-op)."""
+    return True
+
+
+@activity.defn(name="scrape_top_comment_activity")
+async def _scrape_top_comment_stub(hn_id: str) -> str | None:
+    """Mock: return a top comment derived from the story's hn_id."""
+    return _comment_for(hn_id)
+
+
+@activity.defn(name="update_story_comments_activity")
+async def _update_story_comments_noop(comment_map: dict[str, str | None]) -> int:
+    """Mock: patch top comments and return count."""
+    return len(comment_map)
 
 
-def _create_activity_mocks(
-    scrape_run: ScrapeRun,
-    completed_run: ScrapeRun,
-    stories: list[Story],
-    upserted_count: int = 30,
+def _comment_for(hn_id: str) -> str:
+    """The top comment the default comment mock returns for ``hn_id``."""
+    return f"Top comment on {hn_id}"
+
+
+# An override for one mock activity: called with the activity's own arguments,
+# its return value (or exception) becomes the activity's result.
+_ActivityOverride = Callable[..., Awaitable[Any]]
+
+
+def _build_activity_mocks(
+    *,
+    scrape_run: ScrapeRun | None = None,
+    completed_run: ScrapeRun | None = None,
+    stories: Sequence[Story] = (),
+    upserted_count: int = 0,
+    create: _ActivityOverride | None = None,
+    start: _ActivityOverride | None = None,
+    navigate: _ActivityOverride | None = None,
+    next_page: _ActivityOverride | None = None,
+    scrape: _ActivityOverride | None = None,
+    upsert: _ActivityOverride | None = None,
+    comment: _ActivityOverride | None = None,
+    update_comments: _ActivityOverride | None = None,
+    update: _ActivityOverride | None = None,
 ) -> list[Any]:
-    """Create mock activity implementations for the happy path.
+    """Create mock activity implementations for one workflow run.
 
     Returns a list of decorated activity functions that can be registered
-    with the Temporal test worker.
+    with the Temporal test worker. By default every activity succeeds:
+    create/update return ``scrape_run`` / ``completed_run``, scraping returns
+    ``stories`` and the upsert reports ``upserted_count``. Tests pass an
+    override only for the activities whose behaviour they change.
+
+    Every default return value is dumped once up front rather than on each
+    activity invocation (including retries).
     """
+    run_dumped = scrape_run.model_dump() if scrape_run is not None else {}
+    completed_dumped = completed_run.model_dump() if completed_run is not None else {}
+    stories_dumped = [story.model_dump() for story in stories]
+
     @activity.defn(name="create_scrape_run_activity")
     async def create_scrape_run_activity(workflow_id: str) -> dict[str, Any]:
         """Mock: create scrape run record."""
-        return scrape_run.model_dump()
+        if create is not None:
+            return await create(workflow_id)
+        return run_dumped
 
-    @activity.defn(name="start_playwright_activity")
-    async def start_playwright_activity() -> None:
-        """Mock: start browser (no-op)."""
-        pass
+    start_playwright_activity = _start_playwright_noop
+    if start is not None:
+
+        @activity.defn(name="start_playwright_activity")
+        async def start_playwright_activity() -> None:
+            """Mock: start browser via the test's override."""
+            await start()
+
+    navigate_to_hacker_news_activity = _navigate_to_hacker_news_noop
+    if navigate is not None:
+
+        @activity.defn(name="navigate_to_hacker_news_activity")
+        async def navigate_to_hacker_news_activity() -> None:
+            """Mock: navigate to HN via the test's override."""
+            await navigate()
 
-    @activity.defn(name="navigate_to_hacker_news_activity")
-    async def navigate_to_hacker_news_activity() -> None:
-        """Mock: navigate to HN (no-op)."""
-        pass
+    navigate_to_next_page_activity = _navigate_to_next_page_noop
+    if next_page is not None:
 
-    @activity.defn(name="navigate_to_next_page_activity")
-    async def navigate_to_next_page_activity(page_number: int) -> bool:
-        """Mock: navigate to next page (no-op)."""
-        return True
+        @activity.defn(name="navigate_to_next_page_activity")
+        async def navigate_to_next_page_activity(page_number: int) -> bool:
+            """Mock: navigate to the next page via the test's override."""
+            return await next_page(page_number)
 
     @activity.defn(name="scrape_urls_activity")
     async def scrape_urls_activity(top_n: int) -> list[dict[str, Any]]:
         """Mock: scrape stories and return as list of dicts."""
-        return [story.model_dump() for story in stories]
+        if scrape is not None:
+            return await scrape(top_n)
+        return stories_dumped
 
     @activity.defn(name="upsert_stories_activity")
     async def upsert_stories_activity(stories_data: list[dict[str, Any]]) -> int:
         """Mock: persist stories and return count."""
+        if upsert is not None:
+            return await upsert(stories_data)
         return upserted_count
 
+    scrape_top_comment_activity = _scrape_top_comment_stub
+    if comment is not None:
+
+        @activity.defn(name="scrape_top_comment_activity")
+        async def scrape_top_comment_activity(hn_id: str) -> str | None:
+            """Mock: scrape a top comment via the test's override."""
+            return await comment(hn_id)
+
+    update_story_comments_activity = _update_story_comments_noop
+    if update_comments is not None:
+
+        @activity.defn(name="update_story_comments_activity")
+        async def update_story_comments_activity(
+            comment_map: dict[str, str | None],
+        ) -> int:
+            """Mock: patch top comments via the test's override."""
+            return await update_comments(comment_map)
+
     @activity.defn(name="update_scrape_run_activity")
     async def update_scrape_run_activity(
         run_id: uuid.UUID,
@@ -158,7 +286,9 @@ def _create_activity_mocks(
         error_message: str | None,
     ) -> dict[str, Any]:
         """Mock: update scrape run status."""
-        return completed_run.model_dump()
+        if update is not None:
+            return await update(run_id, status, stories_scraped, error_message)
+        return completed_dumped
 
     return [
         create_scrape_run_activity,
@@ -167,149 +297,171 @@ def _create_activity_mocks(
         navigate_to_next_page_activity,
         scrape_urls_activity,
         upsert_stories_activity,
+        scrape_top_comment_activity,
+        update_story_comments_activity,
         update_scrape_run_activity,
     ]
 
 
+@dataclass
+class _FakePages:
+    """HN's result pages as the mocked browser activities see them.
+
+    ``next_page`` and ``scrape`` stand in for navigate_to_next_page_activity
+    and scrape_urls_activity: scraping returns the current page cut to the
+    requested ``top_n``, and every requested ``top_n`` is kept in
+    ``requested``.
+    """
+
+    pages: Sequence[Sequence[Story]]
+    requested: list[int] = field(default_factory=list)
+    current: int = 0
+
+    async def next_page(self, page_number: int) -> bool:
+        self.current = page_number - 1
+        return self.current < len(self.pages)
+
+    async def scrape(self, top_n: int) -> list[dict[str, Any]]:
+        self.requested.append(top_n)
+        if self.current >= len(self.pages):
+            return []
+        return [story.model_dump() for story in self.pages[self.current][:top_n]]
+
+
+# (status, stories_scraped, error_message) of one update_scrape_run_activity call.
+_RunUpdate = tuple[str, int | None, str | None]
+
+
+def _recording_update(
+    calls: list[_RunUpdate], result: ScrapeRun
+) -> _ActivityOverride:
+    """Return an ``update`` override that records its arguments in ``calls``.
+
+    The mock returns ``result`` whatever it is passed, so tests assert on the
+    recorded arguments to see what the workflow actually reported.
+    """
+    dumped = result.model_dump()
+
+    async def update(
+        run_id: uuid.UUID,
+        status: str,
+        stories_scraped: int | None,
+        error_message: str | None,
+    ) -> dict[str, Any]:
+        calls.append((status, stories_scraped, error_message))
+        return dumped
+
+    return update
+
+
+async def _run_workflow(
+    env: WorkflowEnvironment,
+    activities: list[Any],
+    top_n: int,
+    workflow_id: str,
+) -> ScrapeRun:
+    """Run ScrapeHackerNewsWorkflow once against ``activities`` and return its result.
+
+    The Worker gets a task queue of its own, so several tests can share one
+    ``WorkflowEnvironment`` without picking up each other's activities.
+    """
+    task_queue = f"tq-{uuid.uuid4()}"
+    async with Worker(
+        env.client,
+        task_queue=task_queue,
+        workflows=[ScrapeHackerNewsWorkflow],
+        activities=activities,
+    ):
+        return await env.client.execute_workflow(
+            ScrapeHackerNewsWorkflow.run,
+            args=[top_n],
+            id=workflow_id,
+            task_queue=task_queue,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Test Cases: Happy Path
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestWorkflowHappyPath:
     """Test successful workflow execution scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_completes_successfully(
+    @pytest.mark.parametrize("top_n", [1, 30, 100])
+    async def test_workflow_completes(
         self,
+        top_n: int,
+        workflow_env: WorkflowEnvironment,
         mock_scrape_run: ScrapeRun,
         mock_completed_scrape_run: ScrapeRun,
-        mock_stories: list[Story],
     ):
-        """Verify workflow completes and returns COMPLETED ScrapeRun."""
+        """Verify workflow completes and returns COMPLETED ScrapeRun for each top_n."""
         # Arrange
-        activity_mocks = _create_activity_mocks(
-            mock_scrape_run, mock_completed_scrape_run, mock_stories, upserted_count=30
+        completed_run = mock_completed_scrape_run.model_copy(
+            update={"stories_scraped": top_n}
         )
-
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act
-                result = await env.client.execute_workflow(
-                    ScrapeHackerNewsWorkflow.run,
-                    args=[30],  # top_n
-                    id="test-workflow-happy-path",
-                    task_queue="test-task-queue",
-                )
-
-                # Assert
-                assert isinstance(result, ScrapeRun)
-                assert result.status == ScrapeRunStatus.COMPLETED
-                assert result.stories_scraped == 30
-                assert result.error_message is None
-                assert result.finished_at is not None
-
-    @pytest.mark.asyncio
-    async def test_workflow_with_minimum_top_n(
-        self,
-        mock_scrape_run: ScrapeRun,
-        mock_completed_scrape_run: ScrapeRun,
-    ):
-        """Verify workflow handles top_n=1 correctly."""
-        # Arrange
-        single_story = [
-            Story(
-                id=uuid.uuid4(),
-                hn_id="story-1",
-                title="Single Test Story",
-                url="https://example.com/story-1",
-                rank=1,
-                points=100,
-                author="author1",
-                comments_count=5,
-                scraped_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-                created_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-            )
-        ]
-        completed_run_single = ScrapeRun(
-            **{**mock_completed_scrape_run.model_dump(), "stories_scraped": 1}
+        updates: list[_RunUpdate] = []
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            stories=_make_stories(top_n),
+            upserted_count=top_n,
+            update=_recording_update(updates, completed_run),
         )
-        activity_mocks = _create_activity_mocks(
-            mock_scrape_run, completed_run_single, single_story, upserted_count=1
+
+        # Act
+        result = await _run_workflow(
+            workflow_env,
+            activity_mocks,
+            top_n=top_n,
+            workflow_id=f"test-workflow-top-n-{top_n}",
         )
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act
-                result = await env.client.execute_workflow(
-                    ScrapeHackerNewsWorkflow.run,
-                    args=[1],  # top_n=1
-                    id="test-workflow-min-top-n",
-                    task_queue="test-task-queue",
-                )
-
-                # Assert
-                assert result.status == ScrapeRunStatus.COMPLETED
-                assert result.stories_scraped == 1
-
-    @pytest.mark.asyncio
-    async def test_workflow_with_maximum_top_n(
+        # Assert
+        assert isinstance(result, ScrapeRun)
+        assert result.status == ScrapeRunStatus.COMPLETED
+        assert result.stories_scraped == top_n
+        assert result.error_message is None
+        assert result.finished_at is not None
+        assert updates == [(ScrapeRunStatus.COMPLETED.value, top_n, None)]
+
+    async def test_stories_scraped_sums_per_page_upserts(
         self,
+        workflow_env: WorkflowEnvironment,
         mock_scrape_run: ScrapeRun,
         mock_completed_scrape_run: ScrapeRun,
     ):
-        """Verify workflow handles top_n=100 correctly."""
-        # Arrange
-        many_stories = [
-            Story(
-                id=uuid.uuid4(),
-                hn_id=f"story-{i}",
-                title=f"Test Story {i}",
-                url=f"https://example.com/story-{i}",
-                rank=i,
-                points=100 + i,
-                author=f"author{i}",
-                comments_count=i,
-                scraped_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-                created_at=datetime(2026, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-            )
-            for i in range(1, 101)  # 100 stories
-        ]
-        completed_run_many = ScrapeRun(
-            **{**mock_completed_scrape_run.model_dump(), "stories_scraped": 100}
+        """stories_scraped is the total of the per-page upsert counts."""
+        # Arrange: two full pages; each upsert reports one row fewer than sent.
+        stories = _make_stories(60)
+        upsert_batches: list[int] = []
+        updates: list[_RunUpdate] = []
+
+        async def upsert(stories_data: list[dict[str, Any]]) -> int:
+            upsert_batches.append(len(stories_data))
+            return len(stories_data) - 1
+
+        pages = _FakePages([stories[:30], stories[30:]])
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            next_page=pages.next_page,
+            scrape=pages.scrape,
+            upsert=upsert,
+            update=_recording_update(updates, mock_completed_scrape_run),
         )
-        activity_mocks = _create_activity_mocks(
-            mock_scrape_run, completed_run_many, many_stories, upserted_count=100
+
+        # Act
+        await _run_workflow(
+            workflow_env,
+            activity_mocks,
+            top_n=60,
+            workflow_id="test-workflow-per-page-upserts",
         )
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act
-                result = await env.client.execute_workflow(
-                    ScrapeHackerNewsWorkflow.run,
-                    args=[100],  # top_n=100
-                    id="test-workflow-max-top-n",
-                    task_queue="test-task-queue",
-                )
-
-                # Assert
-                assert result.status == ScrapeRunStatus.COMPLETED
-                assert result.stories_scraped == 100
+        # Assert
+        assert upsert_batches == [30, 30]
+        assert updates == [(ScrapeRunStatus.COMPLETED.value, 58, None)]
 
 
 # ---------------------------------------------------------------------------
@@ -317,117 +469,41 @@ class TestWorkflowHappyPath:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestWorkflowFailureHandling:
     """Test workflow behavior when activities fail."""
 
-    @pytest.mark.asyncio
-    async def test_failure_before_run_creation(self):
+    async def test_failure_before_run_creation(self, workflow_env: WorkflowEnvironment):
         """Verify workflow fails without updating run status if create_scrape_run fails."""
         # Arrange
-        @activity.defn(name="create_scrape_run_activity")
-        async def create_scrape_run_activity_failing(workflow_id: str) -> dict[str, Any]:
-            """Mock activity that raises an exception."""
+        async def create(workflow_id: str) -> dict[str, Any]:
             raise RuntimeError("Database connection failed")
 
-        # Other activities won't be called, but need to be defined
-        @activity.defn(name="start_playwright_activity")
-        async def start_playwright_activity() -> None:
-            pass
-
-        @activity.defn(name="navigate_to_hacker_news_activity")
-        async def navigate_to_hacker_news_activity() -> None:
-            pass
-
-        @activity.defn(name="navigate_to_next_page_activity")
-        async def navigate_to_next_page_activity(page_number: int) -> bool:
-            return True
+        activity_mocks = _build_activity_mocks(create=create)
 
-        @activity.defn(name="scrape_urls_activity")
-        async def scrape_urls_activity(top_n: int) -> list[dict[str, Any]]:
-            return []
-
-        @activity.defn(name="upsert_stories_activity")
-        async def upsert_stories_activity(stories_data: list[dict[str, Any]]) -> int:
-            return 0
-
-        @activity.defn(name="update_scrape_run_activity")
-        async def update_scrape_run_activity(
-            run_id: uuid.UUID,
-            status: str,
-            stories_scraped: int | None,
-            error_message: str | None,
-        ) -> dict[str, Any]:
-            return {}
-
-        activity_mocks = [
-            create_scrape_run_activity_failing,
-            start_playwright_activity,
-            navigate_to_hacker_news_activity,
-            navigate_to_next_page_activity,
-            scrape_urls_activity,
-            upsert_stories_activity,
-            update_scrape_run_activity,
-        ]
+        # Act & Assert
+        with pytest.raises(WorkflowFailureError):
+            await _run_workflow(
+                workflow_env,
+                activity_mocks,
+                top_n=30,
+                workflow_id="test-workflow-early-failure",
+            )
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act & Assert
-                with pytest.raises(WorkflowFailureError) as exc_info:
-                    await env.client.execute_workflow(
-                        ScrapeHackerNewsWorkflow.run,
-                        args=[30],
-                        id="test-workflow-early-failure",
-                        task_queue="test-task-queue",
-                    )
-
-                # Verify the workflow failed (error details are in Temporal's cause chain)
-                assert exc_info.value is not None
-
-    @pytest.mark.asyncio
     async def test_failure_after_run_creation_updates_status(
         self,
+        workflow_env: WorkflowEnvironment,
         mock_scrape_run: ScrapeRun,
-        mock_failed_scrape_run: ScrapeRun,
+        mock_failed_scrape_run_dump: dict[str, Any],
     ):
         """Verify workflow updates run to FAILED when browser activity fails."""
         # Arrange
         update_called = {"called": False, "status": None, "error_message": None}
 
-        @activity.defn(name="create_scrape_run_activity")
-        async def create_scrape_run_activity(workflow_id: str) -> dict[str, Any]:
-            return mock_scrape_run.model_dump()
-
-        @activity.defn(name="start_playwright_activity")
-        async def start_playwright_activity() -> None:
-            pass
-
-        @activity.defn(name="navigate_to_hacker_news_activity")
-        async def navigate_to_hacker_news_activity() -> None:
-            """Mock activity that fails."""
+        async def navigate() -> None:
             raise RuntimeError("Browser navigation failed")
 
-        @activity.defn(name="navigate_to_next_page_activity")
-        async def navigate_to_next_page_activity(page_number: int) -> bool:
-            # Won't be called
-            return True
-
-        @activity.defn(name="scrape_urls_activity")
-        async def scrape_urls_activity(top_n: int) -> list[dict[str, Any]]:
-            # Won't be called
-            return []
-
-        @activity.defn(name="upsert_stories_activity")
-        async def upsert_stories_activity(stories_data: list[dict[str, Any]]) -> int:
-            # Won't be called
-            return 0
-
-        @activity.defn(name="update_scrape_run_activity")
-        async def update_scrape_run_activity(
+        async def update(
             run_id: uuid.UUID,
             status: str,
             stories_scraped: int | None,
@@ -437,47 +513,31 @@ class TestWorkflowFailureHandling:
             update_called["called"] = True
             update_called["status"] = status
             update_called["error_message"] = error_message
-            return mock_failed_scrape_run.model_dump()
-
-        activity_mocks = [
-            create_scrape_run_activity,
-            start_playwright_activity,
-            navigate_to_hacker_news_activity,
-            navigate_to_next_page_activity,
-            scrape_urls_activity,
-            upsert_stories_activity,
-            update_scrape_run_activity,
-        ]
+            return mock_failed_scrape_run_dump
+
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run, navigate=navigate, update=update
+        )
+
+        # Act & Assert
+        with pytest.raises(WorkflowFailureError):
+            await _run_workflow(
+                workflow_env,
+                activity_mocks,
+                top_n=30,
+                workflow_id="test-workflow-mid-failure",
+            )
+
+        # Verify update_scrape_run_activity was called with FAILED status
+        assert update_called["called"] is True
+        assert update_called["status"] == ScrapeRunStatus.FAILED.value
+        # Error message should be set (contains activity error details)
+        assert update_called["error_message"] is not None
+        assert len(update_called["error_message"]) > 0
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act & Assert
-                with pytest.raises(WorkflowFailureError) as exc_info:
-                    await env.client.execute_workflow(
-                        ScrapeHackerNewsWorkflow.run,
-                        args=[30],
-                        id="test-workflow-mid-failure",
-                        task_queue="test-task-queue",
-                    )
-
-                # Verify the workflow failed
-                assert exc_info.value is not None
-
-                # Verify update_scrape_run_activity was called with FAILED status
-                assert update_called["called"] is True
-                assert update_called["status"] == ScrapeRunStatus.FAILED.value
-                # Error message should be set (contains activity error details)
-                assert update_called["error_message"] is not None
-                assert len(update_called["error_message"]) > 0
-
-    @pytest.mark.asyncio
     async def test_failure_in_scrape_activity_updates_status(
         self,
+        workflow_env: WorkflowEnvironment,
         mock_scrape_run: ScrapeRun,
         mock_failed_scrape_run: ScrapeRun,
     ):
@@ -485,35 +545,10 @@ class TestWorkflowFailureHandling:
         # Arrange
         update_called = {"called": False, "status": None}
 
-        @activity.defn(name="create_scrape_run_activity")
-        async def create_scrape_run_activity(workflow_id: str) -> dict[str, Any]:
-            return mock_scrape_run.model_dump()
-
-        @activity.defn(name="start_playwright_activity")
-        async def start_playwright_activity() -> None:
-            pass
-
-        @activity.defn(name="navigate_to_hacker_news_activity")
-        async def navigate_to_hacker_news_activity() -> None:
-            pass
-
-        @activity.defn(name="navigate_to_next_page_activity")
-        async def navigate_to_next_page_activity(page_number: int) -> bool:
-            # Won't be called
-            return True
-
-        @activity.defn(name="scrape_urls_activity")
-        async def scrape_urls_activity(top_n: int) -> list[dict[str, Any]]:
-            """Mock activity that fails during scraping."""
+        async def scrape(top_n: int) -> list[dict[str, Any]]:
             raise RuntimeError("Failed to parse story elements")
 
-        @activity.defn(name="upsert_stories_activity")
-        async def upsert_stories_activity(stories_data: list[dict[str, Any]]) -> int:
-            # Won't be called
-            return 0
-
-        @activity.defn(name="update_scrape_run_activity")
-        async def update_scrape_run_activity(
+        async def update(
             run_id: uuid.UUID,
             status: str,
             stories_scraped: int | None,
@@ -522,43 +557,76 @@ class TestWorkflowFailureHandling:
             """Capture the update call."""
             update_called["called"] = True
             update_called["status"] = status
-            failed_run = ScrapeRun(
-                **{
-                    **mock_failed_scrape_run.model_dump(),
-                    "error_message": "Failed to parse story elements",
-                }
+            failed_run = mock_failed_scrape_run.model_copy(
+                update={"error_message": "Failed to parse story elements"}
             )
             return failed_run.model_dump()
 
-        activity_mocks = [
-            create_scrape_run_activity,
-            start_playwright_activity,
-            navigate_to_hacker_news_activity,
-            navigate_to_next_page_activity,
-            scrape_urls_activity,
-            upsert_stories_activity,
-            update_scrape_run_activity,
-        ]
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run, scrape=scrape, update=update
+        )
+
+        # Act & Assert
+        with pytest.raises(WorkflowFailureError):
+            await _run_workflow(
+                workflow_env,
+                activity_mocks,
+                top_n=30,
+                workflow_id="test-workflow-scrape-failure",
+            )
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act & Assert
-                with pytest.raises(WorkflowFailureError):
-                    await env.client.execute_workflow(
-                        ScrapeHackerNewsWorkflow.run,
-                        args=[30],
-                        id="test-workflow-scrape-failure",
-                        task_queue="test-task-queue",
-                    )
-
-                # Verify update was called with FAILED status
-                assert update_called["called"] is True
-                assert update_called["status"] == ScrapeRunStatus.FAILED.value
+        # Verify update was called with FAILED status
+        assert update_called["called"] is True
+        assert update_called["status"] == ScrapeRunStatus.FAILED.value
+
+    async def test_comment_write_after_failed_batches_is_salvaged(
+        self,
+        workflow_env: WorkflowEnvironment,
+        mock_scrape_run: ScrapeRun,
+        mock_failed_scrape_run: ScrapeRun,
+    ):
+        """When the batched comment writes fail, every comment is re-sent once."""
+        # Arrange: 15 stories, one comment scrape fails, and every batch
+        # write (at most COMMENT_FLUSH_BATCH_SIZE entries) fails too.
+        stories = _make_stories(15)
+        written: list[dict[str, str | None]] = []
+        updates: list[_RunUpdate] = []
+
+        async def comment(hn_id: str) -> str | None:
+            if hn_id == "story-7":
+                raise RuntimeError("comment page timed out")
+            return _comment_for(hn_id)
+
+        async def update_comments(comment_map: dict[str, str | None]) -> int:
+            if len(comment_map) <= COMMENT_FLUSH_BATCH_SIZE:
+                raise ApplicationError("database unavailable", non_retryable=True)
+            written.append(comment_map)
+            return len(comment_map)
+
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            stories=stories,
+            upserted_count=15,
+            comment=comment,
+            update_comments=update_comments,
+            update=_recording_update(updates, mock_failed_scrape_run),
+        )
+
+        # Act & Assert
+        with pytest.raises(WorkflowFailureError):
+            await _run_workflow(
+                workflow_env,
+                activity_mocks,
+                top_n=15,
+                workflow_id="test-workflow-comment-salvage",
+            )
+
+        expected = {story.hn_id: _comment_for(story.hn_id) for story in stories}
+        expected["story-7"] = None
+        assert written == [expected]
+        assert [(status, scraped) for status, scraped, _ in updates] == [
+            (ScrapeRunStatus.FAILED.value, 15)
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -566,78 +634,191 @@ class TestWorkflowFailureHandling:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestWorkflowEdgeCases:
     """Test boundary conditions and special scenarios."""
 
-    @pytest.mark.asyncio
     async def test_empty_stories_list(
         self,
+        workflow_env: WorkflowEnvironment,
         mock_scrape_run: ScrapeRun,
         mock_completed_scrape_run: ScrapeRun,
     ):
         """Verify workflow handles empty stories list gracefully."""
         # Arrange
         empty_stories: list[Story] = []
-        completed_run_empty = ScrapeRun(
-            **{**mock_completed_scrape_run.model_dump(), "stories_scraped": 0}
+        completed_run_empty = mock_completed_scrape_run.model_copy(
+            update={"stories_scraped": 0}
+        )
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            completed_run=completed_run_empty,
+            stories=empty_stories,
+            upserted_count=0,
         )
-        activity_mocks = _create_activity_mocks(
-            mock_scrape_run, completed_run_empty, empty_stories, upserted_count=0
+
+        # Act
+        result = await _run_workflow(
+            workflow_env,
+            activity_mocks,
+            top_n=30,
+            workflow_id="test-workflow-empty-stories",
         )
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act
-                result = await env.client.execute_workflow(
-                    ScrapeHackerNewsWorkflow.run,
-                    args=[30],
-                    id="test-workflow-empty-stories",
-                    task_queue="test-task-queue",
-                )
-
-                # Assert
-                assert result.status == ScrapeRunStatus.COMPLETED
-                assert result.stories_scraped == 0
-
-    @pytest.mark.asyncio
+        # Assert
+        assert result.status == ScrapeRunStatus.COMPLETED
+        assert result.stories_scraped == 0
+
     async def test_upsert_count_differs_from_scraped_count(
         self,
+        workflow_env: WorkflowEnvironment,
         mock_scrape_run: ScrapeRun,
         mock_completed_scrape_run: ScrapeRun,
         mock_stories: list[Story],
     ):
         """Verify workflow records actual upserted count (may differ due to deduplication)."""
         # Arrange: scrape 30 stories but only 25 are new (5 duplicates)
-        completed_run_partial = ScrapeRun(
-            **{**mock_completed_scrape_run.model_dump(), "stories_scraped": 25}
+        completed_run_partial = mock_completed_scrape_run.model_copy(
+            update={"stories_scraped": 25}
         )
-        activity_mocks = _create_activity_mocks(
-            mock_scrape_run,
-            completed_run_partial,
-            mock_stories,
+        updates: list[_RunUpdate] = []
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            stories=mock_stories,
             upserted_count=25,  # Simulates 5 duplicates
+            update=_recording_update(updates, completed_run_partial),
+        )
+
+        # Act
+        result = await _run_workflow(
+            workflow_env, activity_mocks, top_n=30, workflow_id="test-workflow-dedup"
+        )
+
+        # Assert: workflow records the upserted count, not scraped count
+        assert result.status == ScrapeRunStatus.COMPLETED
+        assert updates == [(ScrapeRunStatus.COMPLETED.value, 25, None)]
+
+    async def test_comments_are_written_in_batches(
+        self,
+        workflow_env: WorkflowEnvironment,
+        mock_scrape_run: ScrapeRun,
+        mock_completed_scrape_run: ScrapeRun,
+    ):
+        """Comments are written in batches of COMMENT_FLUSH_BATCH_SIZE plus the rest."""
+        # Arrange
+        stories = _make_stories(25)
+        written: list[dict[str, str | None]] = []
+
+        async def update_comments(comment_map: dict[str, str | None]) -> int:
+            written.append(comment_map)
+            return len(comment_map)
+
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            completed_run=mock_completed_scrape_run,
+            stories=stories,
+            upserted_count=25,
+            update_comments=update_comments,
+        )
+
+        # Act
+        await _run_workflow(
+            workflow_env,
+            activity_mocks,
+            top_n=25,
+            workflow_id="test-workflow-comment-batches",
+        )
+
+        # Assert: the batches run concurrently, so compare them unordered.
+        batches = [stories[:10], stories[10:20], stories[20:]]
+        expected = [
+            {story.hn_id: _comment_for(story.hn_id) for story in batch}
+            for batch in batches
+        ]
+        assert len(written) == len(expected)
+        assert all(batch in written for batch in expected)
+
+    @pytest.mark.parametrize(
+        ("repeated", "expected_requests"),
+        [
+            # One repeat: the dedup margin on page 2 covers it.
+            (1, [35, 10]),
+            # More repeats than the margin: the rest of page 2 is read.
+            (6, [35, 10, 30]),
+            # A page 2 made only of repeats: page 3 fills the gap.
+            (30, [35, 10, 30, 10]),
+        ],
+    )
+    async def test_repeated_stories_are_refilled_to_top_n(
+        self,
+        repeated: int,
+        expected_requests: list[int],
+        workflow_env: WorkflowEnvironment,
+        mock_scrape_run: ScrapeRun,
+        mock_completed_scrape_run: ScrapeRun,
+    ):
+        """Stories HN repeats from page 1 on page 2 do not shrink the run."""
+        # Arrange: page 2 opens with stories already seen on page 1, pushing
+        # the rest of the ranking back.
+        stories = _make_stories(90)
+        page_2 = stories[30 - repeated : 30] + stories[30 : 60 - repeated]
+        pages = _FakePages([stories[:30], page_2, stories[60 - repeated :]])
+        upserted: list[str] = []
+        updates: list[_RunUpdate] = []
+
+        async def upsert(stories_data: list[dict[str, Any]]) -> int:
+            upserted.extend(story["hn_id"] for story in stories_data)
+            return len(stories_data)
+
+        activity_mocks = _build_activity_mocks(
+            scrape_run=mock_scrape_run,
+            next_page=pages.next_page,
+            scrape=pages.scrape,
+            upsert=upsert,
+            update=_recording_update(updates, mock_completed_scrape_run),
+        )
+
+        # Act
+        await _run_workflow(
+            workflow_env,
+            activity_mocks,
+            top_n=35,
+            workflow_id=f"test-workflow-repeated-{repeated}",
+        )
+
+        # Assert
+        assert pages.requested == expected_requests
+        assert upserted == [story.hn_id for story in stories[:35]]
+        assert updates == [(ScrapeRunStatus.COMPLETED.value, 35, None)]
+
+
+# ---------------------------------------------------------------------------
+# Test Cases: Story Deduplication
+# ---------------------------------------------------------------------------
+
+
+class TestAddNewStories:
+    """Unit tests for ScrapeHackerNewsWorkflow._add_new_stories (no Temporal env)."""
+
+    def test_skips_hn_ids_already_seen(self, mock_stories: list[Story]) -> None:
+        """A story repeated on a later page is neither re-added nor returned."""
+        all_stories: dict[str, Story] = {}
+        ScrapeHackerNewsWorkflow._add_new_stories(all_stories, mock_stories[:3], 10)
+
+        added = ScrapeHackerNewsWorkflow._add_new_stories(
+            all_stories, mock_stories[2:5], 10
+        )
+
+        assert [s.hn_id for s in added] == ["story-4", "story-5"]
+        assert list(all_stories) == [f"story-{i}" for i in range(1, 6)]
+
+    def test_stops_at_top_n(self, mock_stories: list[Story]) -> None:
+        """Stories beyond top_n are dropped."""
+        all_stories: dict[str, Story] = {}
+
+        added = ScrapeHackerNewsWorkflow._add_new_stories(
+            all_stories, mock_stories, 5
         )
 
-        async with await WorkflowEnvironment.start_time_skipping() as env:
-            async with Worker(
-                env.client,
-                task_queue="test-task-queue",
-                workflows=[ScrapeHackerNewsWorkflow],
-                activities=activity_mocks,
-            ):
-                # Act
-                result = await env.client.execute_workflow(
-                    ScrapeHackerNewsWorkflow.run,
-                    args=[30],
-                    id="test-workflow-dedup",
-                    task_queue="test-task-queue",
-                )
-
-                # Assert: workflow records the upserted count, not scraped count
-                assert result.status == ScrapeRunStatus.COMPLETED
-                assert result.stories_scraped == 25  # Actual upserted count
+        assert len(added) == 5
+        assert len(all_stories) == 5
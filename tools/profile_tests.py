@@ -0,0 +1,112 @@
+"""Profile the test suite's hot path.
+
+Invoked as:  python tools/profile_tests.py [PYTEST_TARGET ...]
+
+Not a test: a standalone helper for checking that fixture-scope and setup
+changes actually pay off. For the given targets (by default the workflow
+tests, whose runtime is dominated by Temporal test-server and Worker setup)
+it reports, in order:
+
+  1. Collection time (``pytest --collect-only``).
+  2. The slowest imports during collection (``python -X importtime``), with
+     ``--importtime``.
+  3. A cProfile of the full run, sorted by cumulative time. The raw profile
+     is written to ``--out`` for further digging (e.g. with snakeviz). Test
+     modules are already imported by step 1, so this shows fixture setup and
+     test execution rather than import cost.
+
+Extra pytest options go after ``--``:
+
+    python tools/profile_tests.py tests/unit -- -k Story
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import pstats
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+DEFAULT_TARGETS = ["tests/workflows/test_scraper_workflow.py"]
+DEFAULT_OUT = Path("test-profile.prof")
+
+
+def _time_collection(targets: list[str], pytest_args: list[str]) -> float:
+    """Return the wall-clock seconds pytest spends collecting ``targets``."""
+    started = time.perf_counter()
+    pytest.main(["--collect-only", "-qq", *pytest_args, *targets])
+    return time.perf_counter() - started
+
+
+def _print_import_times(targets: list[str], top: int) -> None:
+    """Print the ``top`` slowest cumulative imports seen during collection.
+
+    ``-X importtime`` only reports for a fresh interpreter, so collection is
+    re-run in a subprocess and its stderr parsed.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            *targets,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    rows: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((int(cumulative), name.rstrip()))
+
+    print(f"\nSlowest {top} imports (cumulative µs):")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative:>12}  {name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--top", type=int, default=40, help="rows to print")
+    parser.add_argument(
+        "--importtime", action="store_true", help="also report slowest imports"
+    )
+    argv = sys.argv[1:]
+    pytest_args: list[str] = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, pytest_args = argv[:split], argv[split + 1 :]
+    args = parser.parse_args(argv)
+
+    collect_seconds = _time_collection(args.targets, pytest_args)
+
+    if args.importtime:
+        _print_import_times(args.targets, args.top)
+
+    profiler = cProfile.Profile()
+    exit_code = profiler.runcall(pytest.main, ["-q", *pytest_args, *args.targets])
+    profiler.dump_stats(args.out)
+
+    print(f"\nCollection: {collect_seconds:.2f}s")
+    print(f"Profile written to {args.out}\n")
+    pstats.Stats(str(args.out)).sort_stats("cumulative").print_stats(args.top)
+
+    return int(exit_code)
+
+
+if __name__ == "__main__":
+    sys.exit(main())